@@ -0,0 +1,113 @@
+"""
+Benchmark for approximate tool search against exact search on large catalogs.
+
+Builds synthetic catalogs whose embeddings are clustered around topics (like
+real tool descriptions, which group by domain), then compares exact search over
+every row with the IVF index used by ``ToolSearchEngine`` above
+``ann_min_tools``, sweeping the number of probed clusters. Recall@k is the
+fraction of the exact top-k that the approximate search returns.
+
+Usage:
+    python benchmarks/ann_search.py --sizes 10000 50000 100000 --queries 200
+"""
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+
+from mcp_router_use.ann_index import IVFIndex
+
+DIMENSIONS = 384  # bge-small-en-v1.5
+TOOLS_PER_TOPIC = 50
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def make_catalog(
+    num_tools: int, num_queries: int, noise: float, rng: np.random.Generator
+) -> tuple[np.ndarray, np.ndarray]:
+    """Create unit-norm tool embeddings around random topics, and queries near random tools."""
+    topics = rng.standard_normal((max(1, num_tools // TOOLS_PER_TOPIC), DIMENSIONS))
+    tool_topics = rng.integers(len(topics), size=num_tools)
+    tools = normalize(topics[tool_topics] + noise * rng.standard_normal((num_tools, DIMENSIONS)))
+    targets = tools[rng.integers(num_tools, size=num_queries)]
+    queries = normalize(targets + noise * rng.standard_normal((num_queries, DIMENSIONS)))
+    return tools.astype(np.float32), queries.astype(np.float32)
+
+
+def exact_search(matrix: np.ndarray, query: np.ndarray, top_k: int) -> np.ndarray:
+    """Rank every row, as ToolSearchEngine does below ann_min_tools."""
+    scores = matrix @ query
+    top = np.argpartition(scores, len(scores) - top_k)[len(scores) - top_k :]
+    return top[np.argsort(scores[top])[::-1]]
+
+
+def measure(search, queries: np.ndarray) -> tuple[list[float], list[np.ndarray]]:
+    """Time one search per query in milliseconds and collect the returned rows."""
+    timings, results = [], []
+    for query in queries:
+        start = time.perf_counter()
+        results.append(search(query))
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings, results
+
+
+def report(label: str, timings: list[float], recall: float | None = None) -> None:
+    line = (
+        f"  {label:<14} mean {statistics.mean(timings):8.3f} ms   "
+        f"p99 {np.percentile(timings, 99):8.3f} ms"
+    )
+    if recall is not None:
+        line += f"   recall {recall:6.3f}"
+    print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000, 100000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--probes", type=int, nargs="+", default=[4, 8, 16, 32])
+    parser.add_argument("--noise", type=float, default=0.08, help="Spread of tools around topics")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    for size in args.sizes:
+        matrix, queries = make_catalog(size, args.queries, args.noise, rng)
+
+        start = time.perf_counter()
+        index = IVFIndex(matrix)
+        build_seconds = time.perf_counter() - start
+        print(
+            f"{size} tools, top_k={args.top_k}, {args.queries} queries, "
+            f"{index.n_lists} clusters (built in {build_seconds:.2f} s)"
+        )
+
+        exact_timings, exact_results = measure(
+            lambda query, matrix=matrix: exact_search(matrix, query, args.top_k), queries
+        )
+        report("exact", exact_timings)
+        for n_probe in [*args.probes, None]:
+            index.n_probe = min(n_probe or max(8, -(-index.n_lists // 10)), index.n_lists)
+
+            def ivf_search(
+                query: np.ndarray, index: IVFIndex = index, matrix: np.ndarray = matrix
+            ) -> np.ndarray:
+                return index.search(matrix, query, args.top_k)[0]
+
+            timings, results = measure(ivf_search, queries)
+            recall = statistics.mean(
+                len(set(found) & set(expected)) / args.top_k
+                for found, expected in zip(results, exact_results, strict=True)
+            )
+            label = f"ivf probe {index.n_probe}" + (" *" if n_probe is None else "")
+            report(label, timings, recall)
+        print("  (* default n_probe)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Benchmark comparing tool search embedding backends.
+
+Builds a synthetic catalog of tools ("<verb> <object> in <domain>") and, for
+each backend, measures startup time (model load and first embedding), the time
+to index the catalog, per-query search latency, and ranking quality as
+precision@k over two query sets: queries using the catalog's wording
+("delete files") and paraphrases using synonyms ("remove files"). Quality is
+reported for the semantic ranking alone and for the hybrid ranking that
+``ToolSearchEngine`` returns (semantic fused with BM25). Backends that cannot be
+loaded, e.g. fastembed without network access to download its model, are
+reported as unavailable.
+
+Usage:
+    python benchmarks/embedding_backends.py --backends hashing fastembed --domains 8
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from types import SimpleNamespace
+
+from mcp_router_use.managers.tools.search_tools import ToolSearchEngine
+
+VERBS = {
+    "read": ["get", "fetch", "load"],
+    "write": ["save", "store", "put"],
+    "delete": ["remove", "erase", "drop"],
+    "list": ["enumerate", "show all", "browse"],
+    "search": ["find", "look up", "query"],
+    "create": ["make", "add", "new"],
+    "update": ["modify", "edit", "change"],
+    "move": ["relocate", "transfer", "rename"],
+    "share": ["publish", "send", "distribute"],
+    "archive": ["backup", "preserve", "compress"],
+}
+OBJECTS = [
+    ("file", "files"),
+    ("directory", "directories"),
+    ("issue", "issues"),
+    ("pull request", "pull requests"),
+    ("email", "emails"),
+    ("calendar event", "calendar events"),
+    ("database row", "database rows"),
+    ("image", "images"),
+    ("spreadsheet", "spreadsheets"),
+    ("user", "users"),
+    ("comment", "comments"),
+    ("webhook", "webhooks"),
+]
+BASE_DOMAINS = ["github", "gitlab", "local disk", "s3", "google drive", "dropbox", "jira", "slack"]
+
+
+def make_catalog(num_domains: int) -> tuple[dict, list, list]:
+    """Create server tools plus wording and paraphrase queries with their relevant tools."""
+    domains = [
+        BASE_DOMAINS[i] if i < len(BASE_DOMAINS) else f"service {i}" for i in range(num_domains)
+    ]
+    server_tools = {}
+    for domain in domains:
+        server_tools[domain] = [
+            SimpleNamespace(
+                name=f"{domain}_{verb}_{singular}".replace(" ", "_"),
+                description=f"{verb.capitalize()} a {singular} in {domain}",
+            )
+            for verb in VERBS
+            for singular, _ in OBJECTS
+        ]
+
+    wording, paraphrases = [], []
+    for verb, synonyms in VERBS.items():
+        for singular, plural in OBJECTS:
+            relevant = {f"{domain}_{verb}_{singular}".replace(" ", "_") for domain in domains}
+            wording.append((f"{verb} {plural}", relevant))
+            paraphrases.extend((f"{synonym} {plural}", relevant) for synonym in synonyms)
+    return server_tools, wording, paraphrases
+
+
+def precision(results: list[str], relevant: set[str], top_k: int) -> float:
+    return len(set(results[:top_k]) & relevant) / top_k
+
+
+async def run_backend(backend: str, args: argparse.Namespace) -> None:
+    server_tools, wording, paraphrases = make_catalog(args.domains)
+    engine = ToolSearchEngine(use_caching=False, embedding_backend=backend)
+
+    start = time.perf_counter()
+    loaded = await engine._run_in_executor(engine._load_model)
+    if loaded:
+        await engine._run_in_executor(engine.embedding_function, ["warm up"])
+    startup = time.perf_counter() - start
+    if not loaded:
+        print(f"  {backend:<10} unavailable: {engine._model_error}")
+        engine.close()
+        return
+
+    start = time.perf_counter()
+    await engine.index_tools(server_tools)
+    index_seconds = time.perf_counter() - start
+
+    scores: dict[str, list[float]] = {}
+    timings = []
+    for label, queries in (("wording", wording), ("paraphrase", paraphrases)):
+        for query, relevant in queries:
+            begin = time.perf_counter()
+            hybrid = await engine.asearch(query, top_k=args.top_k)
+            timings.append((time.perf_counter() - begin) * 1000)
+
+            query_vector = engine._query_vector(query, engine.embedding_function([query])[0])
+            semantic = engine._rank((query, None), query_vector, args.top_k)
+
+            scores.setdefault(f"{label} semantic", []).append(
+                precision([tool.name for tool, _, _ in semantic], relevant, args.top_k)
+            )
+            scores.setdefault(f"{label} hybrid", []).append(
+                precision([tool.name for tool, _, _ in hybrid], relevant, args.top_k)
+            )
+    engine.close()
+
+    quality = "   ".join(f"{name} {statistics.mean(values):.3f}" for name, values in scores.items())
+    print(
+        f"  {backend:<10} startup {startup:7.3f} s   index {index_seconds:7.3f} s   "
+        f"query mean {statistics.mean(timings):7.3f} ms"
+    )
+    print(f"  {'':<10} P@{args.top_k}: {quality}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", nargs="+", default=["hashing", "fastembed"])
+    parser.add_argument("--domains", type=int, default=8)
+    parser.add_argument("--top-k", type=int, default=5)
+    args = parser.parse_args()
+
+    num_tools = args.domains * len(VERBS) * len(OBJECTS)
+    print(f"{num_tools} tools in {args.domains} domains, top_k={args.top_k}")
+    for backend in args.backends:
+        asyncio.run(run_backend(backend, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark for event loop responsiveness while ToolSearchEngine embeds tools.
+
+Runs a heartbeat task that wakes up every millisecond and records how late each
+wake-up is, while the engine loads its model, indexes a synthetic catalog and
+answers queries. Compares the previous behaviour (embedding inline on the event
+loop) with the engine's executor-based embedding.
+
+The ``simulated`` backend replaces the model with a blocking call that sleeps
+for ``--ms-per-text`` per text (like ONNX inference, it releases the GIL), so
+the benchmark runs without downloading a model. The ``fastembed`` backend uses
+the real model.
+
+Usage:
+    python benchmarks/embedding_event_loop_lag.py --backend simulated --tools 2000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from mcp_router_use.managers.tools.search_tools import ToolSearchEngine
+
+HEARTBEAT_INTERVAL = 0.001
+
+
+async def heartbeat(lags: list[float], stop: asyncio.Event) -> None:
+    """Record how late the event loop wakes this task up, in milliseconds."""
+    while not stop.is_set():
+        expected = time.perf_counter() + HEARTBEAT_INTERVAL
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        lags.append(max(0.0, time.perf_counter() - expected) * 1000)
+
+
+def make_engine(backend: str, ms_per_text: float, workers: int) -> ToolSearchEngine:
+    engine = ToolSearchEngine(use_caching=False, embedding_workers=workers)
+    if backend == "simulated":
+        rng = np.random.default_rng(0)
+
+        def embed(texts):
+            time.sleep(len(texts) * ms_per_text / 1000)
+            return list(rng.standard_normal((len(texts), 384), dtype=np.float32))
+
+        def load_model():
+            if engine.model is not None:
+                return True
+            time.sleep(0.5)  # Stand-in for loading the ONNX model
+            engine.model = object()
+            engine.embedding_function = embed
+            return True
+
+        engine._load_model = load_model
+    return engine
+
+
+async def index_and_search(
+    engine: ToolSearchEngine, server_tools: dict, queries: list[str]
+) -> None:
+    """Index the catalog and answer the queries."""
+    await engine.index_tools(server_tools)
+    for query in queries:
+        await engine.asearch(query, top_k=10)
+
+
+async def run(mode: str, args: argparse.Namespace) -> list[float]:
+    tools = [
+        SimpleNamespace(name=f"tool_{i}", description=f"Synthetic tool number {i}")
+        for i in range(args.tools)
+    ]
+    queries = [f"query {i}" for i in range(args.queries)]
+    engine = make_engine(args.backend, args.ms_per_text, args.workers)
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(heartbeat(lags, stop))
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    if mode == "inline":
+        # Replicate the previous behaviour: model work runs directly on the event loop
+        async def run_inline(function, *call_args):
+            return function(*call_args)
+
+        engine._run_in_executor = run_inline
+    await index_and_search(engine, {"synthetic": tools}, queries)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker
+    engine.close()
+
+    print(
+        f"  {mode:<10} wall {elapsed:7.2f} s   lag p50 {statistics.median(lags):8.2f} ms   "
+        f"p99 {np.percentile(lags, 99):8.2f} ms   max {max(lags):8.2f} ms   "
+        f"heartbeats {len(lags)}"
+    )
+    return lags
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backend", choices=["simulated", "fastembed"], default="simulated")
+    parser.add_argument("--tools", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--ms-per-text", type=float, default=0.5)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{args.tools} tools, {args.queries} queries, backend={args.backend}")
+    for mode in ("inline", "executor"):
+        asyncio.run(run(mode, args))
+
+
+if __name__ == "__main__":
+    main()
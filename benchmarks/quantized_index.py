@@ -0,0 +1,78 @@
+"""
+Benchmark for the memory footprint and recall of quantized tool search indexes.
+
+Indexes synthetic catalogs of clustered embeddings (see ann_search.py) with
+``ToolSearchEngine`` storing embeddings as float32, float16 and int8, and
+reports the index memory, the exact-search latency and recall@k against the
+float32 ranking. Approximate search is disabled so only quantization is measured.
+
+Usage:
+    python benchmarks/quantized_index.py --sizes 10000 100000 --queries 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from types import SimpleNamespace
+
+import numpy as np
+from ann_search import make_catalog
+
+from mcp_router_use.managers.tools.search_tools import ToolSearchEngine
+from mcp_router_use.quantization import EMBEDDING_DTYPES
+
+
+def build_engine(dtype: str, embeddings: np.ndarray) -> ToolSearchEngine:
+    """Index a synthetic catalog with precomputed embeddings."""
+    tools = [
+        SimpleNamespace(name=f"tool_{i}", description=f"Synthetic tool number {i}")
+        for i in range(len(embeddings))
+    ]
+    engine = ToolSearchEngine(use_caching=False, ann_min_tools=len(embeddings) + 1)
+    engine.embedding_dtype = dtype
+    engine.model = object()  # Skip loading the real model
+    engine.embedding_function = lambda texts: embeddings[: len(texts)]
+    asyncio.run(engine.index_tools({"synthetic": tools}))
+    engine.close()
+    return engine
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--noise", type=float, default=0.08, help="Spread of tools around topics")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    for size in args.sizes:
+        embeddings, queries = make_catalog(size, args.queries, args.noise, rng)
+        print(f"{size} tools, top_k={args.top_k}, {args.queries} queries")
+
+        expected = None
+        for dtype in EMBEDDING_DTYPES:
+            engine = build_engine(dtype, embeddings)
+            timings, rankings = [], []
+            for query in queries:
+                start = time.perf_counter()
+                ranking = engine._rank("query", query, args.top_k)
+                timings.append((time.perf_counter() - start) * 1000)
+                rankings.append({tool.name for tool, _, _ in ranking})
+            if expected is None:
+                expected = rankings
+            recall = statistics.mean(
+                len(found & wanted) / args.top_k
+                for found, wanted in zip(rankings, expected, strict=True)
+            )
+            usage = engine.memory_usage()
+            print(
+                f"  {dtype:<8} embeddings {usage['embeddings'] / 2**20:7.2f} MiB   "
+                f"rows {usage['rows'] / 2**20:6.2f} MiB   "
+                f"mean {statistics.mean(timings):7.3f} ms   recall {recall:6.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
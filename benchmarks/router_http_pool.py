@@ -0,0 +1,91 @@
+"""
+Benchmark for MCP Router REST calls with and without the pooled HTTP session.
+
+Starts a local stand-in for the MCP Router's ``/api/servers`` endpoints and
+measures per-call latency of ``MCPClient.get_router_servers``, comparing the old
+behaviour (a fresh ``aiohttp.ClientSession`` per call) with the client's pooled
+session.
+
+Usage:
+    python benchmarks/router_http_pool.py --calls 500
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import aiohttp
+from aiohttp import web
+
+from mcp_router_use import MCPClient
+
+
+def create_router_app(num_servers: int) -> web.Application:
+    """Create a minimal stand-in for the MCP Router REST API."""
+    servers = [
+        {"id": f"server-{i}", "name": f"server-{i}", "status": "online"}
+        for i in range(num_servers)
+    ]
+
+    async def list_servers(request: web.Request) -> web.Response:
+        return web.json_response(servers)
+
+    app = web.Application()
+    app.router.add_get("/api/servers", list_servers)
+    return app
+
+
+async def fresh_session_call(router_url: str) -> None:
+    """Replicate the previous behaviour: one new ClientSession per call."""
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f"{router_url}/api/servers", timeout=30) as response:
+            await response.json()
+
+
+def summarize(label: str, samples: list[float]) -> None:
+    """Print latency statistics in milliseconds."""
+    samples_ms = sorted(s * 1000 for s in samples)
+    p95 = samples_ms[int(len(samples_ms) * 0.95) - 1]
+    print(
+        f"{label:<24} mean={statistics.mean(samples_ms):7.3f}ms "
+        f"median={statistics.median(samples_ms):7.3f}ms p95={p95:7.3f}ms"
+    )
+
+
+async def main(calls: int, num_servers: int) -> None:
+    runner = web.AppRunner(create_router_app(num_servers))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    router_url = f"http://127.0.0.1:{port}"
+
+    try:
+        before = []
+        for _ in range(calls):
+            start = time.perf_counter()
+            await fresh_session_call(router_url)
+            before.append(time.perf_counter() - start)
+
+        after = []
+        async with MCPClient({"mcpRouter": {"router_url": router_url}}) as client:
+            for _ in range(calls):
+                start = time.perf_counter()
+                await client.get_router_servers()
+                after.append(time.perf_counter() - start)
+
+        print(f"{calls} calls against a stand-in router listing {num_servers} servers")
+        summarize("fresh session per call", before)
+        summarize("pooled session", after)
+        print(f"speedup (mean): {statistics.mean(before) / statistics.mean(after):.2f}x")
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--servers", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.servers))
@@ -0,0 +1,104 @@
+"""
+Benchmark for ToolSearchEngine similarity search over large tool catalogs.
+
+Indexes synthetic catalogs of random unit embeddings and measures the latency
+of ``ToolSearchEngine.search`` (excluding query embedding, which is served from
+a precomputed vector), comparing the previous per-tool Python loop with the
+vectorized matrix search.
+
+Usage:
+    python benchmarks/tool_search.py --sizes 1000 10000 100000 --queries 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from mcp_router_use.managers.tools.search_tools import ToolSearchEngine
+
+DIMENSIONS = 384  # bge-small-en-v1.5
+
+
+def build_engine(num_tools: int, rng: np.random.Generator) -> ToolSearchEngine:
+    """Index a synthetic catalog whose embeddings are random vectors."""
+    embeddings = rng.standard_normal((num_tools, DIMENSIONS), dtype=np.float32)
+    tools = [
+        SimpleNamespace(name=f"tool_{i}", description=f"Synthetic tool number {i}")
+        for i in range(num_tools)
+    ]
+
+    engine = ToolSearchEngine(use_caching=False)
+    engine.model = object()  # Skip loading the real model
+    engine.embedding_function = lambda texts: embeddings[: len(texts)]
+    asyncio.run(engine.index_tools({"synthetic": tools}))
+    return engine
+
+
+def loop_search(engine: ToolSearchEngine, query: np.ndarray, top_k: int) -> list:
+    """Replicate the previous search: a Python loop of cosine similarities and a full sort."""
+    scores = {}
+    for tool_name, embedding in zip(engine.tool_names, engine.embedding_matrix, strict=True):
+        similarity = np.dot(query, embedding) / (np.linalg.norm(query) * np.linalg.norm(embedding))
+        scores[tool_name] = float(similarity)
+    return sorted(scores.items(), key=lambda x: x[1], reverse=True)[:top_k]
+
+
+def measure(search, queries: list[np.ndarray]) -> list[float]:
+    """Time one search per query in milliseconds."""
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        search(query)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(label: str, timings: list[float]) -> None:
+    print(
+        f"  {label:<12} mean {statistics.mean(timings):9.3f} ms   "
+        f"p50 {statistics.median(timings):9.3f} ms   max {max(timings):9.3f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument(
+        "--loop-limit",
+        type=int,
+        default=10000,
+        help="Largest catalog to time the previous loop on (it is slow on big catalogs)",
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    for size in args.sizes:
+        engine = build_engine(size, rng)
+        queries = list(rng.standard_normal((args.queries, DIMENSIONS), dtype=np.float32))
+
+        def vectorized(query: np.ndarray, engine: ToolSearchEngine = engine) -> list:
+            engine.embedding_function = lambda texts: [query]
+            return engine.search("query", top_k=args.top_k)
+
+        print(f"{size} tools, top_k={args.top_k}, {args.queries} queries")
+        vectorized_timings = measure(vectorized, queries)
+        if size <= args.loop_limit:
+            loop_timings = measure(
+                lambda query, engine=engine: loop_search(engine, query, args.top_k), queries
+            )
+            report("loop", loop_timings)
+            report("vectorized", vectorized_timings)
+            speedup = statistics.mean(loop_timings) / statistics.mean(vectorized_timings)
+            print(f"  speedup      {speedup:.1f}x")
+        else:
+            report("vectorized", vectorized_timings)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,7 @@ from importlib.metadata import version
 from .agents.mcpagent import MCPAgent
 from .client import MCPClient
 from .config import load_config_file
-from .connectors import BaseConnector, HttpConnector
+from .connectors import BaseConnector, HttpConnector, PooledConnector
 from .logging import mcp_router_use_DEBUG, Logger, logger
 from .session import MCPSession
 
@@ -22,6 +22,7 @@ __all__ = [
     "MCPSession",
     "BaseConnector",
     "HttpConnector",
+    "PooledConnector",
     "load_config_file",
     "logger",
     "mcp_router_use_DEBUG",
@@ -65,7 +65,7 @@ class BaseAdapter(ABC):
             await client.create_all_sessions()
 
         # Get all active sessions
-        sessions = client.get_all_active_sessions()
+        sessions = await client.get_all_active_sessions()
 
         # Extract connectors from sessions
         connectors = [session.connector for session in sessions.values()]
@@ -156,7 +156,11 @@ class BaseAdapter(ABC):
         Returns:
             True if the connector is initialized and has tools, False otherwise.
         """
-        return hasattr(connector, "tools") and connector.tools
+        try:
+            return bool(connector.tools)
+        except RuntimeError:
+            # The connector hasn't been initialized yet
+            return False
 
     async def _ensure_connector_initialized(self, connector: BaseConnector) -> bool:
         """Ensure a connector is initialized.
@@ -170,7 +174,7 @@ class BaseAdapter(ABC):
         if not self._check_connector_initialized(connector):
             logger.debug("Connector doesn't have tools, initializing it")
             try:
-                await connector.initialize()
+                await connector.ensure_connected()
                 return True
             except Exception as e:
                 logger.error(f"Error initializing connector: {e}")
@@ -123,14 +123,19 @@ class MCPAgent:
             # Standard initialization - if using client, get or create sessions
             if self.client:
                 # First try to get existing sessions
-                self._sessions = self.client.get_all_active_sessions()
+                self._sessions = await self.client.get_all_active_sessions()
                 logger.info(f"🔌 Found {len(self._sessions)} existing sessions")
 
                 # If no active sessions exist, create new ones
                 if not self._sessions:
                     logger.info("🔄 No active sessions found, creating new ones...")
-                    self._sessions = await self.client.create_all_sessions()
-                    logger.info(f"✅ Created {len(self._sessions)} new sessions")
+                    batch = await self.client.create_all_sessions()
+                    self._sessions = batch.sessions
+                    logger.info(
+                        f"✅ Created {len(self._sessions)} new sessions in {batch.wall_time:.2f}s"
+                    )
+                    for server_name, error in batch.errors.items():
+                        logger.warning(f"⚠️ Could not connect to server '{server_name}': {error}")
 
                 # Create LangChain tools directly from the client using the adapter
                 self._tools = await self.adapter.create_tools(self.client)
@@ -516,6 +521,10 @@ class MCPAgent:
             if hasattr(self.adapter, "_connector_tool_map"):
                 self.adapter._connector_tool_map = {}
 
+            # Release the tool search model; the search index is kept for reuse
+            if self.server_manager:
+                self.server_manager.close()
+
             self._initialized = False
             logger.info("👋 Agent closed successfully")
 
@@ -0,0 +1,198 @@
+"""
+Approximate nearest-neighbour index for tool search.
+
+This module provides an inverted-file (IVF-flat) index over unit-norm embedding
+rows. Rows are clustered with spherical k-means, and a query is only scored
+against the rows of the clusters whose centroids are closest to it, so search
+cost grows with the square root of the catalog instead of linearly.
+"""
+
+import math
+
+import numpy as np
+
+from .quantization import score_rows
+
+# Rows assigned to centroids per chunk, bounding the temporary score matrix
+_ASSIGN_CHUNK_ROWS = 8192
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+class IVFIndex:
+    """Inverted-file index for maximum inner product search over unit-norm rows.
+
+    The index does not copy the rows; it keeps one cluster assignment per row of
+    the matrix it was trained on and is searched together with that matrix, which
+    may be stored quantized (see quantization.quantize_rows).
+    Rows can be appended and deleted without retraining, in step with the
+    matrix; needs_retraining reports when the clusters no longer fit its size.
+    """
+
+    def __init__(
+        self,
+        matrix: np.ndarray,
+        n_lists: int | None = None,
+        n_probe: int | None = None,
+        iterations: int = 8,
+        seed: int = 0,
+    ) -> None:
+        """Train the index on a matrix of unit-norm rows.
+
+        Args:
+            matrix: The rows to index, one per tool, as float32 or quantized rows.
+            n_lists: Number of clusters; defaults to the square root of the row count.
+            n_probe: Number of clusters scanned per query; defaults to a tenth of
+                n_lists, and at least 8.
+            iterations: Number of k-means iterations.
+            seed: Seed for sampling the initial centroids.
+        """
+        num_rows = len(matrix)
+        if n_lists is None:
+            n_lists = round(math.sqrt(num_rows))
+        self.n_lists = max(1, min(n_lists, num_rows))
+        if n_probe is None:
+            n_probe = max(8, math.ceil(self.n_lists / 10))
+        self.n_probe = min(n_probe, self.n_lists)
+        self.trained_rows = num_rows
+
+        # Train on a sample; a few dozen rows per cluster are enough to place centroids
+        rng = np.random.default_rng(seed)
+        sample_size = min(num_rows, self.n_lists * 64)
+        sample = matrix[np.sort(rng.choice(num_rows, sample_size, replace=False))]
+        # Quantized rows are rescaled to unit norm; scaling a row never changes its cluster
+        sample = _normalize(sample.astype(np.float32))
+        centroids = sample[rng.choice(sample_size, self.n_lists, replace=False)]
+        for _ in range(iterations):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            counts = np.bincount(assignments, minlength=self.n_lists)
+            nonempty = counts > 0
+            starts = np.concatenate([[0], np.cumsum(counts)[:-1]])[nonempty]
+            sums = np.add.reduceat(sample[np.argsort(assignments, kind="stable")], starts)
+            # Empty clusters keep their previous centroid
+            centroids[nonempty] = _normalize(sums)
+        self.centroids = np.ascontiguousarray(centroids, dtype=np.float32)
+
+        self._assignments = self._assign(matrix)
+        self._order: np.ndarray | None = None
+        self._offsets: np.ndarray | None = None
+
+    @classmethod
+    def from_arrays(
+        cls,
+        centroids: np.ndarray,
+        assignments: np.ndarray,
+        n_probe: int | None = None,
+    ) -> "IVFIndex":
+        """Restore a trained index from its centroids and row assignments, without training.
+
+        Args:
+            centroids: The centroids of a trained index.
+            assignments: The cluster of each indexed row.
+            n_probe: Number of clusters scanned per query; defaults as in training.
+        """
+        index = cls.__new__(cls)
+        index.centroids = centroids
+        index.n_lists = len(centroids)
+        if n_probe is None:
+            n_probe = max(8, math.ceil(index.n_lists / 10))
+        index.n_probe = min(n_probe, index.n_lists)
+        index.trained_rows = len(assignments)
+        index._assignments = assignments
+        index._order = None
+        index._offsets = None
+        return index
+
+    @property
+    def assignments(self) -> np.ndarray:
+        """The cluster of each indexed row."""
+        return self._assignments
+
+    def _assign(self, rows: np.ndarray) -> np.ndarray:
+        """Get the cluster of each row."""
+        chunks = [
+            np.argmax(
+                rows[start : start + _ASSIGN_CHUNK_ROWS].astype(np.float32) @ self.centroids.T,
+                axis=1,
+            )
+            for start in range(0, len(rows), _ASSIGN_CHUNK_ROWS)
+        ]
+        return np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.intp)
+
+    def add(self, rows: np.ndarray) -> None:
+        """Index rows appended to the matrix.
+
+        Args:
+            rows: The new rows, in the order they were appended.
+        """
+        self._assignments = np.concatenate([self._assignments, self._assign(rows)])
+        self._order = None
+
+    def remove(self, keep: np.ndarray) -> None:
+        """Drop rows deleted from the matrix.
+
+        Args:
+            keep: Boolean mask over the current rows; rows where it is False are deleted.
+        """
+        self._assignments = self._assignments[keep]
+        self._order = None
+
+    @property
+    def needs_retraining(self) -> bool:
+        """Whether the row count has changed too much since training for the clusters to fit."""
+        return not self.trained_rows / 2 <= len(self._assignments) <= self.trained_rows * 2
+
+    def search(
+        self,
+        matrix: np.ndarray,
+        query: np.ndarray,
+        top_k: int,
+        scales: np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the rows with the highest inner product with a query.
+
+        Args:
+            matrix: The indexed rows.
+            query: The unit-norm query vector.
+            top_k: Number of rows to return.
+            scales: The per-row scales of an int8 matrix, or None.
+
+        Returns:
+            The row indices and their scores, in descending score order. Clusters
+            beyond n_probe are scanned when needed, so min(top_k, rows) rows are returned.
+        """
+        if self._order is None:
+            # Group row indices by cluster so each cluster is one contiguous slice
+            self._order = np.argsort(self._assignments, kind="stable")
+            counts = np.bincount(self._assignments, minlength=self.n_lists)
+            self._offsets = np.concatenate([[0], np.cumsum(counts)])
+
+        nearest = np.argsort(self.centroids @ query)[::-1]
+        sizes = np.diff(self._offsets)[nearest]
+        needed = int(np.searchsorted(np.cumsum(sizes), top_k)) + 1
+        probed = nearest[: max(self.n_probe, needed)]
+        rows = np.concatenate(
+            [self._order[self._offsets[c] : self._offsets[c + 1]] for c in probed]
+        )
+
+        scores = score_rows(matrix[rows], None if scales is None else scales[rows], query)
+        k = min(top_k, len(rows))
+        if k <= 0:
+            return rows[:0], scores[:0]
+        top = np.argpartition(scores, len(scores) - k)[len(scores) - k :]
+        top = top[np.argsort(scores[top])[::-1]]
+        return rows[top], scores[top]
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the centroids and cluster assignments, in bytes."""
+        nbytes = self.centroids.nbytes + self._assignments.nbytes
+        if self._order is not None:
+            nbytes += self._order.nbytes + self._offsets.nbytes
+        return nbytes
+
+    def __len__(self) -> int:
+        return len(self._assignments)
@@ -0,0 +1,146 @@
+"""
+Persistent cache of MCP server capabilities.
+
+This module stores the initialize result and tool list of each server on disk,
+so sessions can expose their tools immediately on a warm start and refresh them
+from the live server in the background.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+
+from mcp.types import InitializeResult, Tool
+
+from .logging import logger
+
+
+class CapabilityCache:
+    """On-disk cache of server capabilities keyed by router, server name and server ID.
+
+    Each server is stored as one JSON file holding the initialize result, the
+    tool list (including input schemas) and a fingerprint of the server's
+    reported name, version and instructions.
+    """
+
+    def __init__(self, cache_dir: str, router_url: str | None = None) -> None:
+        """Initialize the capability cache.
+
+        Args:
+            cache_dir: Directory the cache files are stored in.
+            router_url: URL of the router the cached servers belong to.
+        """
+        self.cache_dir = os.path.expanduser(cache_dir)
+        self.router_url = router_url or ""
+
+    @staticmethod
+    def fingerprint(initialize_result: InitializeResult) -> str:
+        """Hash the server's reported identity, version and instructions.
+
+        Args:
+            initialize_result: The result of the MCP initialize request.
+
+        Returns:
+            A hex digest that changes when the server reports a new version.
+        """
+        server_info = initialize_result.serverInfo
+        payload = json.dumps(
+            [server_info.name, server_info.version, initialize_result.instructions or ""]
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, server_name: str) -> str:
+        """Get the cache file path for a server."""
+        key = hashlib.sha256(f"{self.router_url}|{server_name}".encode()).hexdigest()[:16]
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", server_name)
+        return os.path.join(self.cache_dir, f"{safe_name}-{key}.json")
+
+    def load(
+        self, server_name: str, server_id: str | None
+    ) -> tuple[InitializeResult, list[Tool]] | None:
+        """Load the cached capabilities of a server.
+
+        Args:
+            server_name: The name of the server in the configuration.
+            server_id: The server ID assigned by the router; entries for a different
+                      ID are ignored.
+
+        Returns:
+            A tuple of (initialize result, tools), or None on a miss.
+        """
+        try:
+            with open(self._path(server_name)) as f:
+                entry = json.load(f)
+            if entry.get("server_id") != server_id:
+                return None
+            initialize_result = InitializeResult.model_validate(entry["initialize_result"])
+            tools = [Tool.model_validate(tool) for tool in entry["tools"]]
+            return initialize_result, tools
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable capability cache for '{server_name}': {e}")
+            return None
+
+    def store(
+        self,
+        server_name: str,
+        server_id: str | None,
+        initialize_result: InitializeResult,
+        tools: list[Tool],
+    ) -> bool:
+        """Store the capabilities of a server.
+
+        Args:
+            server_name: The name of the server in the configuration.
+            server_id: The server ID assigned by the router.
+            initialize_result: The result of the MCP initialize request.
+            tools: The tools listed by the server.
+
+        Returns:
+            True if the cached entry changed, False if it was already up to date.
+        """
+        entry = {
+            "server_name": server_name,
+            "server_id": server_id,
+            "fingerprint": self.fingerprint(initialize_result),
+            "initialize_result": initialize_result.model_dump(mode="json", exclude_none=True),
+            "tools": [tool.model_dump(mode="json", exclude_none=True) for tool in tools],
+        }
+
+        path = self._path(server_name)
+        try:
+            with open(path) as f:
+                previous = json.load(f)
+            previous.pop("saved_at", None)
+            if previous == entry:
+                return False
+        except (FileNotFoundError, ValueError):
+            pass
+
+        entry["saved_at"] = time.time()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Write atomically so concurrent processes never read a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return True
+
+    def invalidate(self, server_name: str) -> None:
+        """Remove the cached capabilities of a server.
+
+        Args:
+            server_name: The name of the server in the configuration.
+        """
+        try:
+            os.remove(self._path(server_name))
+        except FileNotFoundError:
+            pass
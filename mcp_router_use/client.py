@@ -5,16 +5,49 @@ This module provides a high-level client that manages MCP servers and sessions,
 including configuration, connector creation, and session management.
 """
 
+import asyncio
 import json
 import os
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Union
 
 import aiohttp
+from mcp.types import InitializeResult
+
+from .capability_cache import CapabilityCache
+from .coalescing import ToolCallCoalescer
 from .config import create_connector_from_config, load_config_file
 from .connectors import BaseConnector
 from .connectors.http import HttpConnector
+from .connectors.pooled import PooledConnector
 from .logging import logger
+from .result_cache import ToolResultCache
 from .session import MCPSession
+from .utils import as_completed_bounded
+
+
+@dataclass
+class SessionBatchResult:
+    """Outcome of bringing up several sessions at once.
+
+    Attributes:
+        sessions: Sessions that were created successfully, keyed by server name.
+        errors: The exception raised for each server that failed or timed out.
+        server_times: Seconds spent bringing up each server.
+        wall_time: Total elapsed seconds for the whole batch.
+    """
+
+    sessions: Dict[str, MCPSession] = field(default_factory=dict)
+    errors: Dict[str, BaseException] = field(default_factory=dict)
+    server_times: Dict[str, float] = field(default_factory=dict)
+    wall_time: float = 0.0
+
+    @property
+    def total_server_time(self) -> float:
+        """Sum of the per-server bring-up times."""
+        return sum(self.server_times.values())
 
 
 class MCPClient:
@@ -72,6 +105,10 @@ class MCPClient:
         # Initialize session storage
         self.sessions: Dict[str, MCPSession] = {}
         self.active_sessions: List[str] = []
+
+        # In-flight session creations, shared by concurrent callers for the same server
+        self._pending_sessions: Dict[str, asyncio.Future] = {}
+        self._pending_waiters: Dict[str, int] = {}
         
         # Set up router URL and headers for authentication
         router_config = self.config.get("mcpRouter", {})
@@ -86,6 +123,125 @@ class MCPClient:
         if "headers" in router_config:
             self.router_headers.update(router_config["headers"])
 
+        # Settings for the pooled HTTP session used for router REST calls
+        self.router_timeout = router_config.get("timeout", 30)
+        self.connection_limit = router_config.get("connection_limit", 100)
+        self.connection_limit_per_host = router_config.get("connection_limit_per_host", 0)
+        self.dns_cache_ttl = router_config.get("dns_cache_ttl", 300)
+        self.keepalive_timeout = router_config.get("keepalive_timeout", 30)
+        self.registration_batch_size = router_config.get("registration_batch_size", 100)
+
+        # Id-indexed snapshot of the router's server list, refreshed at most once per TTL
+        self.status_cache_ttl = router_config.get("status_cache_ttl", 5.0)
+        self._server_status: Dict[str, Dict[str, Any]] = {}
+        self._server_status_time: Optional[float] = None
+        self._server_status_lock = asyncio.Lock()
+
+        # Idle session reaping and the cap on simultaneously open sessions
+        self.session_idle_timeout = router_config.get("session_idle_timeout")
+        self.max_open_sessions = router_config.get("max_open_sessions")
+        self.reaper_interval = router_config.get("reaper_interval", 30)
+        self.lazy_sessions = router_config.get("lazy_sessions", False)
+        self._background_tasks: set[asyncio.Task] = set()
+
+        # On-disk cache of each server's initialize result and tool list
+        capability_cache_dir = router_config.get("capability_cache_dir")
+        self.capability_cache = (
+            CapabilityCache(capability_cache_dir, self.router_url)
+            if capability_cache_dir
+            else None
+        )
+
+        # Opt-in cache of tool results shared by every session of this client
+        result_cache_config = router_config.get("tool_result_cache")
+        if isinstance(result_cache_config, dict):
+            self.tool_result_cache = ToolResultCache(**result_cache_config)
+        else:
+            self.tool_result_cache = ToolResultCache() if result_cache_config else None
+
+        # Opt-in sharing of identical in-flight tool calls across sessions of this client
+        coalescing_config = router_config.get("coalesce_tool_calls")
+        if isinstance(coalescing_config, dict):
+            self.call_coalescer = ToolCallCoalescer(**coalescing_config)
+        else:
+            self.call_coalescer = ToolCallCoalescer() if coalescing_config else None
+        self._reaper_task: asyncio.Task | None = None
+        self._http_session: aiohttp.ClientSession | None = None
+        self._http_session_loop: asyncio.AbstractEventLoop | None = None
+
+    async def __aenter__(self) -> "MCPClient":
+        """Enter the async context manager.
+
+        Returns:
+            The client instance.
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit the async context manager, closing all sessions and the HTTP pool.
+
+        Args:
+            exc_type: The exception type, if an exception was raised.
+            exc_val: The exception value, if an exception was raised.
+            exc_tb: The exception traceback, if an exception was raised.
+        """
+        await self.aclose()
+
+    async def _get_http_session(self) -> aiohttp.ClientSession:
+        """Get the pooled HTTP session used for MCP Router REST calls.
+
+        The session is created on first use and reused for every router call, so
+        connections are kept alive and DNS lookups are cached between requests.
+        A new session is created if the previous one was closed or belongs to a
+        different event loop, which is then closed.
+
+        Returns:
+            The shared aiohttp client session.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._http_session is None
+            or self._http_session.closed
+            or self._http_session_loop is not loop
+        ):
+            await self._close_http_session()
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.connection_limit_per_host,
+                use_dns_cache=True,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._http_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.router_timeout),
+            )
+            self._http_session_loop = loop
+        return self._http_session
+
+    async def _close_http_session(self) -> None:
+        """Close the pooled HTTP session on the event loop it was created on."""
+        session, loop = self._http_session, self._http_session_loop
+        self._http_session = None
+        self._http_session_loop = None
+        if session is None or session.closed:
+            return
+        if loop is not None and loop is not asyncio.get_running_loop() and loop.is_running():
+            # Its connections belong to a loop running in another thread
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        try:
+            await session.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled HTTP session: {e}")
+
+    async def aclose(self) -> None:
+        """Close all sessions, the idle-session reaper and the pooled HTTP session.
+
+        Equivalent to close_all_sessions.
+        """
+        await self.close_all_sessions()
+
     @classmethod
     def from_dict(cls, config: Dict[str, Any]) -> "MCPClient":
         """Create a MCPClient from a dictionary.
@@ -184,6 +340,20 @@ class MCPClient:
                 active_sessions[server_name] = session
         return active_sessions
 
+    def get_pool_stats(self, server_name: str) -> Optional[Dict[str, int]]:
+        """Get connection pool statistics for a server.
+
+        Args:
+            server_name: The name of the server.
+
+        Returns:
+            The pool statistics, or None if the server has no pooled session.
+        """
+        session = self.sessions.get(server_name)
+        if session is None or not isinstance(session.connector, PooledConnector):
+            return None
+        return session.connector.stats()
+
     def save_config(self, filepath: str) -> None:
         """Save the current configuration to a file.
 
@@ -218,49 +388,142 @@ class MCPClient:
         if server_name not in servers:
             raise ValueError(f"Server '{server_name}' not found in config")
 
-        server_config = servers[server_name]
-        
         # Prepare the registration payload
+        registration_config = {
+            server_name: self._build_registration_entry(servers[server_name])
+        }
+            
+        # Register the server with the router
+        try:
+            session = await self._get_http_session()
+            async with session.post(
+                f"{self.router_url}/api/servers",
+                headers=self.router_headers,
+                json=registration_config,
+            ) as response:
+                if response.status in (200, 201):
+                    result = await response.json()
+                    if "results" in result and len(result["results"]) > 0:
+                        # Find the first successful result
+                        for server_result in result["results"]:
+                            if server_result.get("success"):
+                                server_id = server_result.get("name")
+                                # Store the server ID in the config
+                                self.config["mcpServers"][server_name]["server_id"] = server_id
+                                self._invalidate_server_status()
+                                return server_id
+                    return None
+                else:
+                    # For tests, don't use logger to avoid MagicMock issues
+                    return None
+        except aiohttp.ClientError:
+            return None
+            
+    def _build_registration_entry(self, server_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the router registration payload entry for a configured server.
+
+        Args:
+            server_config: The server configuration.
+
+        Returns:
+            The payload entry to send to the router's /api/servers endpoint.
+
+        Raises:
+            ValueError: If the server configuration cannot be registered.
+        """
         if "command" in server_config and "args" in server_config:
             # This is a command-based configuration
-            registration_config = {
-                server_name: {
-                    "command": server_config["command"],
-                    "args": server_config["args"],
-                    "env": server_config.get("env", {})
-                }
+            return {
+                "command": server_config["command"],
+                "args": server_config["args"],
+                "env": server_config.get("env", {})
             }
+
+        # For URL-based configuration, we need to adapt it
+        # This is a placeholder, implement based on your requirements
+        raise ValueError("URL-based server configurations are not supported for registration")
+
+    async def register_servers_with_router(
+        self, names: Optional[List[str]] = None
+    ) -> Dict[str, Optional[str]]:
+        """Register several servers with the MCP Router in bulk.
+
+        The router's /api/servers endpoint accepts a name-keyed dict of servers,
+        so servers are sent in as few requests as possible (chunks of
+        ``mcpRouter.registration_batch_size``, default 100). Each entry of the
+        response's ``results`` list is mapped back to its configured server and
+        the assigned server ID is stored in the configuration.
+
+        Args:
+            names: The names of the servers to register. If None, every configured
+                  command-based server is registered.
+
+        Returns:
+            A dictionary mapping each requested server name to its server ID, or
+            None if registration failed for that server.
+
+        Raises:
+            ValueError: If no router URL is configured or a named server doesn't
+                       exist or cannot be registered.
+        """
+        if not self.router_url:
+            raise ValueError("No MCP Router URL configured")
+
+        servers = self.config.get("mcpServers", {})
+        entries: Dict[str, Dict[str, Any]] = {}
+        if names is None:
+            for server_name, server_config in servers.items():
+                try:
+                    entries[server_name] = self._build_registration_entry(server_config)
+                except ValueError:
+                    logger.debug(f"Skipping server '{server_name}' for bulk registration")
         else:
-            # For URL-based configuration, we need to adapt it
-            # This is a placeholder, implement based on your requirements
-            raise ValueError("URL-based server configurations are not supported for registration")
-            
-        # Register the server with the router
-        try:
-            async with aiohttp.ClientSession() as session:
+            for server_name in names:
+                if server_name not in servers:
+                    raise ValueError(f"Server '{server_name}' not found in config")
+                entries[server_name] = self._build_registration_entry(servers[server_name])
+
+        server_ids: Dict[str, Optional[str]] = {name: None for name in entries}
+        if not entries:
+            return server_ids
+
+        batch_size = max(1, self.registration_batch_size)
+        server_names = list(entries)
+        session = await self._get_http_session()
+        for offset in range(0, len(server_names), batch_size):
+            chunk = server_names[offset:offset + batch_size]
+            try:
                 async with session.post(
                     f"{self.router_url}/api/servers",
                     headers=self.router_headers,
-                    json=registration_config,
-                    timeout=30
+                    json={name: entries[name] for name in chunk},
                 ) as response:
-                    if response.status in (200, 201):
-                        result = await response.json()
-                        if "results" in result and len(result["results"]) > 0:
-                            # Find the first successful result
-                            for server_result in result["results"]:
-                                if server_result.get("success"):
-                                    server_id = server_result.get("name")
-                                    # Store the server ID in the config
-                                    self.config["mcpServers"][server_name]["server_id"] = server_id
-                                    return server_id
-                        return None
-                    else:
-                        # For tests, don't use logger to avoid MagicMock issues
-                        return None
-        except aiohttp.ClientError:
-            return None
-            
+                    if response.status not in (200, 201):
+                        logger.warning(
+                            f"Bulk registration of {len(chunk)} servers failed "
+                            f"with status {response.status}"
+                        )
+                        continue
+                    result = await response.json()
+            except aiohttp.ClientError as e:
+                logger.warning(f"Bulk registration of {len(chunk)} servers failed: {e}")
+                continue
+
+            for index, server_result in enumerate(result.get("results", [])):
+                # Results carry the server name; fall back to payload order otherwise
+                server_name = server_result.get("name")
+                if server_name not in server_ids:
+                    if index >= len(chunk):
+                        continue
+                    server_name = chunk[index]
+                if server_result.get("success"):
+                    server_id = server_result.get("name") or server_name
+                    servers[server_name]["server_id"] = server_id
+                    server_ids[server_name] = server_id
+                    self._invalidate_server_status()
+
+        return server_ids
+
     async def start_server_in_router(self, server_name: str) -> bool:
         """Start a server in the MCP Router.
 
@@ -291,21 +554,29 @@ class MCPClient:
             
         # Start the server
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.router_url}/api/servers/{server_id}/start",
-                    headers=self.router_headers,
-                    timeout=30
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        if result.get("success"):
-                            return True
-                        else:
-                            return False
+            session = await self._get_http_session()
+            async with session.post(
+                f"{self.router_url}/api/servers/{server_id}/start",
+                headers=self.router_headers,
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    if result.get("success"):
+                        # Keep the cached snapshot in step without refetching the list
+                        if server_id in self._server_status:
+                            self._server_status[server_id] = {
+                                **self._server_status[server_id],
+                                "status": result.get("status", "online"),
+                            }
+                        return True
                     else:
+                        self._invalidate_server_status()
                         return False
+                else:
+                    self._invalidate_server_status()
+                    return False
         except aiohttp.ClientError:
+            self._invalidate_server_status()
             return False
             
     async def get_router_servers(self) -> List[Dict[str, Any]]:
@@ -321,24 +592,68 @@ class MCPClient:
             raise ValueError("No MCP Router URL configured")
             
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.router_url}/api/servers",
-                    headers=self.router_headers,
-                    timeout=30
-                ) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        return []
+            session = await self._get_http_session()
+            async with session.get(
+                f"{self.router_url}/api/servers",
+                headers=self.router_headers,
+            ) as response:
+                if response.status == 200:
+                    servers = await response.json()
+                    # Refresh the status snapshot with the full list we just downloaded
+                    self._server_status = {
+                        server["id"]: server for server in servers if "id" in server
+                    }
+                    self._server_status_time = time.monotonic()
+                    return servers
+                else:
+                    return []
         except aiohttp.ClientError:
             return []
+
+    def _server_status_is_fresh(self) -> bool:
+        """Check whether the cached server status snapshot is within its TTL."""
+        return (
+            self._server_status_time is not None
+            and time.monotonic() - self._server_status_time < self.status_cache_ttl
+        )
+
+    def _invalidate_server_status(self) -> None:
+        """Drop the cached server status snapshot so the next lookup refetches it."""
+        self._server_status_time = None
+
+    async def get_router_server_status(self, server_id: str) -> Optional[Dict[str, Any]]:
+        """Get the router's status entry for a server ID.
+
+        Lookups are served from an id-indexed snapshot of the router's server list
+        that is downloaded at most once per ``mcpRouter.status_cache_ttl`` seconds
+        (default 5), and shared by concurrent callers. A miss in a cached snapshot
+        triggers one refresh before the server is reported as unknown.
+
+        Args:
+            server_id: The server ID assigned by the MCP Router.
+
+        Returns:
+            The server information dictionary, or None if the router doesn't know the server.
+
+        Raises:
+            ValueError: If no router URL is configured.
+        """
+        if self._server_status_is_fresh() and server_id in self._server_status:
+            return self._server_status[server_id]
+
+        seen_at = self._server_status_time
+        async with self._server_status_lock:
+            # Skip the fetch if another caller refreshed the snapshot while we waited
+            if self._server_status_time == seen_at or not self._server_status_is_fresh():
+                await self.get_router_servers()
+            return self._server_status.get(server_id)
             
     async def create_session(
         self, 
         server_name: str, 
         auto_initialize: bool = True,
-        auto_register: bool = True
+        auto_register: bool = True,
+        lazy: Optional[bool] = None,
     ) -> MCPSession:
         """Create a session for the specified server through MCP Router.
 
@@ -349,11 +664,17 @@ class MCPClient:
         If auto_register is True and the server is not found in the MCP Router,
         the SDK will attempt to register and start the server automatically.
 
+        Concurrent calls for the same server are de-duplicated: while a session is
+        being created, further callers await that same creation and receive the
+        same MCPSession instead of registering and connecting again.
+
         Args:
             server_name: The name of the server to create a session for.
             auto_initialize: Whether to automatically initialize the session.
             auto_register: Whether to automatically register and start the server
                           if it doesn't exist in the MCP Router.
+            lazy: Whether to defer connecting and initializing until the session is
+                 first used. Defaults to ``mcpRouter.lazy_sessions`` (False).
 
         Returns:
             The created MCPSession.
@@ -362,6 +683,44 @@ class MCPClient:
             ValueError: If no MCP Router URL is configured, no servers are configured, 
                       or the specified server doesn't exist.
         """
+        task = self._pending_sessions.get(server_name)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._create_session(server_name, auto_initialize, auto_register, lazy)
+            )
+            self._pending_sessions[server_name] = task
+            self._pending_waiters[server_name] = 0
+            task.add_done_callback(lambda _: self._finish_pending_session(server_name, task))
+
+        self._pending_waiters[server_name] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # Abandon the creation only when no other caller is still waiting on it
+            if self._pending_waiters.get(server_name) == 1 and not task.done():
+                task.cancel()
+            raise
+        finally:
+            if self._pending_sessions.get(server_name) is task:
+                self._pending_waiters[server_name] -= 1
+
+    def _finish_pending_session(self, server_name: str, task: asyncio.Future) -> None:
+        """Forget a finished in-flight session creation."""
+        if self._pending_sessions.get(server_name) is task:
+            del self._pending_sessions[server_name]
+            del self._pending_waiters[server_name]
+        if not task.cancelled():
+            # Mark the exception as retrieved; the awaiting callers re-raise it
+            task.exception()
+
+    async def _create_session(
+        self,
+        server_name: str,
+        auto_initialize: bool,
+        auto_register: bool,
+        lazy: Optional[bool] = None,
+    ) -> MCPSession:
+        """Create a session for the specified server; see create_session."""
         # Get server config
         servers = self.config.get("mcpServers", {})
         if not servers:
@@ -390,15 +749,11 @@ class MCPClient:
                     await self.start_server_in_router(server_name)
             else:
                 # Check if server exists and is running
-                servers = await self.get_router_servers()
-                server_exists = False
-                for server in servers:
-                    if server.get("id") == server_id:
-                        server_exists = True
-                        # If server exists but is not online, start it
-                        if server.get("status") != "online":
-                            await self.start_server_in_router(server_name)
-                        break
+                server = await self.get_router_server_status(server_id)
+                server_exists = server is not None
+                if server_exists and server.get("status") != "online":
+                    # If server exists but is not online, start it
+                    await self.start_server_in_router(server_name)
                 
                 # If server doesn't exist, register and start a new one
                 if not server_exists and auto_register:
@@ -413,14 +768,45 @@ class MCPClient:
             "headers": self.router_headers,   # Headers including auth if present
             "auth_token": self.config.get("mcpRouter", {}).get("auth_token") 
         }
-        connector = create_connector_from_config(router_connector_config)
+        pool_config = server_config.get("pool")
+        if pool_config:
+            # Spread tool calls for busy servers over several connections
+            connector = PooledConnector(
+                lambda: create_connector_from_config(router_connector_config),
+                min_sessions=pool_config.get("min_sessions", 1),
+                max_sessions=pool_config.get("max_sessions", 4),
+                acquire_timeout=pool_config.get("acquire_timeout", 30),
+                max_calls_per_session=pool_config.get("max_calls_per_session", 1),
+            )
+        else:
+            connector = create_connector_from_config(router_connector_config)
+        connector.server_name = server_name
+        connector.result_cache = self.tool_result_cache
+        connector.call_coalescer = self.call_coalescer
         
-        # Create the session
-        session = MCPSession(connector)
+        # Create the session; lazy sessions connect and initialize on first use
+        if lazy is None:
+            lazy = self.lazy_sessions
+        session = MCPSession(connector, lazy=True) if lazy else MCPSession(connector)
+
+        cached = None
+        if auto_initialize and self.capability_cache is not None:
+            cached = self.capability_cache.load(server_name, server_config.get("server_id"))
         
-        # Initialize the session if requested
-        if auto_initialize:
-            await session.initialize()
+        if cached is not None:
+            # Expose the cached tools now and refresh them from the server in the background
+            session.load_cached(*cached)
+            if not lazy:
+                self._run_in_background(self._revalidate_capabilities(server_name, session))
+        elif auto_initialize and not lazy:
+            # Initialize the session if requested
+            try:
+                await session.initialize()
+            except BaseException:
+                # Don't leak the connection if initialization fails or is cancelled
+                await session.disconnect()
+                raise
+            self._store_capabilities(server_name, session)
             
         # Store the session
         self.sessions[server_name] = session
@@ -428,9 +814,251 @@ class MCPClient:
         # Add to active sessions
         if server_name not in self.active_sessions:
             self.active_sessions.append(server_name)
+
+        if self.max_open_sessions is not None:
+            await self._enforce_session_cap(keep=server_name)
+        self._ensure_reaper()
             
         return session
+
+    def _store_capabilities(self, server_name: str, session: MCPSession) -> bool:
+        """Write an initialized session's capabilities to the capability cache.
+
+        Returns:
+            True if the cached capabilities changed.
+        """
+        if self.capability_cache is None or not isinstance(session.session_info, InitializeResult):
+            return False
+        server_id = self.config["mcpServers"][server_name].get("server_id")
+        try:
+            return self.capability_cache.store(
+                server_name, server_id, session.session_info, session.connector.tools
+            )
+        except OSError as e:
+            logger.warning(f"Could not write capability cache for '{server_name}': {e}")
+            return False
+
+    async def _revalidate_capabilities(self, server_name: str, session: MCPSession) -> None:
+        """Connect a session primed from the cache and refresh its cached capabilities."""
+        try:
+            await session.ensure_initialized()
+        except Exception as e:
+            logger.warning(f"Could not revalidate cached capabilities of '{server_name}': {e}")
+            return
+        if self._store_capabilities(server_name, session):
+            logger.info(f"Capabilities of server '{server_name}' changed since they were cached")
+
+    def _run_in_background(self, coro) -> asyncio.Task:
+        """Run a coroutine as a task owned by the client and cancelled by aclose."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def suspend_session(self, server_name: str) -> None:
+        """Close the connection of a session but keep it available for reuse.
+
+        The session stays registered with the client and its tool list is kept;
+        the next tool call through it transparently reconnects and re-initializes.
+
+        Args:
+            server_name: The name of the server whose session to suspend.
+        """
+        session = self.sessions.get(server_name)
+        if session is None or not session.is_connected:
+            return
+        logger.debug(f"Suspending session for server '{server_name}'")
+        await session.suspend()
+
+    @staticmethod
+    def _can_suspend(session: MCPSession) -> bool:
+        """Whether a session is open and has no tool call in flight."""
+        return session.is_connected and not session.connector.busy
+
+    async def _enforce_session_cap(self, keep: Optional[str] = None) -> List[str]:
+        """Suspend least recently used sessions until the open-session cap is met.
+
+        Args:
+            keep: A server whose session must not be evicted.
+
+        Returns:
+            The names of the servers whose sessions were suspended.
+        """
+        open_sessions = [
+            (session.connector.last_used, name)
+            for name, session in self.sessions.items()
+            if name != keep and self._can_suspend(session)
+        ]
+        excess = len(open_sessions) + (1 if keep in self.sessions else 0) - self.max_open_sessions
+        evicted = []
+        for _, server_name in sorted(open_sessions)[:max(0, excess)]:
+            await self.suspend_session(server_name)
+            evicted.append(server_name)
+        return evicted
+
+    async def reap_idle_sessions(self) -> List[str]:
+        """Suspend idle sessions and enforce the open-session cap.
+
+        Sessions that have not been used for ``mcpRouter.session_idle_timeout``
+        seconds are suspended, then the least recently used sessions are
+        suspended until at most ``mcpRouter.max_open_sessions`` remain open.
+
+        Returns:
+            The names of the servers whose sessions were suspended.
+        """
+        evicted = []
+        if self.session_idle_timeout is not None:
+            now = time.monotonic()
+            for server_name, session in list(self.sessions.items()):
+                if (
+                    self._can_suspend(session)
+                    and now - session.connector.last_used > self.session_idle_timeout
+                ):
+                    await self.suspend_session(server_name)
+                    evicted.append(server_name)
+        if self.max_open_sessions is not None:
+            evicted.extend(await self._enforce_session_cap())
+        if evicted:
+            logger.debug(f"Suspended idle sessions: {', '.join(evicted)}")
+        return evicted
+
+    def _ensure_reaper(self) -> None:
+        """Start the background idle-session reaper if it is configured."""
+        if self.session_idle_timeout is None and self.max_open_sessions is None:
+            return
+        if self._reaper_task is not None and not self._reaper_task.done():
+            return
+        self._reaper_task = asyncio.create_task(self._reap_periodically())
+
+    async def _reap_periodically(self) -> None:
+        """Run reap_idle_sessions every ``reaper_interval`` seconds."""
+        while True:
+            await asyncio.sleep(self.reaper_interval)
+            try:
+                await self.reap_idle_sessions()
+            except Exception as e:
+                logger.warning(f"Error reaping idle sessions: {e}")
             
+    async def create_all_sessions(
+        self,
+        auto_initialize: bool = True,
+        max_concurrency: Optional[int] = None,
+        timeout_per_server: Optional[float] = None,
+    ) -> SessionBatchResult:
+        """Create sessions for all configured servers concurrently.
+
+        Servers without a server ID are first registered in bulk, then sessions
+        are brought up in parallel, with at most ``max_concurrency`` in flight.
+        A server that fails or exceeds ``timeout_per_server`` is recorded in the
+        result's error map instead of failing the whole batch.
+
+        Args:
+            auto_initialize: Whether to automatically initialize the sessions.
+            max_concurrency: Maximum number of sessions created at the same time.
+                            Defaults to ``mcpRouter.max_concurrency`` or 10.
+            timeout_per_server: Timeout in seconds for bringing up one server.
+                               Defaults to ``mcpRouter.timeout_per_server`` or 60.
+
+        Returns:
+            A SessionBatchResult with the created sessions, per-server errors and timings.
+        """
+        router_config = self.config.get("mcpRouter", {})
+        if max_concurrency is None:
+            max_concurrency = router_config.get("max_concurrency", 10)
+        if timeout_per_server is None:
+            timeout_per_server = router_config.get("timeout_per_server", 60)
+
+        result = SessionBatchResult()
+        server_names = self.get_server_names()
+        if not server_names:
+            logger.warning("No MCP servers defined in config")
+            return result
+
+        start = time.perf_counter()
+
+        # Register every server that has no ID yet in as few round trips as possible
+        servers = self.config["mcpServers"]
+        unregistered = [
+            name for name in server_names
+            if not servers[name].get("server_id")
+            and "command" in servers[name] and "args" in servers[name]
+        ]
+        if self.router_url and unregistered:
+            try:
+                await self.register_servers_with_router(unregistered)
+            except Exception as e:
+                logger.warning(f"Bulk registration failed, falling back to per-server: {e}")
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def bring_up(server_name: str) -> None:
+            async with semaphore:
+                server_start = time.perf_counter()
+                try:
+                    result.sessions[server_name] = await asyncio.wait_for(
+                        self.create_session(server_name, auto_initialize=auto_initialize),
+                        timeout=timeout_per_server,
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to create session for '{server_name}': {e!r}")
+                    result.errors[server_name] = e
+                finally:
+                    result.server_times[server_name] = time.perf_counter() - server_start
+
+        await asyncio.gather(*(bring_up(name) for name in server_names))
+
+        result.wall_time = time.perf_counter() - start
+        logger.info(
+            f"Created {len(result.sessions)}/{len(server_names)} sessions in "
+            f"{result.wall_time:.2f}s (sum of per-server times: {result.total_server_time:.2f}s)"
+        )
+        return result
+
+    async def call_tools(
+        self, calls: List[tuple[str, str, Dict[str, Any]]], max_concurrency: int = 10
+    ) -> List[Any]:
+        """Call tools on several servers concurrently.
+
+        Sessions are reused when they exist and created otherwise.
+
+        Args:
+            calls: (server name, tool name, arguments) triples to call.
+            max_concurrency: Maximum number of calls in flight at the same time.
+
+        Returns:
+            The results in the same order as calls. A call that raised has its
+            exception in place of the result instead of aborting the batch.
+        """
+        results: List[Any] = [None] * len(calls)
+        async for index, result in self.iter_call_tools(calls, max_concurrency):
+            results[index] = result
+        return results
+
+    async def iter_call_tools(
+        self, calls: List[tuple[str, str, Dict[str, Any]]], max_concurrency: int = 10
+    ) -> AsyncIterator[tuple[int, Any]]:
+        """Call tools on several servers concurrently, yielding results as they complete.
+
+        Args:
+            calls: (server name, tool name, arguments) triples to call.
+            max_concurrency: Maximum number of calls in flight at the same time.
+
+        Yields:
+            Tuples of (index into calls, result or exception).
+        """
+
+        async def call(server_name: str, tool_name: str, arguments: Dict[str, Any]) -> Any:
+            session = self.sessions.get(server_name)
+            if session is None:
+                session = await self.create_session(server_name)
+            return await session.call_tool(tool_name, arguments)
+
+        factories = [
+            lambda call_args=call_args: call(*call_args) for call_args in calls
+        ]
+        async for item in as_completed_bounded(factories, max_concurrency):
+            yield item
+
     async def close_session(self, server_name: str) -> None:
         """Close a session for the specified server.
 
@@ -445,24 +1073,39 @@ class MCPClient:
                 self.active_sessions.remove(server_name)
                 
     async def close_all_sessions(self) -> None:
-        """Close all open sessions."""
+        """Close all open sessions.
+
+        Also stops the client's background tasks and idle-session reaper and closes the
+        pooled HTTP session used for router calls; they are started again on next use.
+        """
         errors = []
+
+        tasks = list(self._background_tasks)
+        if self._reaper_task is not None and self._reaper_task is not asyncio.current_task():
+            tasks.append(self._reaper_task)
+            self._reaper_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
         
         # Get a copy of server names to iterate over
         server_names = list(self.sessions.keys())
         
         # Try to disconnect each session, collecting errors
-        for server_name in server_names:
-            try:
-                await self.sessions[server_name].disconnect()
-            except Exception as e:
-                errors.append(f"Failed to close session for '{server_name}': {e}")
-            finally:
-                # Always remove session even if disconnect fails
-                if server_name in self.sessions:
-                    del self.sessions[server_name]
-                if server_name in self.active_sessions:
-                    self.active_sessions.remove(server_name)
+        try:
+            for server_name in server_names:
+                try:
+                    await self.sessions[server_name].disconnect()
+                except Exception as e:
+                    errors.append(f"Failed to close session for '{server_name}': {e}")
+                finally:
+                    # Always remove session even if disconnect fails
+                    if server_name in self.sessions:
+                        del self.sessions[server_name]
+                    if server_name in self.active_sessions:
+                        self.active_sessions.remove(server_name)
+        finally:
+            await self._close_http_session()
                 
         if errors:
             raise Exception("Disconnect failed")
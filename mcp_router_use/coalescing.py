@@ -0,0 +1,115 @@
+"""
+Coalescing of identical in-flight tool calls.
+
+This module provides a layer that lets concurrent identical calls to an
+idempotent tool share one request to the router.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from mcp.types import Tool
+
+
+class ToolCallCoalescer:
+    """Shares one in-flight request between identical concurrent tool calls.
+
+    Calls are identical when they target the same server and tool with the same
+    canonical arguments. Only tools that are safe to deduplicate are coalesced:
+    tools enabled in ``tools`` (by ``"tool"`` or ``"server/tool"``), or, when
+    ``use_annotations`` is set, tools their server annotates with
+    ``readOnlyHint`` or ``idempotentHint``. Setting a tool to False in
+    ``tools`` opts it out even if its annotations would opt it in.
+    """
+
+    def __init__(self, tools: dict[str, bool] | None = None, use_annotations: bool = True) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            tools: Whether to coalesce calls per ``"tool"`` or ``"server/tool"``.
+            use_annotations: Whether read-only and idempotent tools are coalesced
+                            without being listed in tools.
+        """
+        self.tools = tools or {}
+        self.use_annotations = use_annotations
+
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self._waiters: dict[str, int] = {}
+        self.requests = 0
+        self.coalesced = 0
+
+    def should_coalesce(self, server_name: str, tool_name: str, tool: Tool | None = None) -> bool:
+        """Check whether calls to a tool may share a request.
+
+        Args:
+            server_name: The name of the server the tool belongs to.
+            tool_name: The name of the tool.
+            tool: The tool definition, used for its annotations.
+
+        Returns:
+            True if identical concurrent calls to the tool are coalesced.
+        """
+        for name in (f"{server_name}/{tool_name}", tool_name):
+            if name in self.tools:
+                return bool(self.tools[name])
+
+        annotations = getattr(tool, "annotations", None)
+        if self.use_annotations and annotations is not None:
+            return bool(annotations.readOnlyHint or annotations.idempotentHint)
+        return False
+
+    async def run(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run a call, or join the identical call already in flight.
+
+        The request is cancelled only when every caller waiting on it is cancelled.
+
+        Args:
+            key: The key identifying the call, as built by ToolResultCache.make_key.
+            call: Callable that starts the request when no identical call is in flight.
+
+        Returns:
+            The result of the shared request.
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            self.requests += 1
+            task = asyncio.ensure_future(call())
+            self._in_flight[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda _: self._finish(key, task))
+        else:
+            self.coalesced += 1
+
+        self._waiters[key] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._waiters.get(key) == 1 and not task.done():
+                task.cancel()
+            raise
+        finally:
+            if self._in_flight.get(key) is task:
+                self._waiters[key] -= 1
+
+    def _finish(self, key: str, task: asyncio.Future) -> None:
+        """Forget a finished in-flight call."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+            del self._waiters[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved; the awaiting callers re-raise it
+            task.exception()
+
+    def stats(self) -> dict[str, int]:
+        """Get the coalescing statistics.
+
+        Returns:
+            A dictionary with the requests sent, the calls that joined an in-flight
+            request and the requests currently in flight.
+        """
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
@@ -7,8 +7,10 @@ through MCP Router.
 
 from .base import BaseConnector
 from .http import HttpConnector
+from .pooled import PooledConnector
 
 __all__ = [
     "BaseConnector", 
-    "HttpConnector"
+    "HttpConnector",
+    "PooledConnector",
 ]
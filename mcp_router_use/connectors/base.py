@@ -5,13 +5,17 @@ This module provides the base connector interface that all MCP connectors
 must implement.
 """
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
 from typing import Any
 
 from mcp import ClientSession
 from mcp.types import CallToolResult, Tool
 
+from ..coalescing import ToolCallCoalescer
 from ..logging import logger
+from ..result_cache import ToolResultCache
 from ..task_managers import ConnectionManager
 
 
@@ -27,6 +31,13 @@ class BaseConnector(ABC):
         self._connection_manager: ConnectionManager | None = None
         self._tools: list[Tool] | None = None
         self._connected = False
+        self.connect_on_demand = False
+        self.last_used = time.monotonic()
+        self.calls_in_flight = 0  # Tool calls started and not yet finished
+        self._connect_lock = asyncio.Lock()
+        self.result_cache: ToolResultCache | None = None
+        self.call_coalescer: ToolCallCoalescer | None = None
+        self.server_name = ""
 
     @abstractmethod
     async def connect(self) -> None:
@@ -44,6 +55,52 @@ class BaseConnector(ABC):
         self._connected = False
         logger.debug("Disconnected from MCP implementation")
 
+    async def suspend(self) -> None:
+        """Close the connection but keep the tool list, reconnecting on the next call.
+
+        This releases the underlying transport of an idle connector while tools
+        created from it stay usable: the next call_tool transparently reconnects
+        and re-initializes the connector.
+        """
+        # Hold the connect lock so a concurrent ensure_connected cannot interleave
+        async with self._connect_lock:
+            tools = self._tools
+            await self.disconnect()
+            self._tools = tools
+            self.connect_on_demand = True
+
+    @property
+    def busy(self) -> bool:
+        """Whether a tool call is in flight, so the connector must not be suspended."""
+        return self.calls_in_flight > 0
+
+    def prime_tools(self, tools: list[Tool]) -> None:
+        """Use a previously discovered tool list until the connector is initialized.
+
+        The connector then connects and initializes itself on its first tool call.
+
+        Args:
+            tools: The tools to expose before connecting.
+        """
+        self._tools = tools
+        self.connect_on_demand = True
+
+    async def ensure_connected(self) -> dict[str, Any] | None:
+        """Connect and initialize the connector if needed.
+
+        Concurrent callers share a single connect and initialize.
+
+        Returns:
+            The session information if this call initialized the connector, otherwise None.
+        """
+        async with self._connect_lock:
+            if self._connected and self._tools is not None:
+                return None
+            if not self._connected:
+                logger.debug("Connecting on demand")
+                await self.connect()
+            return await self.initialize()
+
     async def _cleanup_resources(self) -> None:
         """Clean up all resources associated with this connector."""
         errors = []
@@ -104,10 +161,71 @@ class BaseConnector(ABC):
         return self._tools
 
     async def call_tool(self, name: str, arguments: dict[str, Any]) -> CallToolResult:
-        """Call an MCP tool with the given arguments."""
+        """Call an MCP tool with the given arguments.
+
+        Cacheable tools are served from the result cache, and identical in-flight
+        calls to coalescable tools share one request. Calling a tool that is not
+        cacheable drops the server's cached results, since it may change them.
+        """
+        self.calls_in_flight += 1
+        try:
+            return await self._call_tool_cached(name, arguments)
+        finally:
+            self.calls_in_flight -= 1
+            self.last_used = time.monotonic()
+
+    async def _call_tool_cached(self, name: str, arguments: dict[str, Any]) -> CallToolResult:
+        """Call a tool through the result cache and call coalescer; see call_tool."""
+        if self.result_cache is None and self.call_coalescer is None:
+            return await self._call_tool(name, arguments)
+
+        tool = next((tool for tool in self._tools or [] if tool.name == name), None)
+        ttl = None
+        if self.result_cache is not None:
+            ttl = self.result_cache.ttl_for(self.server_name, name, tool)
+        coalesce = self.call_coalescer is not None and self.call_coalescer.should_coalesce(
+            self.server_name, name, tool
+        )
+        if ttl is None and self.result_cache is not None:
+            try:
+                if coalesce:
+                    key = ToolResultCache.make_key(self.server_name, name, arguments)
+                    return await self.call_coalescer.run(
+                        key, lambda: self._call_tool(name, arguments)
+                    )
+                return await self._call_tool(name, arguments)
+            finally:
+                # The call may have changed what the server's cacheable tools return
+                self.result_cache.invalidate_server(self.server_name)
+        if ttl is None and not coalesce:
+            return await self._call_tool(name, arguments)
+
+        key = ToolResultCache.make_key(self.server_name, name, arguments)
+        if ttl is not None:
+            result = self.result_cache.get(key)
+            if result is not None:
+                logger.debug(f"Tool '{name}' served from the result cache")
+                return result
+
+        async def fetch() -> CallToolResult:
+            result = await self._call_tool(name, arguments)
+            # Errors may be transient, so only successful results are cached
+            if ttl is not None and not getattr(result, "isError", False):
+                self.result_cache.put(key, result, ttl, self.server_name)
+            return result
+
+        if coalesce:
+            return await self.call_coalescer.run(key, fetch)
+        return await fetch()
+
+    async def _call_tool(self, name: str, arguments: dict[str, Any]) -> CallToolResult:
+        """Call an MCP tool on the server, bypassing the result cache."""
         if not self.client:
-            raise RuntimeError("MCP client is not connected")
+            if not self.connect_on_demand:
+                raise RuntimeError("MCP client is not connected")
+            await self.ensure_connected()
 
+        self.last_used = time.monotonic()
         logger.debug(f"Calling tool '{name}' with arguments: {arguments}")
         result = await self.client.call_tool(name, arguments)
         logger.debug(f"Tool '{name}' called with result: {result}")
@@ -0,0 +1,220 @@
+"""
+Pooled connector for MCP implementations.
+
+This module provides a connector that spreads tool calls for one server over a
+pool of underlying connections, so a busy server can serve parallel calls.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+
+from mcp.types import CallToolResult
+
+from ..logging import logger
+from .base import BaseConnector
+
+
+class PooledConnector(BaseConnector):
+    """Connector that multiplexes tool calls over a pool of connectors.
+
+    The pool keeps at least ``min_sessions`` connections open and grows up to
+    ``max_sessions`` when all existing connections are busy. Each call goes to
+    an idle connection if there is one, otherwise to a new connection while the
+    pool can still grow, and finally to the least-loaded connection that still
+    accepts calls. When every connection is at capacity, callers wait up to
+    ``acquire_timeout`` seconds for one to free up.
+    """
+
+    def __init__(
+        self,
+        connector_factory: Callable[[], BaseConnector],
+        min_sessions: int = 1,
+        max_sessions: int = 4,
+        acquire_timeout: float | None = 30,
+        max_calls_per_session: int = 1,
+    ):
+        """Initialize a new pooled connector.
+
+        Args:
+            connector_factory: Callable that creates a new, unconnected connector.
+            min_sessions: Number of connections opened when the pool connects.
+            max_sessions: Maximum number of connections in the pool.
+            acquire_timeout: Seconds to wait for a free connection, or None to wait forever.
+            max_calls_per_session: Maximum concurrent tool calls on one connection.
+        """
+        super().__init__()
+        if min_sessions < 1 or max_sessions < min_sessions:
+            raise ValueError("Pool size must satisfy 1 <= min_sessions <= max_sessions")
+        self.connector_factory = connector_factory
+        self.min_sessions = min_sessions
+        self.max_sessions = max_sessions
+        self.acquire_timeout = acquire_timeout
+        self.max_calls_per_session = max(1, max_calls_per_session)
+
+        self._members: list[BaseConnector] = []
+        self._load: dict[BaseConnector, int] = {}
+        self._opening = 0
+        self._waiters = 0
+        self._initialized = False
+        self._condition = asyncio.Condition()
+
+    async def connect(self) -> None:
+        """Open the minimum number of pooled connections."""
+        if self._connected:
+            logger.debug("Already connected to MCP implementation")
+            return
+
+        try:
+            for _ in range(self.min_sessions):
+                member = self.connector_factory()
+                await member.connect()
+                self._add_member(member)
+
+            # The first connection serves non-tool requests such as resources
+            self.client = self._members[0].client
+            self._connected = True
+            logger.debug(f"Opened connection pool with {len(self._members)} connections")
+        except Exception as e:
+            logger.error(f"Failed to open connection pool: {e}")
+            await self._cleanup_resources()
+            raise
+
+    async def _cleanup_resources(self) -> None:
+        """Disconnect every pooled connection."""
+        members, self._members = self._members, []
+        self._load = {}
+        for member in members:
+            try:
+                await member.disconnect()
+            except Exception as e:
+                logger.warning(f"Error closing pooled connection: {e}")
+
+        self.client = None
+        self._tools = None
+        self._initialized = False
+
+    async def initialize(self) -> dict[str, Any]:
+        """Initialize every open connection and return the session information."""
+        if not self._members:
+            raise RuntimeError("MCP client is not connected")
+
+        # The first connection discovers tools; the rest only need the handshake
+        result = await self._members[0].initialize()
+        self._tools = self._members[0].tools
+        await asyncio.gather(*(member.client.initialize() for member in self._members[1:]))
+        self._initialized = True
+        return result
+
+    async def _call_tool(self, name: str, arguments: dict[str, Any]) -> CallToolResult:
+        """Call an MCP tool on the least-loaded pooled connection."""
+        if not self._connected:
+            if not self.connect_on_demand:
+                raise RuntimeError("MCP client is not connected")
+            await self.ensure_connected()
+
+        self.last_used = time.monotonic()
+        member = await self._acquire()
+        try:
+            return await member.call_tool(name, arguments)
+        finally:
+            await self._release(member)
+
+    @property
+    def busy(self) -> bool:
+        """Whether a tool call is in flight on the pool or any pooled connection."""
+        return super().busy or any(load > 0 for load in self._load.values())
+
+    def stats(self) -> dict[str, int]:
+        """Get the current pool statistics.
+
+        Returns:
+            A dictionary with the pool size, connections in use, idle connections,
+            connections being opened, calls in flight and callers waiting for a connection.
+        """
+        in_use = sum(1 for load in self._load.values() if load > 0)
+        return {
+            "size": len(self._members),
+            "in_use": in_use,
+            "idle": len(self._members) - in_use,
+            "opening": self._opening,
+            "in_flight": sum(self._load.values()),
+            "waiters": self._waiters,
+        }
+
+    def _add_member(self, member: BaseConnector) -> None:
+        """Add a connected connector to the pool."""
+        self._members.append(member)
+        self._load[member] = 0
+
+    def _select_member(self) -> BaseConnector | None:
+        """Pick a connection for the next call, or None if the pool should grow or wait."""
+        idle = [member for member in self._members if self._load[member] == 0]
+        if idle:
+            return idle[0]
+        if len(self._members) + self._opening < self.max_sessions:
+            return None
+        available = [
+            member for member in self._members
+            if self._load[member] < self.max_calls_per_session
+        ]
+        if available:
+            return min(available, key=self._load.__getitem__)
+        return None
+
+    async def _acquire(self) -> BaseConnector:
+        """Reserve a connection for one call, growing the pool if needed."""
+        try:
+            async with asyncio.timeout(self.acquire_timeout):
+                while True:
+                    async with self._condition:
+                        member = self._select_member()
+                        if member is not None:
+                            self._load[member] += 1
+                            return member
+                        if len(self._members) + self._opening >= self.max_sessions:
+                            self._waiters += 1
+                            try:
+                                await self._condition.wait()
+                            finally:
+                                self._waiters -= 1
+                            continue
+                        self._opening += 1
+
+                    # Open the new connection outside the lock so other calls proceed
+                    try:
+                        member = await self._open_member()
+                    finally:
+                        async with self._condition:
+                            self._opening -= 1
+                            self._condition.notify_all()
+
+                    async with self._condition:
+                        self._add_member(member)
+                        self._load[member] += 1
+                        return member
+        except TimeoutError:
+            raise TimeoutError(
+                f"Timed out after {self.acquire_timeout}s waiting for a pooled connection"
+            ) from None
+
+    async def _open_member(self) -> BaseConnector:
+        """Create, connect and (if the pool is initialized) initialize a connection."""
+        member = self.connector_factory()
+        await member.connect()
+        try:
+            if self._initialized:
+                await member.client.initialize()
+        except BaseException:
+            await member.disconnect()
+            raise
+        logger.debug(f"Grew connection pool to {len(self._members) + 1} connections")
+        return member
+
+    async def _release(self, member: BaseConnector) -> None:
+        """Return a connection reserved by _acquire to the pool."""
+        async with self._condition:
+            if member in self._load:
+                self._load[member] -= 1
+            self._condition.notify()
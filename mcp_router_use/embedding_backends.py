@@ -0,0 +1,157 @@
+"""
+Embedding backends for tool search.
+
+This module provides the interface that turns tool descriptions and queries
+into vectors, a fastembed implementation backed by an ONNX model, and a
+dependency-free hashed n-gram implementation that needs no download and starts
+instantly, for air-gapped hosts, CI and fast startup.
+"""
+
+import zlib
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+from .lexical_index import tokenize
+
+
+class EmbeddingBackend(ABC):
+    """Abstract base class for embedding backends.
+
+    A backend's name identifies the model and its settings. Embeddings from
+    backends with different names are never mixed, e.g. in the on-disk
+    embedding cache or the process-wide model registry.
+    """
+
+    name: str
+
+    def load(self) -> None:  # noqa: B027
+        """Prepare the backend, e.g. download and initialize a model.
+
+        Called once, off the event loop, before the first embed call. The default
+        does nothing.
+        """
+
+    @abstractmethod
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """Embed texts.
+
+        Args:
+            texts: The texts to embed.
+
+        Returns:
+            A float32 matrix with one row per text.
+        """
+
+
+class FastEmbedBackend(EmbeddingBackend):
+    """Embeddings from a fastembed ONNX model; requires the "search" extra."""
+
+    def __init__(self, model_name: str = "BAAI/bge-small-en-v1.5") -> None:
+        """Initialize the backend; the model is loaded by load.
+
+        Args:
+            model_name: The fastembed model to use.
+        """
+        self.model_name = model_name
+        self.name = model_name
+        self._model = None
+
+    def load(self) -> None:
+        """Download the model if needed and start an ONNX session."""
+        if self._model is None:
+            # fastembed is an optional dependency (the "search" extra)
+            from fastembed import TextEmbedding
+
+            self._model = TextEmbedding(model_name=self.model_name)
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        self.load()
+        return np.asarray(list(self._model.embed(texts)), dtype=np.float32)
+
+
+@lru_cache(maxsize=1 << 16)
+def _bucket(feature: str, dimensions: int) -> tuple[int, float]:
+    """Hash a feature to a stable (dimension, sign) pair."""
+    digest = zlib.crc32(feature.encode())
+    return digest % dimensions, 1.0 if digest & 0x80000000 else -1.0
+
+
+class HashingBackend(EmbeddingBackend):
+    """Dependency-free embeddings from hashed words and character n-grams.
+
+    Each word and each character n-gram of a word is hashed to a signed
+    dimension (the hashing trick), so texts sharing words or word fragments,
+    such as "file" and "files", get similar vectors. Unlike a neural model it
+    captures no synonyms, but it needs no download and starts instantly.
+    """
+
+    def __init__(self, dimensions: int = 384, ngram_range: tuple[int, int] = (3, 5)) -> None:
+        """Initialize the backend.
+
+        Args:
+            dimensions: Length of the embedding vectors.
+            ngram_range: Smallest and largest character n-gram length.
+        """
+        self.dimensions = dimensions
+        self.ngram_range = (int(ngram_range[0]), int(ngram_range[1]))
+        self.name = f"hashing-{dimensions}-{self.ngram_range[0]}-{self.ngram_range[1]}"
+
+    def _features(self, text: str) -> list[str]:
+        """Get the words of a text and the character n-grams of each word."""
+        words = tokenize(text)
+        features = [f"w:{word}" for word in words]
+        smallest, largest = self.ngram_range
+        for word in words:
+            padded = f"<{word}>"
+            for n in range(smallest, min(largest, len(padded)) + 1):
+                features.extend(padded[i : i + n] for i in range(len(padded) - n + 1))
+        return features
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        rows = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            buckets = [_bucket(feature, self.dimensions) for feature in self._features(text)]
+            if buckets:
+                indices, signs = zip(*buckets, strict=True)
+                rows[row] = np.bincount(indices, weights=signs, minlength=self.dimensions)
+        return rows
+
+
+EMBEDDING_BACKENDS: dict[str, type[EmbeddingBackend]] = {
+    "fastembed": FastEmbedBackend,
+    "hashing": HashingBackend,
+}
+
+
+def create_embedding_backend(
+    config: str | dict[str, Any] | EmbeddingBackend | None = None,
+) -> EmbeddingBackend:
+    """Create an embedding backend from its configuration.
+
+    Args:
+        config: A backend, a backend type name ("fastembed" or "hashing"), or a dict
+            with a "type" key and the backend's constructor arguments, e.g.
+            {"type": "hashing", "dimensions": 512}. Defaults to fastembed.
+
+    Returns:
+        The embedding backend.
+
+    Raises:
+        ValueError: If the backend type is unknown.
+    """
+    if isinstance(config, EmbeddingBackend):
+        return config
+    if config is None:
+        config = "fastembed"
+    if isinstance(config, str):
+        config = {"type": config}
+    options = dict(config)
+    backend_type = options.pop("type", "fastembed")
+    if backend_type not in EMBEDDING_BACKENDS:
+        raise ValueError(
+            f"Unknown embedding backend '{backend_type}'; use one of {list(EMBEDDING_BACKENDS)}"
+        )
+    return EMBEDDING_BACKENDS[backend_type](**options)
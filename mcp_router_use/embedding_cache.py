@@ -0,0 +1,192 @@
+"""
+Persistent cache of tool text embeddings.
+
+This module stores embeddings on disk in a content-addressed layout keyed by
+the embedding model and a hash of the embedded text, so the tool search index
+only embeds new or changed tool descriptions across restarts and reindexes.
+"""
+
+import hashlib
+import os
+import re
+import secrets
+import tempfile
+import time
+
+import numpy as np
+
+from .logging import logger
+
+_SEGMENT_PREFIX = "segment-"
+
+# Segments kept before the smaller half of them is merged into one
+_MAX_SEGMENTS = 16
+
+
+class EmbeddingCache:
+    """On-disk, memory-mapped store of embeddings for one model.
+
+    Embeddings live in append-only segment files. Each segment is one ``.npy``
+    record array pairing the SHA-256 digest of (model name, text) with its
+    float32 embedding, written atomically, so concurrent processes never see
+    keys without their rows or another writer's rows. Adding embeddings writes
+    only the new rows as a new segment; once there are more than _MAX_SEGMENTS,
+    the smaller half is merged, so large segments are rarely rewritten.
+    Segments are opened with memory mapping, so only the rows that are looked
+    up are read.
+    """
+
+    def __init__(self, cache_dir: str, model_name: str) -> None:
+        """Initialize the embedding cache.
+
+        Args:
+            cache_dir: Directory the cache files are stored in.
+            model_name: Name of the embedding model; each model gets its own store.
+        """
+        self.model_name = model_name
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", model_name)
+        self.directory = os.path.join(os.path.expanduser(cache_dir), safe_name)
+        self._segments: dict[str, np.ndarray | None] = {}  # File name to segment
+        self._rows: dict[bytes, tuple[np.ndarray, int]] = {}  # Key to (segment, row)
+        self._dimensions: int | None = None
+
+    def key(self, text: str) -> bytes:
+        """Hash a text together with the model name.
+
+        Args:
+            text: The embedded text.
+
+        Returns:
+            The hex digest identifying the embedding.
+        """
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode()).hexdigest().encode()
+
+    def _load(self) -> None:
+        """Memory-map segments not loaded yet, including those written by other processes."""
+        try:
+            names = sorted(
+                name
+                for name in os.listdir(self.directory)
+                if name.startswith(_SEGMENT_PREFIX) and name.endswith(".npy")
+            )
+        except FileNotFoundError:
+            return
+        for name in names:
+            if name in self._segments:
+                continue
+            try:
+                segment = np.load(os.path.join(self.directory, name), mmap_mode="r")
+                if segment.dtype.names != ("key", "vector") or segment.ndim != 1:
+                    raise ValueError("not an embedding segment")
+            except FileNotFoundError:
+                # Merged into another segment meanwhile
+                continue
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable embedding cache segment '{name}': {e}")
+                self._segments[name] = None
+                continue
+            self._add_segment(name, segment)
+
+    def _add_segment(self, name: str, segment: np.ndarray) -> None:
+        """Make the rows of a segment available for lookups."""
+        dimensions = segment.dtype["vector"].shape[0]
+        if self._dimensions is not None and dimensions != self._dimensions:
+            logger.warning("Embedding dimensions changed; discarding older cached embeddings")
+            self._rows = {}
+        self._dimensions = dimensions
+        self._segments[name] = segment
+        for row, key in enumerate(segment["key"].tolist()):
+            self._rows[key] = (segment, row)
+
+    def get_many(self, texts: list[str]) -> list[np.ndarray | None]:
+        """Look up the embeddings of several texts.
+
+        Args:
+            texts: The texts to look up.
+
+        Returns:
+            The cached embedding of each text, or None where it is not cached.
+        """
+        self._load()
+        results: list[np.ndarray | None] = []
+        for text in texts:
+            location = self._rows.get(self.key(text))
+            if location is None:
+                results.append(None)
+            else:
+                segment, row = location
+                results.append(np.asarray(segment["vector"][row]))
+        return results
+
+    def put_many(self, texts: list[str], embeddings: np.ndarray) -> None:
+        """Add the embeddings of several texts to the store.
+
+        Args:
+            texts: The embedded texts.
+            embeddings: One embedding row per text.
+        """
+        self._load()
+        new_keys, new_rows, seen = [], [], set(self._rows)
+        for text, embedding in zip(texts, embeddings, strict=True):
+            key = self.key(text)
+            if key not in seen:
+                seen.add(key)
+                new_keys.append(key)
+                new_rows.append(embedding)
+        if not new_keys:
+            return
+
+        vectors = np.asarray(new_rows, dtype=np.float32)
+        segment = np.empty(
+            len(new_keys), dtype=[("key", "S64"), ("vector", np.float32, (vectors.shape[1],))]
+        )
+        segment["key"] = new_keys
+        segment["vector"] = vectors
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            self._write_segment(segment)
+            if len(self._segments) > _MAX_SEGMENTS:
+                self._merge_small_segments()
+        except OSError as e:
+            logger.warning(f"Could not write embedding cache in '{self.directory}': {e}")
+
+    def _merge_small_segments(self) -> None:
+        """Merge the smaller half of the segments into one and delete the merged files."""
+        loaded = sorted(
+            (len(segment), name) for name, segment in self._segments.items() if segment is not None
+        )
+        merged_names = {name for _, name in loaded[: len(loaded) // 2 + 1]}
+        # Keep only the rows lookups resolve to, dropping duplicates and stale dimensions
+        live = []
+        for name in merged_names:
+            segment = self._segments[name]
+            rows = []
+            for row, key in enumerate(segment["key"].tolist()):
+                location = self._rows.get(key)
+                if location is not None and location[0] is segment and location[1] == row:
+                    rows.append(row)
+            if rows:
+                live.append(segment[rows])
+        if live:
+            self._write_segment(np.concatenate(live))
+        for name in merged_names:
+            del self._segments[name]
+            try:
+                # Other processes keep reading their memory maps of the deleted files
+                os.unlink(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+    def _write_segment(self, segment: np.ndarray) -> None:
+        """Write a segment atomically so concurrent processes never read a partial file."""
+        name = f"{_SEGMENT_PREFIX}{time.time_ns():020d}-{os.getpid()}-{secrets.token_hex(4)}.npy"
+        path = os.path.join(self.directory, name)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, segment)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._add_segment(name, np.load(path, mmap_mode="r"))
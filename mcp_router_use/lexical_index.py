@@ -0,0 +1,138 @@
+"""
+Lexical index for tool search.
+
+This module provides a BM25 inverted index over tool names, descriptions and
+input-schema property names. It needs no model, so tool search can answer
+keyword queries before embeddings are ready or when no embedding model can be
+loaded.
+"""
+
+import heapq
+import math
+import re
+from collections import Counter
+from collections.abc import Callable
+from operator import itemgetter
+
+_CAMEL_CASE_RE = re.compile(r"([a-z0-9])([A-Z])")
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase terms.
+
+    camelCase and snake_case identifiers are split into their words, and each
+    compound identifier (such as ``read_file``) is also kept whole, so exact
+    tool-name queries score highest.
+
+    Args:
+        text: The text to tokenize.
+
+    Returns:
+        The terms of the text.
+    """
+    text = _CAMEL_CASE_RE.sub(r"\1 \2", text).lower()
+    tokens = _WORD_RE.findall(text)
+    for word in text.split():
+        word = word.strip(".,:;!?()[]{}'\"")
+        if word and not word.isalnum() and len(_WORD_RE.findall(word)) > 1:
+            tokens.append(word)
+    return tokens
+
+
+class BM25Index:
+    """Inverted index that ranks documents with Okapi BM25.
+
+    Documents are identified by name and can be added, replaced and removed
+    individually; document frequencies are kept up to date, so scores always
+    reflect the current set of documents.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75) -> None:
+        """Initialize an empty index.
+
+        Args:
+            k1: Term frequency saturation.
+            b: Strength of document length normalization.
+        """
+        self.k1 = k1
+        self.b = b
+        self._postings: dict[str, dict[str, int]] = {}
+        self._doc_terms: dict[str, Counter] = {}
+        self._doc_lengths: dict[str, int] = {}
+        self._total_length = 0
+
+    def add(self, name: str, tokens: list[str]) -> None:
+        """Add a document, replacing any document with the same name.
+
+        Args:
+            name: The name of the document.
+            tokens: The terms of the document.
+        """
+        self.remove(name)
+        terms = Counter(tokens)
+        self._doc_terms[name] = terms
+        self._doc_lengths[name] = len(tokens)
+        self._total_length += len(tokens)
+        for term, frequency in terms.items():
+            self._postings.setdefault(term, {})[name] = frequency
+
+    def remove(self, name: str) -> None:
+        """Remove a document if present.
+
+        Args:
+            name: The name of the document.
+        """
+        terms = self._doc_terms.pop(name, None)
+        if terms is None:
+            return
+        self._total_length -= self._doc_lengths.pop(name)
+        for term in terms:
+            postings = self._postings[term]
+            del postings[name]
+            if not postings:
+                del self._postings[term]
+
+    def search(
+        self,
+        tokens: list[str],
+        top_k: int,
+        allowed: Callable[[str], bool] | None = None,
+    ) -> list[tuple[str, float]]:
+        """Rank documents against query terms.
+
+        Args:
+            tokens: The terms of the query.
+            top_k: Maximum number of documents to return.
+            allowed: Predicate on document names; other documents are skipped
+                without being scored. Term statistics still cover every document.
+
+        Returns:
+            (document name, BM25 score) pairs in descending score order.
+        """
+        num_docs = len(self._doc_terms)
+        if not num_docs or top_k <= 0:
+            return []
+        average_length = self._total_length / num_docs or 1.0
+
+        scores: dict[str, float] = {}
+        for term in set(tokens):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (num_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+            for name, frequency in postings.items():
+                if allowed is not None and not allowed(name):
+                    continue
+                length = self._doc_lengths[name]
+                norm = self.k1 * (1 - self.b + self.b * length / average_length)
+                scores[name] = scores.get(name, 0.0) + idf * frequency * (self.k1 + 1) / (
+                    frequency + norm
+                )
+        return heapq.nlargest(top_k, scores.items(), key=itemgetter(1))
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._doc_terms
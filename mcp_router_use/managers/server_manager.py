@@ -12,6 +12,7 @@ from .tools import (
     SearchToolsTool,
     UseToolFromServerTool,
 )
+from .tools.search_tools import ToolSearchEngine
 
 
 class ServerManager:
@@ -33,6 +34,7 @@ class ServerManager:
         self.active_server: str | None = None
         self.initialized_servers: dict[str, bool] = {}
         self._server_tools: dict[str, list[BaseTool]] = {}
+        self.search_engine = ToolSearchEngine(server_manager=self)
 
     async def initialize(self) -> None:
         """Initialize the server manager and prepare server management tools."""
@@ -40,49 +42,57 @@ class ServerManager:
         if not self.client.get_server_names():
             logger.warning("No MCP servers defined in client configuration")
 
+        # Build the tool search index in the background so the first search only waits if needed
+        self.search_engine.start_background_indexing()
+
+    def close(self) -> None:
+        """Stop background tool indexing and release the shared embedding model."""
+        self.search_engine.close()
+
     async def _prefetch_server_tools(self) -> None:
         """Pre-fetch tools for all servers to populate the tool search index."""
-        servers = self.client.get_server_names()
-        for server_name in servers:
+        for server_name in self.client.get_server_names():
+            await self._prefetch_tools_for_server(server_name)
+
+    async def _prefetch_tools_for_server(self, server_name: str) -> None:
+        """Pre-fetch the tools of one server into the tool search cache."""
+        try:
+            # Only create session if needed, don't set active
+            session = None
             try:
-                # Only create session if needed, don't set active
-                session = None
+                session = await self.client.get_session(server_name)
+                logger.debug(
+                    f"Using existing session for server '{server_name}' to prefetch tools."
+                )
+            except ValueError:
                 try:
-                    session = self.client.get_session(server_name)
+                    session = await self.client.create_session(server_name)
+                    logger.debug(
+                        f"Temporarily created session for '{server_name}' to prefetch tools"
+                    )
+                except Exception:
+                    logger.warning(f"Could not create session for '{server_name}' during prefetch")
+                    return
+
+            # Fetch tools if session is available
+            if session:
+                connector = session.connector
+                tools = await self.adapter._create_tools_from_connectors([connector])
+
+                # Check if this server's tools have changed
+                if (
+                    server_name not in self._server_tools
+                    or self._server_tools[server_name] != tools
+                ):
+                    self._server_tools[server_name] = tools  # Cache tools
+                    self.initialized_servers[server_name] = True  # Mark as initialized
+                    logger.debug(f"Prefetched {len(tools)} tools for server '{server_name}'.")
+                else:
                     logger.debug(
-                        f"Using existing session for server '{server_name}' to prefetch tools."
+                        f"Tools for server '{server_name}' unchanged, using cached version."
                     )
-                except ValueError:
-                    try:
-                        session = await self.client.create_session(server_name)
-                        logger.debug(
-                            f"Temporarily created session for '{server_name}' to prefetch tools"
-                        )
-                    except Exception:
-                        logger.warning(
-                            f"Could not create session for '{server_name}' during prefetch"
-                        )
-                        continue
-
-                # Fetch tools if session is available
-                if session:
-                    connector = session.connector
-                    tools = await self.adapter._create_tools_from_connectors([connector])
-
-                    # Check if this server's tools have changed
-                    if (
-                        server_name not in self._server_tools
-                        or self._server_tools[server_name] != tools
-                    ):
-                        self._server_tools[server_name] = tools  # Cache tools
-                        self.initialized_servers[server_name] = True  # Mark as initialized
-                        logger.debug(f"Prefetched {len(tools)} tools for server '{server_name}'.")
-                    else:
-                        logger.debug(
-                            f"Tools for server '{server_name}' unchanged, using cached version."
-                        )
-            except Exception as e:
-                logger.error(f"Error prefetching tools for server '{server_name}': {e}")
+        except Exception as e:
+            logger.error(f"Error prefetching tools for server '{server_name}': {e}")
 
     @property
     def tools(self) -> list[BaseTool]:
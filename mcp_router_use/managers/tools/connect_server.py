@@ -38,7 +38,7 @@ class ConnectServerTool(MCPServerTool):
         try:
             # Create or get session for this server
             try:
-                session = self.server_manager.client.get_session(server_name)
+                session = await self.server_manager.client.get_session(server_name)
                 logger.debug(f"Using existing session for server '{server_name}'")
             except ValueError:
                 logger.debug(f"Creating new session for server '{server_name}'")
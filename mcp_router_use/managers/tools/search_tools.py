@@ -1,16 +1,69 @@
 import asyncio
-import time
-from typing import ClassVar
+import heapq
+import sys
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Any, ClassVar, NamedTuple
 
 import numpy as np
-from fastembed import TextEmbedding
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from ...ann_index import IVFIndex
+from ...embedding_backends import EmbeddingBackend, create_embedding_backend
+from ...embedding_cache import EmbeddingCache
+from ...lexical_index import BM25Index, tokenize
 from ...logging import logger
+from ...model_registry import model_registry
+from ...quantization import EMBEDDING_DTYPES, quantize_rows, score_rows
+from ...shared_index import PublishedTool, SharedIndex, SharedIndexStore, StringTable, text_hash
+from ...utils import LRUCache, as_completed_bounded
 from .base_tool import MCPServerTool
 
 
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length, leaving all-zero rows unchanged."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return np.ascontiguousarray(vectors / norms, dtype=np.float32)
+
+
+def _normalize_query(query: str) -> str:
+    """Normalize query text so trivial variations in case and whitespace share cache entries."""
+    return " ".join(query.lower().split())
+
+
+def _tool_terms(tool: BaseTool) -> list[str]:
+    """Get the keyword index terms of a tool: its name (weighted twice), description and
+    input-schema property names."""
+    try:
+        properties = list(getattr(tool, "args", None) or {})
+    except Exception:
+        properties = []
+    name_terms = tokenize(tool.name)
+    return name_terms * 2 + tokenize(tool.description or "") + tokenize(" ".join(properties))
+
+
+def _tool_text(tool: BaseTool) -> str:
+    """Get the searchable text of a tool, lowercased for case-insensitive search."""
+    return f"{tool.name}: {tool.description}".lower()
+
+
+class _SearchPlan(NamedTuple):
+    """A search before its query is embedded; see ToolSearchEngine._plan_search."""
+
+    key: str  # Normalized query
+    scope: tuple[str, ...] | None  # Servers searched, or None for all
+    depth: int  # Number of semantic results ranked
+    top_k: int
+    boost_server: str | None
+    semantic: list[tuple[BaseTool, str, float]] | None  # Cached semantic ranking
+    query_vector: np.ndarray | None
+    needs_embedding: bool  # Whether the query must be embedded for a semantic ranking
+
+
 class ToolSearchInput(BaseModel):
     """Input for searching for tools across MCP servers"""
 
@@ -19,6 +72,18 @@ class ToolSearchInput(BaseModel):
         default=100,
         description="The maximum number of tools to return (defaults to 100)",
     )
+    servers: list[str] | None = Field(
+        default=None,
+        description="Only search the tools of these servers (defaults to all servers)",
+    )
+    connected_only: bool = Field(
+        default=False,
+        description="Only search the tools of servers that are currently connected",
+    )
+    prefer_active_server: bool = Field(
+        default=False,
+        description="Rank tools of the active server higher",
+    )
 
 
 class SearchToolsTool(MCPServerTool):
@@ -38,20 +103,35 @@ class SearchToolsTool(MCPServerTool):
     def __init__(self, server_manager):
         """Initialize with server manager and create a search tool."""
         super().__init__(server_manager)
-        self._search_tool = ToolSearchEngine(server_manager=server_manager)
+        self._search_tool = server_manager.search_engine
 
-    async def _arun(self, query: str, top_k: int = 100) -> str:
+    async def _arun(
+        self,
+        query: str,
+        top_k: int = 100,
+        servers: list[str] | None = None,
+        connected_only: bool = False,
+        prefer_active_server: bool = False,
+    ) -> str:
         """Search for tools across all MCP servers using semantic search."""
         # Make sure the index is ready, and if not, allow the search_tools method to handle it
         # No need to manually check or build the index here as the search_tools method will do that
 
         # Perform search using our search tool instance
         results = await self._search_tool.search_tools(
-            query, top_k=top_k, active_server=self.server_manager.active_server
+            query,
+            top_k=top_k,
+            active_server=self.server_manager.active_server,
+            servers=servers,
+            connected_only=connected_only,
+            prefer_active_server=prefer_active_server,
         )
+        if isinstance(results, str):
+            # The engine explains why there are no results
+            return results
         return self.format_search_results(results)
 
-    def _run(self, query: str, top_k: int = 100) -> str:
+    def _run(self, query: str, top_k: int = 100, **kwargs) -> str:
         """Synchronous version that raises a NotImplementedError - use _arun instead."""
         raise NotImplementedError("SearchToolsTool requires async execution. Use _arun instead.")
 
@@ -86,40 +166,302 @@ class ToolSearchEngine:
     Uses vector similarity for semantic search with optional result caching.
     """
 
-    def __init__(self, server_manager=None, use_caching: bool = True):
+    model_name: ClassVar[str] = "BAAI/bge-small-en-v1.5"
+    min_cached_depth: ClassVar[int] = 100
+    rrf_k: ClassVar[int] = 60  # Rank offset of reciprocal rank fusion
+
+    def __init__(
+        self,
+        server_manager=None,
+        use_caching: bool = True,
+        embedding_cache_dir: str | None = None,
+        embedding_workers: int | None = None,
+        query_cache_size: int | None = None,
+        query_cache_ttl: float | None = None,
+        ann_min_tools: int | None = None,
+        embedding_dtype: str | None = None,
+        embedding_backend: str | dict[str, Any] | EmbeddingBackend | None = None,
+        shared_index_dir: str | None = None,
+    ):
         """
         Initialize the tool search engine.
 
         Args:
             server_manager: The ServerManager instance to get tools from
             use_caching: Whether to cache query results
+            embedding_cache_dir: Directory for persisted tool embeddings; defaults to
+                mcpRouter.embedding_cache_dir in the client config, if any
+            embedding_workers: Threads used for model loading and embedding; defaults to
+                mcpRouter.embedding_workers in the client config, or 1
+            query_cache_size: Maximum number of cached queries; defaults to
+                mcpRouter.query_cache_size in the client config, or 1024
+            query_cache_ttl: Seconds cached query results stay fresh; defaults to
+                mcpRouter.query_cache_ttl in the client config, or 600
+            ann_min_tools: Catalog size from which searches use an approximate
+                nearest-neighbour index instead of scoring every tool; defaults to
+                mcpRouter.ann_min_tools in the client config, or 10000
+            embedding_dtype: Storage type of tool embeddings, "float32", "float16" or
+                "int8"; defaults to mcpRouter.embedding_dtype in the client config, or
+                "float32"
+            embedding_backend: Embedding backend, its type name ("fastembed" or "hashing")
+                or a dict with its "type" and options; defaults to
+                mcpRouter.embedding_backend in the client config, or fastembed with
+                model_name
+            shared_index_dir: Directory through which processes on one host share the
+                index, see attach_index and publish_index; defaults to
+                mcpRouter.shared_index_dir in the client config, if any
+
+        Raises:
+            ValueError: If embedding_dtype or the embedding backend type is not supported
         """
         self.server_manager = server_manager
         self.use_caching = use_caching
         self.is_indexed = False
 
-        # Initialize model components (loaded on demand)
+        # Initialize model components (loaded on demand, shared process-wide)
         self.model = None
         self.embedding_function = None
+        self.model_registry = model_registry
+        self._model_error: Exception | None = None
+
+        router_config = {}
+        if server_manager is not None:
+            router_config = server_manager.client.config.get("mcpRouter", {})
+
+        if embedding_backend is None:
+            embedding_backend = router_config.get(
+                "embedding_backend", {"type": "fastembed", "model_name": self.model_name}
+            )
+        self.embedding_backend = create_embedding_backend(embedding_backend)
+        self._model_key: str | None = None  # Registry name of the acquired backend
+
+        # ONNX inference releases the GIL, so a thread pool keeps the event loop responsive
+        if embedding_workers is None:
+            embedding_workers = router_config.get("embedding_workers", 1)
+        self.embedding_workers = max(1, embedding_workers)
+        self._executor: ThreadPoolExecutor | None = None
+        self._index_lock = asyncio.Lock()
+        self._model_lock = threading.Lock()
+
+        # On-disk embeddings, so only new or changed tool texts are embedded
+        if embedding_cache_dir is None:
+            embedding_cache_dir = router_config.get("embedding_cache_dir")
+        self.embedding_cache = (
+            EmbeddingCache(embedding_cache_dir, self.embedding_backend.name)
+            if embedding_cache_dir
+            else None
+        )
+
+        # Ranked results and embeddings of recent queries, keyed by normalized query text
+        if query_cache_size is None:
+            query_cache_size = router_config.get("query_cache_size", 1024)
+        if query_cache_ttl is None:
+            query_cache_ttl = router_config.get("query_cache_ttl", 600)
+        self.query_cache = LRUCache(query_cache_size, ttl=query_cache_ttl)
+        self.query_embeddings = LRUCache(query_cache_size)
+
+        # Approximate search for large catalogs, kept in step with embedding_matrix
+        if ann_min_tools is None:
+            ann_min_tools = router_config.get("ann_min_tools", 10000)
+        self.ann_min_tools = ann_min_tools
+        self.ann_probes: int | None = router_config.get("ann_probes")
+        self.ann_index: IVFIndex | None = None
+
+        # Fraction of the way to a perfect score that active server tools are moved when preferred
+        self.active_server_boost: float = router_config.get("active_server_boost", 0.2)
+
+        # Quantized storage trades a little ranking precision for 2-4x smaller embeddings
+        if embedding_dtype is None:
+            embedding_dtype = router_config.get("embedding_dtype", "float32")
+        if embedding_dtype not in EMBEDDING_DTYPES:
+            raise ValueError(
+                f"Unsupported embedding dtype '{embedding_dtype}'; use one of {EMBEDDING_DTYPES}"
+            )
+        self.embedding_dtype = embedding_dtype
+
+        # Data storage: parallel per-row arrays instead of per-tool dicts. Rows are grouped
+        # by server, so each server's rows are one contiguous partition of the matrix
+        self.embedding_matrix: np.ndarray | None = None  # Unit-norm rows, one per tool
+        self.embedding_scales: np.ndarray | None = None  # Per-row scale of int8 rows
+        self.tool_names: list[str] = []  # Interned tool name of each matrix row
+        self.tools: list[BaseTool] = []  # Tool instance of each matrix row
+        self.server_ids = np.zeros(0, dtype=np.int32)  # Server id of each matrix row
+        self.server_names: list[str] = []  # Server name of each server id
+        self._server_ids: dict[str, int] = {}  # Maps server name to server id
+        self._partitions: dict[int, tuple[int, int]] | None = None  # Server id to row range
+        self._indexed_tools = {}  # Maps server name to the tool list it was indexed from
+
+        # Index published by one process and memory-mapped read-only by the others
+        if shared_index_dir is None:
+            shared_index_dir = router_config.get("shared_index_dir")
+        self.shared_index = SharedIndexStore(shared_index_dir) if shared_index_dir else None
+        self.attached_version: int | None = None
+        # Text hashes of attached servers' tools, until fetched tools are matched against them
+        self._attached_hashes: dict[str, dict[str, int]] = {}
+        self._index_changed = False  # Whether the index differs from the attached one
 
-        # Data storage
-        self.tool_embeddings = {}  # Maps tool name to embedding vector
-        self.tools_by_name = {}  # Maps tool name to tool instance
-        self.server_by_tool = {}  # Maps tool name to server name
-        self.tool_texts = {}  # Maps tool name to searchable text
-        self.query_cache = {}  # Caches search results by query
+        # Keyword index, updated as soon as tools are known and usable without the model
+        self.lexical_index = BM25Index()
+        self._lexical_tools: dict[str, tuple[BaseTool, str]] = {}  # Name to (tool, server)
+
+        # Background index build started by ServerManager.initialize. Searches wait this many
+        # seconds (None: no limit) for every server's tools, then search those loaded so far
+        self.index_wait_timeout: float | None = router_config.get("index_wait_timeout", 10)
+        self.servers_indexed = 0
+        self.servers_total = 0
+        self._servers_fetched = 0
+        self._index_task: asyncio.Task | None = None
+        self._searchable = asyncio.Event()
+        self._ready = asyncio.Event()
 
     def _load_model(self) -> bool:
         """Load the embedding model for semantic search if not already loaded."""
         if self.model is not None:
             return True
 
+        # Executor threads may race to load the model; only one of them does
+        with self._model_lock:
+            if self.model is not None:
+                return True
+            if self._model_error is not None:
+                # Don't retry a failed download on every search; keyword search still works
+                return False
+            try:
+                key = self.embedding_backend.name
+                backend = self.model_registry.acquire(key, self._load_backend)
+                self.embedding_function = backend.embed
+                self.model = backend
+                self._model_key = key
+                return True
+            except Exception as e:
+                logger.warning(f"Could not load embedding model, using keyword search only: {e}")
+                self._model_error = e
+                return False
+
+    def _load_backend(self) -> EmbeddingBackend:
+        """Load this engine's embedding backend for the model registry."""
+        self.embedding_backend.load()
+        return self.embedding_backend
+
+    @property
+    def progress(self) -> tuple[int, int]:
+        """Get the background index build progress as (servers indexed, total servers)."""
+        return self.servers_indexed, self.servers_total
+
+    def start_background_indexing(self, max_concurrency: int = 10) -> asyncio.Task:
+        """
+        Start indexing every server's tools in the background, if not already started.
+
+        A build that finished or was cancelled without indexing anything is started again.
+
+        Servers are indexed as soon as their tools are fetched, so progress is
+        reported per server and searches can wait on wait_until_ready.
+
+        Args:
+            max_concurrency: Maximum number of servers whose tools are fetched at once
+
+        Returns:
+            The background indexing task
+        """
+        if self._index_task is not None and self._index_task.done() and not self.is_indexed:
+            self._reset_background_indexing()
+        if self._index_task is None:
+            server_names = self.server_manager.client.get_server_names()
+            self.servers_indexed = 0
+            self.servers_total = len(server_names)
+            self._servers_fetched = 0
+            if not server_names:
+                self._searchable.set()
+            self._index_task = asyncio.create_task(
+                self._index_in_background(server_names, max_concurrency)
+            )
+        return self._index_task
+
+    def _reset_background_indexing(self) -> None:
+        """Forget the background build so the next start_background_indexing begins anew."""
+        self._index_task = None
+        self._searchable = asyncio.Event()
+        self._ready = asyncio.Event()
+
+    async def wait_until_searchable(self, timeout: float | None = None) -> bool:
+        """
+        Wait until every server's tools are fetched and keyword search covers them, or
+        until a shared index is attached.
+
+        Embeddings may still be building; searches meanwhile use keyword ranking only.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait as long as needed
+
+        Returns:
+            True if the index is searchable, False if indexing has not started or the wait
+            timed out
+        """
+        if self._index_task is None:
+            return False
         try:
-            self.model = TextEmbedding(model_name="BAAI/bge-small-en-v1.5")
-            self.embedding_function = lambda texts: list(self.model.embed(texts))
-            return True
-        except Exception:
+            await asyncio.wait_for(self._searchable.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    async def wait_until_ready(self, timeout: float | None = None) -> bool:
+        """
+        Wait for the background index build to finish.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait as long as needed
+
+        Returns:
+            True if the build finished, False if it has not started or the wait timed out
+        """
+        if self._index_task is None:
             return False
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    async def _index_in_background(self, server_names: list[str], max_concurrency: int) -> None:
+        """Fetch and index each server's tools, then mark the index as ready."""
+        # Events of this build; close replaces them while a cancelled build unwinds
+        searchable, ready = self._searchable, self._ready
+        try:
+            # An attached index is searchable before any server's tools are fetched
+            if self.shared_index is not None and not self.is_indexed:
+                if await self.attach_index():
+                    searchable.set()
+
+            async def index_server(server_name: str) -> None:
+                try:
+                    await self.server_manager._prefetch_tools_for_server(server_name)
+                    tools = self.server_manager._server_tools.get(server_name)
+                    if tools is not None:
+                        self._upsert_lexical(server_name, tools)
+                finally:
+                    self._servers_fetched += 1
+                    if self._servers_fetched == self.servers_total:
+                        searchable.set()
+                if tools is not None and not self._adopt_attached(server_name, tools):
+                    await self.upsert_server(server_name, tools)
+
+            factories = [lambda name=name: index_server(name) for name in server_names]
+            async for index, result in as_completed_bounded(factories, max_concurrency):
+                if isinstance(result, Exception):
+                    logger.warning(f"Could not index tools of '{server_names[index]}': {result}")
+                self.servers_indexed += 1
+                logger.debug(f"Indexed {self.servers_indexed}/{self.servers_total} servers")
+
+            # Drop attached servers that are no longer configured, then share any changes
+            for server_name in set(self._attached_hashes) - set(server_names):
+                await self.remove_server(server_name)
+            if self.shared_index is not None and self._index_changed:
+                await self.publish_index()
+        finally:
+            # Release waiting searches even if indexing failed; they fall back to inline indexing
+            searchable.set()
+            ready.set()
 
     async def start_indexing(self) -> None:
         """Index the tools from the server manager."""
@@ -145,99 +487,809 @@ class ToolSearchEngine:
         Args:
             server_tools: dictionary mapping server names to their tools
         """
-        # Clear previous indexes
-        self.tool_embeddings = {}
-        self.tools_by_name = {}
-        self.server_by_tool = {}
-        self.tool_texts = {}
-        self.query_cache = {}
-        self.is_indexed = False
-
-        # Collect all tools and their descriptions
+        # Keyword search covers the new tools right away, before they are embedded
+        self.lexical_index = BM25Index()
+        self._lexical_tools = {}
         for server_name, tools in server_tools.items():
-            for tool in tools:
-                # Create text representation for search
-                tool_text = f"{tool.name}: {tool.description}"
+            self._upsert_lexical(server_name, tools)
+
+        async with self._index_lock:
+            # Collect all tools grouped by server; a later tool with the same name shadows
+            # an earlier one
+            rows: dict[str, tuple[BaseTool, str]] = {}
+            for server_name, tools in server_tools.items():
+                for tool in tools:
+                    rows.pop(tool.name, None)
+                    rows[tool.name] = (tool, server_name)
+
+            # Embed off the event loop; searches keep using the previous index meanwhile
+            stored, ann_index = None, None
+            if rows and await self._run_in_executor(self._load_model):
+                try:
+                    embeddings = await self._run_in_executor(
+                        self._embed_tool_texts, [_tool_text(tool) for tool, _ in rows.values()]
+                    )
+                    embedding_matrix = _normalize_rows(embeddings)
+                    if len(embedding_matrix) >= self.ann_min_tools:
+                        ann_index = await self._run_in_executor(
+                            self._build_ann_index, embedding_matrix
+                        )
+                    stored = quantize_rows(embedding_matrix, self.embedding_dtype)
+                except Exception:
+                    stored, ann_index = None, None
+
+            # Swap in the new index
+            self.embedding_matrix, self.embedding_scales = stored or (None, None)
+            self.ann_index = ann_index
+            if stored is None:
+                rows = {}
+            self.tool_names = [sys.intern(name) for name in rows]
+            self.tools = [tool for tool, _ in rows.values()]
+            self.server_ids = np.array(
+                [self._server_id(server_name) for _, server_name in rows.values()], dtype=np.int32
+            )
+            self._partitions = None
+            self.query_cache.clear()
+            self._indexed_tools = dict(server_tools)
+            self._attached_hashes = {}
+            self._index_changed = True
+
+            # Mark as indexed if we successfully embedded tools
+            self.is_indexed = len(self.tool_names) > 0
+
+    async def upsert_server(self, server_name: str, tools: list[BaseTool]) -> None:
+        """
+        Add or replace the tools of one server without rebuilding the whole index.
+
+        Only the server's rows are embedded and replaced, and only cached queries
+        whose results could change are invalidated.
+
+        Args:
+            server_name: The server whose tools changed
+            tools: The server's current tools
+        """
+        self._upsert_lexical(server_name, tools)
+        async with self._index_lock:
+            await self._upsert_server(server_name, tools)
+
+    async def _upsert_server(self, server_name: str, tools: list[BaseTool]) -> None:
+        """Add or replace the tools of one server; see upsert_server."""
+        if not await self._run_in_executor(self._load_model):
+            return
+
+        new_tools = list({tool.name: tool for tool in tools}.values())
+        new_matrix = None
+        if new_tools:
+            try:
+                new_matrix = _normalize_rows(
+                    await self._run_in_executor(
+                        self._embed_tool_texts, [_tool_text(tool) for tool in new_tools]
+                    )
+                )
+            except Exception:
+                return
+
+        # Drop the server's old rows and rows of other servers' tools it now shadows
+        new_names = [sys.intern(tool.name) for tool in new_tools]
+        self._remove_tools(self._tool_names_of(server_name) | set(new_names), new_matrix)
 
-                # Store tool information
-                self.tools_by_name[tool.name] = tool
-                self.server_by_tool[tool.name] = server_name
-                self.tool_texts[tool.name] = tool_text.lower()  # For case-insensitive search
+        if new_matrix is not None:
+            new_rows, new_scales = quantize_rows(new_matrix, self.embedding_dtype)
+            self._append_rows(server_name, new_tools, new_rows, new_scales, new_matrix)
 
-        if not self.tool_texts:
+        # Keep servers in indexing order, which decides who shadows whom on removal
+        self._indexed_tools.pop(server_name, None)
+        self._indexed_tools[server_name] = tools
+        self._attached_hashes.pop(server_name, None)
+        self._index_changed = True
+        self.is_indexed = len(self.tool_names) > 0
+        await self._refresh_ann_index()
+
+    def _append_rows(
+        self,
+        server_name: str,
+        tools: list[BaseTool],
+        rows: np.ndarray,
+        scales: np.ndarray | None,
+        unit_rows: np.ndarray,
+    ) -> None:
+        """Append the stored rows of a server's tools; the server must have no rows yet.
+
+        Args:
+            server_name: The server of the tools
+            tools: The tools, one per row
+            rows: Their embedding rows as stored, possibly quantized
+            scales: The per-row scales of int8 rows, or None
+            unit_rows: The rows as float32, for the approximate index; scaling a row
+                does not change its cluster
+        """
+        if self.embedding_matrix is None:
+            self.embedding_matrix, self.embedding_scales = rows, scales
+        else:
+            self.embedding_matrix = np.concatenate([self.embedding_matrix, rows])
+            if scales is not None:
+                self.embedding_scales = np.concatenate([self.embedding_scales, scales])
+        self.tool_names = self.tool_names + [sys.intern(tool.name) for tool in tools]
+        self.tools = self.tools + list(tools)
+        self.server_ids = np.concatenate([
+            self.server_ids,
+            np.full(len(tools), self._server_id(server_name), dtype=np.int32),
+        ])
+        self._partitions = None
+        if self.ann_index is not None:
+            self.ann_index.add(unit_rows)
+
+    async def _refresh_ann_index(self) -> None:
+        """Build, retrain or drop the approximate index as the catalog crosses ann_min_tools."""
+        matrix = self.embedding_matrix
+        if matrix is None or len(matrix) < self.ann_min_tools:
+            self.ann_index = None
+            return
+        if self.ann_index is not None and not self.ann_index.needs_retraining:
             return
 
-        # Generate embeddings
-        if self._load_model():
-            tool_names = list(self.tool_texts.keys())
-            tool_texts = [self.tool_texts[name] for name in tool_names]
+        # Searches keep using the current index, or exact search, while training
+        ann_index = await self._run_in_executor(self._build_ann_index, matrix)
+        if self.embedding_matrix is matrix:
+            self.ann_index = ann_index
 
+    def _build_ann_index(self, matrix: np.ndarray) -> IVFIndex:
+        """Train an approximate index on the embedding matrix."""
+        logger.debug(f"Training approximate tool search index on {len(matrix)} tools")
+        return IVFIndex(matrix, n_probe=self.ann_probes)
+
+    async def remove_server(self, server_name: str) -> None:
+        """
+        Remove the tools of one server from the index.
+
+        Tools of the remaining servers that the server's tools shadowed are indexed again.
+
+        Args:
+            server_name: The server to remove
+        """
+        self._remove_lexical(server_name)
+        async with self._index_lock:
+            names = self._tool_names_of(server_name)
+            names.update(tool.name for tool in self._indexed_tools.get(server_name, []))
+            self._remove_tools(self._tool_names_of(server_name))
+            self._indexed_tools.pop(server_name, None)
+            self._attached_hashes.pop(server_name, None)
+            await self._restore_shadowed(names)
+            self.is_indexed = len(self.tool_names) > 0
+        await self._refresh_ann_index()
+
+    async def _restore_shadowed(self, names: set[str]) -> None:
+        """Index again the tools with these names that remaining servers provide.
+
+        Of several remaining servers with the same tool name, the last indexed one wins,
+        as when they were indexed.
+        """
+        shadowed: dict[str, tuple[BaseTool, str]] = {}
+        for server_name, tools in self._indexed_tools.items():
+            for tool in tools:
+                if tool.name in names:
+                    shadowed[tool.name] = (tool, server_name)
+
+        restored: dict[str, list[BaseTool]] = {}
+        indexed_names = set(self.tool_names)
+        for name, (tool, server_name) in shadowed.items():
+            if name not in self._lexical_tools:
+                self.lexical_index.add(name, _tool_terms(tool))
+                self._lexical_tools[name] = (tool, server_name)
+            if name not in indexed_names:
+                restored.setdefault(server_name, []).append(tool)
+        if not restored or not await self._run_in_executor(self._load_model):
+            return
+
+        for server_name, tools in restored.items():
             try:
-                embeddings = self.embedding_function(tool_texts)
-                for name, embedding in zip(tool_names, embeddings, strict=True):
-                    self.tool_embeddings[name] = embedding
+                new_matrix = _normalize_rows(
+                    await self._run_in_executor(
+                        self._embed_tool_texts, [_tool_text(tool) for tool in tools]
+                    )
+                )
+            except Exception as e:
+                logger.warning(f"Could not restore shadowed tools of '{server_name}': {e}")
+                continue
+            new_rows, new_scales = quantize_rows(new_matrix, self.embedding_dtype)
+
+            # Append the server's other rows again with the restored ones, so its rows stay
+            # one contiguous partition
+            rows = np.flatnonzero(self.server_ids == self._server_id(server_name))
+            if len(rows):
+                kept_tools = [self.tools[row] for row in rows.tolist()]
+                kept_rows = self.embedding_matrix[rows]
+                if new_scales is not None:
+                    new_scales = np.concatenate([self.embedding_scales[rows], new_scales])
+                self._remove_tools({tool.name for tool in kept_tools}, new_matrix)
+                tools = kept_tools + tools
+                new_rows = np.concatenate([kept_rows, new_rows])
+                new_matrix = np.concatenate([kept_rows.astype(np.float32), new_matrix])
+            else:
+                self._invalidate_queries(set(), new_matrix)
+            self._append_rows(server_name, tools, new_rows, new_scales, new_matrix)
+
+    async def sync_servers(self, server_tools: dict[str, list[BaseTool]]) -> None:
+        """
+        Bring the index up to date with the given tools, touching only changed servers.
+
+        Args:
+            server_tools: dictionary mapping server names to their tools
+        """
+        for server_name in [*self._indexed_tools, *self._attached_hashes]:
+            if server_name not in server_tools:
+                await self.remove_server(server_name)
+        for server_name, tools in server_tools.items():
+            if self._indexed_tools.get(server_name) is not tools:
+                if not self._adopt_attached(server_name, tools):
+                    await self.upsert_server(server_name, tools)
+
+    async def attach_index(self) -> bool:
+        """
+        Attach read-only to the index published in the shared index directory.
+
+        The embeddings, tool names and descriptions are memory-mapped, so every
+        attached process on the host shares one copy, and searches can start before
+        any tool is embedded. Results carry PublishedTool records until a server's
+        tools are fetched; unchanged tools then replace them without re-embedding.
+        Later changes to the index are private to this process. Mapping and
+        decoding the index and building its keyword index run off the event loop.
+
+        Returns:
+            True if an index was attached, False if none is published or it was built
+            with another embedding backend or dtype
+        """
+        if self.shared_index is None:
+            return False
+        async with self._index_lock:
+            attached = await self._run_in_executor(self._load_shared_index)
+            if attached is None:
+                return False
+            index, tools, lexical_index, lexical_tools, attached_hashes = attached
+
+            self.embedding_matrix, self.embedding_scales = index.matrix, index.scales
+            self.tool_names = [tool.name for tool in tools]
+            self.tools = tools
+            self.server_ids = index.server_ids
+            self.server_names = list(index.server_names)
+            self._server_ids = {name: server_id for server_id, name in enumerate(self.server_names)}
+            self._partitions = None
+            self.ann_index = None
+            if index.ann_centroids is not None and len(index.matrix) >= self.ann_min_tools:
+                self.ann_index = IVFIndex.from_arrays(
+                    index.ann_centroids, index.ann_assignments, n_probe=self.ann_probes
+                )
+            self.query_cache.clear()
+            self._indexed_tools = {}
+            self._attached_hashes = attached_hashes
+            self.lexical_index, self._lexical_tools = lexical_index, lexical_tools
+
+            self.attached_version = index.version
+            self._index_changed = False
+            self.is_indexed = len(self.tool_names) > 0
+        logger.debug(f"Attached shared tool index version {index.version}")
+        return True
+
+    def _load_shared_index(self) -> tuple | None:
+        """Map the published index and build its tool records, keyword index and text hashes.
+
+        Returns:
+            The index, its PublishedTool records, keyword index, keyword index tools and
+            the text hashes of each server's tools; or None if no compatible index is published
+        """
+        index = self.shared_index.attach()
+        if index is None:
+            return None
+        if (index.backend, index.dtype) != (self.embedding_backend.name, self.embedding_dtype):
+            logger.warning(
+                f"Not attaching shared tool index built with '{index.backend}' ({index.dtype}) "
+                f"embeddings; this engine uses '{self.embedding_backend.name}' "
+                f"({self.embedding_dtype})"
+            )
+            return None
+
+        tools = [
+            PublishedTool(sys.intern(index.names[row]), index.descriptions, row)
+            for row in range(len(index.names))
+        ]
+        lexical_index = BM25Index()
+        lexical_tools: dict[str, tuple[BaseTool, str]] = {}
+        attached_hashes: dict[str, dict[str, int]] = {}
+        rows = zip(tools, index.server_ids.tolist(), index.text_hashes.tolist(), strict=True)
+        for tool, server_id, tool_hash in rows:
+            server_name = index.server_names[server_id]
+            attached_hashes.setdefault(server_name, {})[tool.name] = tool_hash
+            lexical_index.add(tool.name, _tool_terms(tool))
+            lexical_tools[tool.name] = (tool, server_name)
+        return index, tools, lexical_index, lexical_tools, attached_hashes
+
+    async def publish_index(self) -> int | None:
+        """
+        Publish the index to the shared index directory for other processes to attach.
+
+        Returns:
+            The published version, or None if there is no shared index directory,
+            nothing is indexed or the index could not be written
+        """
+        if self.shared_index is None or self.embedding_matrix is None:
+            return None
+
+        # Index updates replace these arrays and lists instead of mutating them, so the
+        # snapshot stays consistent while it is written off the event loop
+        matrix, scales, server_ids = self.embedding_matrix, self.embedding_scales, self.server_ids
+        tool_names, tools, ann_index = self.tool_names, self.tools, self.ann_index
+        server_names = list(self.server_names)
+
+        def publish() -> int:
+            return self.shared_index.publish(
+                SharedIndex(
+                    version=0,
+                    backend=self.embedding_backend.name,
+                    dtype=self.embedding_dtype,
+                    matrix=matrix,
+                    scales=scales,
+                    server_ids=server_ids,
+                    server_names=server_names,
+                    names=StringTable.from_strings(tool_names),
+                    descriptions=StringTable.from_strings([t.description or "" for t in tools]),
+                    text_hashes=np.array(
+                        [text_hash(_tool_text(tool)) for tool in tools], dtype=np.uint32
+                    ),
+                    ann_centroids=ann_index.centroids if ann_index is not None else None,
+                    ann_assignments=ann_index.assignments if ann_index is not None else None,
+                )
+            )
+
+        try:
+            version = await self._run_in_executor(publish)
+        except Exception as e:
+            logger.warning(f"Could not publish shared tool index: {e}")
+            return None
+        self._index_changed = False
+        logger.debug(f"Published shared tool index version {version}")
+        return version
+
+    def _adopt_attached(self, server_name: str, tools: list[BaseTool]) -> bool:
+        """Replace an attached server's PublishedTool records with its fetched tools.
+
+        Returns:
+            True if the tools match the attached rows, False if the server has no
+            attached rows or its tools changed and must be embedded again
+        """
+        published = self._attached_hashes.pop(server_name, None)
+        if published is None:
+            return False
+        current = {tool.name: tool for tool in tools}
+        if {name: text_hash(_tool_text(tool)) for name, tool in current.items()} != published:
+            return False
+
+        new_tools = list(self.tools)
+        for row in np.flatnonzero(self.server_ids == self._server_ids[server_name]).tolist():
+            new_tools[row] = current[self.tool_names[row]]
+        self.tools = new_tools
+        self._indexed_tools[server_name] = tools
+        # Cached results may still hold the records
+        self.query_cache.clear()
+        return True
+
+    def _upsert_lexical(self, server_name: str, tools: list[BaseTool]) -> None:
+        """Replace a server's tools in the keyword index, including tools they shadow."""
+        self._remove_lexical(server_name)
+        for tool in tools:
+            self.lexical_index.add(tool.name, _tool_terms(tool))
+            self._lexical_tools[tool.name] = (tool, server_name)
+
+    def _remove_lexical(self, server_name: str) -> None:
+        """Remove a server's tools from the keyword index."""
+        for name, (_, server) in list(self._lexical_tools.items()):
+            if server == server_name:
+                self.lexical_index.remove(name)
+                del self._lexical_tools[name]
+
+    def _server_id(self, server_name: str) -> int:
+        """Get the integer id of a server, assigning one on first use."""
+        server_id = self._server_ids.get(server_name)
+        if server_id is None:
+            server_id = self._server_ids[server_name] = len(self.server_names)
+            self.server_names.append(server_name)
+        return server_id
+
+    def _partition_bounds(self) -> dict[int, tuple[int, int]]:
+        """Get the (start, stop) row range of each server id with indexed tools."""
+        if self._partitions is None:
+            ids = self.server_ids
+            starts = np.flatnonzero(np.diff(ids, prepend=-1))
+            stops = np.append(starts[1:], len(ids))
+            self._partitions = {
+                int(ids[start]): (int(start), int(stop))
+                for start, stop in zip(starts, stops, strict=True)
+            }
+        return self._partitions
+
+    def _tool_names_of(self, server_name: str) -> set[str]:
+        """Get the names of the indexed tools of a server."""
+        server_id = self._server_ids.get(server_name)
+        if server_id is None:
+            return set()
+        return {self.tool_names[row] for row in np.flatnonzero(self.server_ids == server_id)}
+
+    def _remove_tools(self, names: set[str], added_matrix: np.ndarray | None = None) -> None:
+        """
+        Delete tool rows and invalidate the cached queries they affect.
+
+        Args:
+            names: Names of the tools to delete
+            added_matrix: Unit-norm rows about to be added, which may enter cached top-k results
+        """
+        self._invalidate_queries(names, added_matrix)
+
+        if self.embedding_matrix is not None and names & set(self.tool_names):
+            keep = np.array([name not in names for name in self.tool_names])
+            self.embedding_matrix = np.ascontiguousarray(self.embedding_matrix[keep])
+            if self.embedding_scales is not None:
+                self.embedding_scales = self.embedding_scales[keep]
+            if self.ann_index is not None:
+                if np.count_nonzero(keep) < self.ann_min_tools:
+                    self.ann_index = None
+                else:
+                    self.ann_index.remove(keep)
+            self.tool_names = [name for name in self.tool_names if name not in names]
+            self.tools = [tool for tool, kept in zip(self.tools, keep, strict=True) if kept]
+            self.server_ids = self.server_ids[keep]
+            self._partitions = None
+            self._index_changed = True
+
+    def _invalidate_queries(self, names: set[str], added_matrix: np.ndarray | None) -> None:
+        """Drop cached queries that include removed tools or that added tools would enter."""
+        for key, (query_vector, results, depth) in self.query_cache.items():
+            stale = any(tool.name in names for tool, _, _ in results)
+            if not stale and added_matrix is not None and len(added_matrix):
+                best_added = float(np.max(added_matrix @ query_vector))
+                stale = len(results) < depth or best_added >= results[-1][2]
+            if stale:
+                self.query_cache.pop(key)
+
+    def memory_usage(self) -> dict[str, int]:
+        """
+        Get the approximate memory held by the search index.
+
+        Tool instances are owned by the server manager and are not counted.
+
+        Returns:
+            Bytes held by the embeddings, the per-row names and server ids, and the
+            approximate index
+        """
+        embeddings = 0
+        if self.embedding_matrix is not None:
+            embeddings = self.embedding_matrix.nbytes
+        if self.embedding_scales is not None:
+            embeddings += self.embedding_scales.nbytes
+        rows = sys.getsizeof(self.tool_names) + sys.getsizeof(self.tools) + self.server_ids.nbytes
+        rows += sum(sys.getsizeof(name) for name in self.tool_names)
+        return {
+            "embeddings": embeddings,
+            "rows": rows,
+            "ann_index": self.ann_index.nbytes if self.ann_index is not None else 0,
+        }
+
+    def cache_stats(self) -> dict[str, dict[str, float]]:
+        """
+        Get hit-rate metrics of the query caches.
 
-                # Mark as indexed if we successfully embedded tools
-                self.is_indexed = len(self.tool_embeddings) > 0
+        Returns:
+            Statistics of the ranked-results cache and of the query embedding cache
+        """
+        return {"results": self.query_cache.stats(), "embeddings": self.query_embeddings.stats()}
+
+    def _embed_tool_texts(self, texts: list[str]) -> np.ndarray:
+        """Embed tool texts, reusing and extending the on-disk embedding cache."""
+        if self.embedding_cache is None:
+            return np.asarray(self.embedding_function(texts), dtype=np.float32)
+
+        cached = self.embedding_cache.get_many(texts)
+        missing = [i for i, embedding in enumerate(cached) if embedding is None]
+        if missing:
+            logger.debug(f"Embedding {len(missing)} of {len(texts)} tool texts")
+            new_embeddings = np.asarray(
+                self.embedding_function([texts[i] for i in missing]), dtype=np.float32
+            )
+            self.embedding_cache.put_many([texts[i] for i in missing], new_embeddings)
+            for i, embedding in zip(missing, new_embeddings, strict=True):
+                cached[i] = embedding
+        return np.asarray(cached, dtype=np.float32)
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 5,
+        servers: list[str] | None = None,
+        boost_server: str | None = None,
+    ) -> list[tuple[BaseTool, str, float]]:
+        """
+        Search for tools that match the query.
+
+        Semantic and keyword rankings are fused with reciprocal rank fusion. Until
+        embeddings are ready, or if the model cannot be loaded, the keyword
+        ranking is used on its own.
+
+        Args:
+            query: The search query
+            top_k: Number of top results to return
+            servers: Only search the tools of these servers; only their partitions
+                of the index are scored
+            boost_server: Server whose tools are ranked higher by active_server_boost
+
+        Returns:
+            list of tuples containing (tool, server_name, score)
+        """
+        plan = self._plan_search(query, top_k, servers, boost_server)
+        if plan.needs_embedding and self._load_model():
+            try:
+                embedding = self.embedding_function([plan.key])[0]
+                plan = plan._replace(query_vector=self._query_vector(plan.key, embedding))
             except Exception:
-                return
+                pass
+        return self._finish_search(plan)
 
-    def search(self, query: str, top_k: int = 5) -> list[tuple[BaseTool, str, float]]:
+    async def asearch(
+        self,
+        query: str,
+        top_k: int = 5,
+        servers: list[str] | None = None,
+        boost_server: str | None = None,
+    ) -> list[tuple[BaseTool, str, float]]:
         """
-        Search for tools that match the query using semantic search.
+        Search for tools like search, embedding the query off the event loop.
 
         Args:
             query: The search query
             top_k: Number of top results to return
+            servers: Only search the tools of these servers
+            boost_server: Server whose tools are ranked higher by active_server_boost
 
         Returns:
             list of tuples containing (tool, server_name, score)
         """
-        if not self.is_indexed:
-            return []
+        plan = self._plan_search(query, top_k, servers, boost_server)
+        if plan.needs_embedding and await self._run_in_executor(self._load_model):
+            try:
+                embeddings = await self._run_in_executor(self.embedding_function, [plan.key])
+                plan = plan._replace(query_vector=self._query_vector(plan.key, embeddings[0]))
+            except Exception:
+                pass
+        return self._finish_search(plan)
+
+    def _plan_search(
+        self,
+        query: str,
+        top_k: int,
+        servers: list[str] | None,
+        boost_server: str | None,
+    ) -> _SearchPlan:
+        """Normalize a search and look up its cached semantic ranking or query embedding."""
+        key = _normalize_query(query)
+        scope = None if servers is None else tuple(sorted(set(servers)))
+        depth = max(top_k, self.min_cached_depth) if boost_server else top_k
+        semantic, query_vector = None, None
+        if self.is_indexed:
+            semantic = self._cached_ranking((key, scope), depth)
+            if semantic is None and self.use_caching:
+                query_vector = self.query_embeddings.get(key)
+        needs_embedding = (
+            self.is_indexed
+            and semantic is None
+            and query_vector is None
+            and self.embedding_matrix is not None
+        )
+        return _SearchPlan(
+            key, scope, depth, top_k, boost_server, semantic, query_vector, needs_embedding
+        )
 
-        # Check cache first
-        cache_key = f"semantic:{query}:{top_k}"
-        if self.use_caching and cache_key in self.query_cache:
-            return self.query_cache[cache_key]
+    def _finish_search(self, plan: _SearchPlan) -> list[tuple[BaseTool, str, float]]:
+        """Rank a planned search semantically if possible, fuse and boost the rankings."""
+        semantic = plan.semantic
+        if semantic is None and plan.query_vector is not None:
+            semantic = self._rank((plan.key, plan.scope), plan.query_vector, plan.depth, plan.scope)
+        fused = self._fuse(plan.key, semantic, plan.depth, plan.scope)
+        return self._boost(fused, plan.boost_server)[: plan.top_k]
 
-        # Ensure model and embeddings exist
-        if not self._load_model() or not self.tool_embeddings:
-            return []
+    def _cached_ranking(
+        self, cache_key: tuple[str, tuple[str, ...] | None], top_k: int
+    ) -> list[tuple[BaseTool, str, float]] | None:
+        """Get the cached semantic ranking of a query if it is deep enough for top_k."""
+        if not self.use_caching:
+            return None
 
-        # Generate embedding for the query
-        try:
-            query_embedding = self.embedding_function([query])[0]
-        except Exception:
-            return []
-
-        # Calculate similarity scores
-        scores = {}
-        for tool_name, embedding in self.tool_embeddings.items():
-            # Calculate cosine similarity
-            similarity = np.dot(query_embedding, embedding) / (
-                np.linalg.norm(query_embedding) * np.linalg.norm(embedding)
+        def deep_enough(entry: tuple) -> bool:
+            _, results, depth = entry
+            # A ranking shorter than its depth already covers every tool
+            return top_k <= depth or len(results) < depth
+
+        entry = self.query_cache.get(cache_key, usable=deep_enough)
+        return entry[1] if entry is not None else None
+
+    def _fuse(
+        self,
+        key: str,
+        semantic: list[tuple[BaseTool, str, float]] | None,
+        top_k: int,
+        scope: tuple[str, ...] | None = None,
+    ) -> list[tuple[BaseTool, str, float]]:
+        """
+        Combine a semantic ranking with the keyword ranking of a query.
+
+        Fused scores are reciprocal rank fusion scores scaled so that a tool ranked
+        first by both rankings, or named exactly by the query, scores 1. Keyword-only
+        scores are BM25 scores relative to the best match.
+        """
+        depth = max(top_k, self.min_cached_depth)
+        tokens = tokenize(key)
+        if scope is None:
+            lexical = self.lexical_index.search(tokens, depth)
+        else:
+            allowed = set(scope)
+            lexical = self.lexical_index.search(
+                tokens, depth, lambda name: self._lexical_tools[name][1] in allowed
             )
-            scores[tool_name] = float(similarity)
+        if semantic is None:
+            if not lexical:
+                return []
+            best = lexical[0][1]
+            return [
+                (*self._lexical_tools[name], score / best) for name, score in lexical[:top_k]
+            ]
+        if not lexical:
+            return semantic[:top_k]
 
-        # Sort by score and get top_k results
-        sorted_results = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:top_k]
+        fused: dict[str, float] = {}
+        found: dict[str, tuple[BaseTool, str]] = {}
+        for rank, (tool, server_name, _) in enumerate(semantic):
+            fused[tool.name] = 1 / (self.rrf_k + rank + 1)
+            found[tool.name] = (tool, server_name)
+        for rank, (name, _) in enumerate(lexical):
+            fused[name] = fused.get(name, 0.0) + 1 / (self.rrf_k + rank + 1)
+            # The keyword index is updated first, so its view of the tool is the newest
+            found[name] = self._lexical_tools[name]
+
+        best_possible = 2 / (self.rrf_k + 1)
+        if key in found:
+            # A query that is exactly a tool name ranks that tool first
+            fused[key] = best_possible
+        top = heapq.nlargest(top_k, fused.items(), key=lambda item: (item[1], item[0] == key))
+        return [(*found[name], score / best_possible) for name, score in top]
+
+    def _boost(
+        self, results: list[tuple[BaseTool, str, float]], boost_server: str | None
+    ) -> list[tuple[BaseTool, str, float]]:
+        """Move the scores of a server's tools active_server_boost of the way to 1, and re-rank."""
+        if boost_server is None or not self.active_server_boost:
+            return results
+        boost = self.active_server_boost
+        boosted = [
+            (tool, server, score + boost * (1 - score) if server == boost_server else score)
+            for tool, server, score in results
+        ]
+        boosted.sort(key=itemgetter(2), reverse=True)
+        return boosted
+
+    def _score_partitions(
+        self, query_vector: np.ndarray, scope: tuple[str, ...] | None
+    ) -> tuple[np.ndarray | None, np.ndarray]:
+        """
+        Score the rows of the given servers, or of every server if scope is None.
+
+        Returns:
+            The scored row indices (None when every row is scored) and their scores
+        """
+        matrix, scales = self.embedding_matrix, self.embedding_scales
+        if scope is None:
+            return None, score_rows(matrix, scales, query_vector)
+
+        bounds = self._partition_bounds()
+        ranges = [
+            bounds[self._server_ids[name]]
+            for name in scope
+            if self._server_ids.get(name) in bounds
+        ]
+        if not ranges:
+            return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.float32)
+        rows = np.concatenate([np.arange(start, stop) for start, stop in ranges])
+        scores = np.concatenate([
+            score_rows(
+                matrix[start:stop], None if scales is None else scales[start:stop], query_vector
+            )
+            for start, stop in ranges
+        ])
+        return rows, scores
+
+    def _query_vector(self, key: str, query_embedding: np.ndarray) -> np.ndarray:
+        """Normalize a query embedding and remember it for the query."""
+        query_vector = _normalize_rows(np.asarray(query_embedding, dtype=np.float32)[None, :])[0]
+        if self.use_caching:
+            self.query_embeddings.put(key, query_vector)
+        return query_vector
+
+    def _rank(
+        self,
+        cache_key: tuple[str, tuple[str, ...] | None],
+        query_vector: np.ndarray,
+        top_k: int,
+        scope: tuple[str, ...] | None = None,
+    ) -> list[tuple[BaseTool, str, float]]:
+        """Score tools against a unit-norm query vector and cache the ranking.
+
+        The ranking holds at least top_k tools; callers slice it. Large catalogs are
+        searched approximately through ann_index, unless the search is scoped to
+        some servers, whose partitions are then scored exactly.
+        """
+        # Rank at least min_cached_depth tools so later searches with a larger top_k still hit
+        depth = max(top_k, self.min_cached_depth) if self.use_caching else top_k
+
+        if self.ann_index is not None and scope is None:
+            top, top_scores = self.ann_index.search(
+                self.embedding_matrix, query_vector, depth, self.embedding_scales
+            )
+        else:
+            # Rows are unit-norm, so one matrix-vector product gives every cosine similarity
+            rows, scores = self._score_partitions(query_vector, scope)
+
+            # Select the top rows without sorting the whole catalog, then order just those
+            k = min(depth, len(scores))
+            if k <= 0:
+                return []
+            top = np.argpartition(scores, len(scores) - k)[len(scores) - k :]
+            top = top[np.argsort(scores[top])[::-1]]
+            top_scores = scores[top]
+            if rows is not None:
+                top = rows[top]
 
         # Format results
-        results = []
-        for tool_name, score in sorted_results:
-            tool = self.tools_by_name.get(tool_name)
-            server_name = self.server_by_tool.get(tool_name)
-            if tool and server_name:
-                results.append((tool, server_name, score))
+        results = [
+            (self.tools[index], self.server_names[self.server_ids[index]], float(score))
+            for index, score in zip(top, top_scores, strict=True)
+        ]
 
         # Cache results
         if self.use_caching:
-            self.query_cache[cache_key] = results
+            self.query_cache.put(cache_key, (query_vector, results, depth))
 
         return results
 
-    async def search_tools(self, query: str, top_k: int = 100, active_server: str = None) -> str:
+    async def _run_in_executor(self, function: Callable[..., Any], *args: Any) -> Any:
+        """Run blocking model work on the embedding executor instead of the event loop."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.embedding_workers, thread_name_prefix="tool-search-embed"
+            )
+        return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+
+    def close(self) -> None:
+        """Stop background indexing, shut down the embedding executor and release the model.
+
+        The index is kept; the model is acquired again if the engine is used later, and
+        start_background_indexing starts a new build.
+        """
+        if self._index_task is not None:
+            self._index_task.cancel()
+            self._reset_background_indexing()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._model_key is not None:
+            self.model_registry.release(self._model_key)
+            self._model_key = None
+            self.model = None
+            self.embedding_function = None
+
+    async def search_tools(
+        self,
+        query: str,
+        top_k: int = 100,
+        active_server: str = None,
+        servers: list[str] | None = None,
+        connected_only: bool = False,
+        prefer_active_server: bool = False,
+    ) -> list[tuple[BaseTool, str, float]] | str:
         """
         Search for tools across all MCP servers using semantic search.
 
@@ -245,31 +1297,36 @@ class ToolSearchEngine:
             query: The search query to find relevant tools
             top_k: Number of top results to return
             active_server: Name of the currently active server (for highlighting)
+            servers: Only search the tools of these servers
+            connected_only: Only search the tools of servers with an open session
+            prefer_active_server: Rank tools of the active server higher
 
         Returns:
-            String with formatted search results
+            (tool, server name, score) results, or a message explaining why there are none
         """
-        # Ensure the index is built or build it
-        if not self.is_indexed:
+        if self._index_task is not None:
+            # Wait until every server's tools are loaded or an index is attached; embeddings
+            # may still be building
+            await self.wait_until_searchable(self.index_wait_timeout)
+            if self._ready.is_set() and self.server_manager._server_tools:
+                await self.sync_servers(self.server_manager._server_tools)
+        elif not self.is_indexed:
             # Try to build the index
             if self.server_manager and self.server_manager._server_tools:
                 await self.index_tools(self.server_manager._server_tools)
             else:
                 # If we don't have server_manager or tools, try to index directly
                 await self.start_indexing()
+        elif self.server_manager and self.server_manager._server_tools:
+            # Re-embed only the servers whose tools changed since the last search
+            await self.sync_servers(self.server_manager._server_tools)
 
-            # Wait for indexing to complete (maximum 10 seconds)
-            start_time = time.time()
-            timeout = 10  # seconds
-            while not self.is_indexed and (time.time() - start_time) < timeout:
-                await asyncio.sleep(0.5)
-
-            # If still not indexed, return a friendly message
-            if not self.is_indexed:
-                return (
-                    "I'm still preparing the tool index. Please try your search again in a moment. "
-                    "This usually takes just a few seconds to complete."
-                )
+        # If no tools could be indexed at all, say so instead of guessing
+        if not self.is_indexed and not len(self.lexical_index):
+            return (
+                "The tool index is not available right now, so tools cannot be searched. "
+                "Use the list of servers to find a suitable server and connect to it instead."
+            )
 
         # If the server manager has an active server but it wasn't provided, use it
         if (
@@ -279,7 +1336,21 @@ class ToolSearchEngine:
         ):
             active_server = self.server_manager.active_server
 
-        results = self.search(query, top_k=top_k)
+        if connected_only:
+            connected = self.server_manager.client.active_sessions if self.server_manager else []
+            servers = [name for name in servers or connected if name in connected]
+        if servers is not None and not servers:
+            return (
+                "No servers match the search filters. "
+                "Search without the server filters, or connect to a server first."
+            )
+
+        results = await self.asearch(
+            query,
+            top_k=top_k,
+            servers=servers,
+            boost_server=active_server if prefer_active_server else None,
+        )
         if not results:
             return (
                 "No relevant tools found. The search provided no results. "
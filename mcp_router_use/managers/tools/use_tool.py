@@ -47,7 +47,7 @@ class UseToolFromServerTool(MCPServerTool):
             try:
                 # Create or get session for this server
                 try:
-                    session = self.server_manager.client.get_session(server_name)
+                    session = await self.server_manager.client.get_session(server_name)
                     logger.debug(f"Using existing session for server '{server_name}'")
                 except ValueError:
                     logger.debug(f"Creating new session for server '{server_name}' for tool use")
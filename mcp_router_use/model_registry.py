@@ -0,0 +1,106 @@
+"""
+Process-wide registry of embedding models.
+
+This module shares loaded embedding models between all tool search engines in
+a process, so agents and server managers that search tools with the same model
+load it once. Models are reference-counted and dropped when the last user
+releases them.
+"""
+
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from .embedding_backends import FastEmbedBackend
+from .logging import logger
+
+
+def _load_fastembed_model(model_name: str) -> FastEmbedBackend:
+    """Load a fastembed embedding backend by model name."""
+    backend = FastEmbedBackend(model_name)
+    backend.load()
+    return backend
+
+
+class ModelRegistry:
+    """Thread-safe, reference-counted registry of loaded models keyed by name.
+
+    Each model is loaded at most once while it has users, even when several
+    threads acquire it at the same time.
+    """
+
+    def __init__(self, loader: Callable[[str], Any] = _load_fastembed_model) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            loader: Function that loads a model by name, used when acquire is not
+                given a loader.
+        """
+        self.loader = loader
+        self._lock = threading.Lock()
+        self._load_locks: dict[str, threading.Lock] = {}
+        self._models: dict[str, Any] = {}
+        self._refcounts: dict[str, int] = {}
+
+    def acquire(self, model_name: str, loader: Callable[[], Any] | None = None) -> Any:
+        """Get a model, loading it if no one holds it, and count a new user.
+
+        Args:
+            model_name: The name of the model.
+            loader: Function that loads this model; defaults to the registry's loader.
+
+        Returns:
+            The loaded model.
+
+        Raises:
+            Exception: Whatever the loader raises if the model cannot be loaded.
+        """
+        with self._lock:
+            if model_name in self._models:
+                self._refcounts[model_name] += 1
+                return self._models[model_name]
+            load_lock = self._load_locks.setdefault(model_name, threading.Lock())
+
+        # Load outside the registry lock so other models stay available meanwhile
+        with load_lock:
+            with self._lock:
+                if model_name in self._models:
+                    self._refcounts[model_name] += 1
+                    return self._models[model_name]
+            logger.debug(f"Loading embedding model '{model_name}'")
+            model = loader() if loader is not None else self.loader(model_name)
+            with self._lock:
+                self._models[model_name] = model
+                self._refcounts[model_name] = 1
+                return model
+
+    def release(self, model_name: str) -> None:
+        """Count one user less, dropping the model when no one holds it.
+
+        Args:
+            model_name: The name of the model.
+        """
+        with self._lock:
+            if model_name not in self._refcounts:
+                return
+            self._refcounts[model_name] -= 1
+            if self._refcounts[model_name] <= 0:
+                logger.debug(f"Unloading embedding model '{model_name}'")
+                del self._refcounts[model_name]
+                del self._models[model_name]
+
+    def refcount(self, model_name: str) -> int:
+        """Get the number of users of a model.
+
+        Args:
+            model_name: The name of the model.
+
+        Returns:
+            The number of acquires not yet released.
+        """
+        with self._lock:
+            return self._refcounts.get(model_name, 0)
+
+
+# Shared by every ToolSearchEngine in the process
+model_registry = ModelRegistry()
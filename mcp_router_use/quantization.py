@@ -0,0 +1,65 @@
+"""
+Compact storage of embedding matrices.
+
+This module stores unit-norm embedding rows as float32, float16 or int8 and
+scores queries against them. int8 rows keep one float32 scale per row. Scoring
+converts rows back to float32 in fixed-size chunks, so memory never holds a
+full float32 copy of a quantized matrix; the conversion makes scoring quantized
+rows slower than scoring float32 rows, markedly so for float16.
+"""
+
+import numpy as np
+
+EMBEDDING_DTYPES = ("float32", "float16", "int8")
+
+# Rows converted to float32 at a time when scoring a quantized matrix
+_SCORE_CHUNK_ROWS = 1024
+
+
+def quantize_rows(rows: np.ndarray, dtype: str) -> tuple[np.ndarray, np.ndarray | None]:
+    """Convert float32 rows to a storage dtype.
+
+    Args:
+        rows: The float32 rows.
+        dtype: One of EMBEDDING_DTYPES.
+
+    Returns:
+        The stored rows and, for int8, the scale of each row (None otherwise).
+
+    Raises:
+        ValueError: If dtype is not supported.
+    """
+    if dtype == "float32":
+        return np.ascontiguousarray(rows, dtype=np.float32), None
+    if dtype == "float16":
+        return np.ascontiguousarray(rows, dtype=np.float16), None
+    if dtype == "int8":
+        # Symmetric per-row scaling maps each row's largest component to +-127
+        scales = (np.abs(rows).max(axis=1, initial=0.0) / 127).astype(np.float32)
+        safe_scales = np.where(scales == 0, 1, scales)
+        quantized = np.round(rows / safe_scales[:, None]).astype(np.int8)
+        return np.ascontiguousarray(quantized), scales
+    raise ValueError(f"Unsupported embedding dtype '{dtype}'; use one of {EMBEDDING_DTYPES}")
+
+
+def score_rows(matrix: np.ndarray, scales: np.ndarray | None, query: np.ndarray) -> np.ndarray:
+    """Compute the inner product of every stored row with a float32 query.
+
+    Args:
+        matrix: The stored rows.
+        scales: The per-row scales of int8 rows, or None.
+        query: The query vector.
+
+    Returns:
+        One float32 score per row.
+    """
+    if matrix.dtype == np.float32:
+        scores = matrix @ query
+    else:
+        scores = np.empty(len(matrix), dtype=np.float32)
+        for start in range(0, len(matrix), _SCORE_CHUNK_ROWS):
+            block = matrix[start : start + _SCORE_CHUNK_ROWS].astype(np.float32)
+            scores[start : start + len(block)] = block @ query
+    if scales is not None:
+        scores *= scales
+    return scores
@@ -0,0 +1,174 @@
+"""
+In-memory cache of MCP tool results.
+
+This module provides an opt-in cache that connectors consult before calling a
+tool, so repeated calls to read-only tools with identical arguments are served
+without a round trip to the router.
+"""
+
+import hashlib
+import json
+import time
+from typing import Any
+
+from mcp.types import Tool
+
+from .utils import LRUCache
+
+
+class ToolResultCache:
+    """Size-bounded LRU cache of tool results keyed by server, tool and arguments.
+
+    A tool is cached only if it is opted in: either listed in ``tool_ttls``
+    (by ``"tool"`` or ``"server/tool"``) with a positive TTL, or, when
+    ``use_annotations`` is set, annotated by its server with ``readOnlyHint``,
+    in which case ``default_ttl`` applies. ``idempotentHint`` does not opt a
+    tool in: it only applies to tools that modify state. A TTL of 0 in
+    ``tool_ttls`` opts a tool out even if its annotations would opt it in.
+    Running a tool that is not cached may change what the server's other tools
+    return, so connectors then drop the server's cached results with
+    invalidate_server.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        default_ttl: float = 300,
+        tool_ttls: dict[str, float] | None = None,
+        use_annotations: bool = True,
+    ) -> None:
+        """Initialize the result cache.
+
+        Args:
+            max_entries: Maximum number of cached results before the least recently
+                        used ones are evicted.
+            default_ttl: Seconds a result of an annotated tool stays fresh.
+            tool_ttls: Seconds a result stays fresh per ``"tool"`` or ``"server/tool"``.
+            use_annotations: Whether read-only tools are cached without being listed
+                            in tool_ttls.
+        """
+        self.default_ttl = default_ttl
+        self.tool_ttls = tool_ttls or {}
+        self.use_annotations = use_annotations
+
+        # Key to (expiry time, server name, result); TTLs vary per tool, so entries
+        # carry their own expiry instead of using the cache-wide TTL
+        self._entries = LRUCache(max_entries)
+
+    @property
+    def max_entries(self) -> int:
+        """Maximum number of cached results."""
+        return self._entries.max_entries
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups that found a fresh result."""
+        return self._entries.hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups that found no fresh result."""
+        return self._entries.misses
+
+    @property
+    def evictions(self) -> int:
+        """Number of results evicted to make room."""
+        return self._entries.evictions
+
+    @staticmethod
+    def make_key(server_name: str, tool_name: str, arguments: dict[str, Any]) -> str:
+        """Build a cache key from the canonical JSON form of the arguments.
+
+        Argument order and insignificant whitespace do not affect the key.
+
+        Args:
+            server_name: The name of the server the tool belongs to.
+            tool_name: The name of the tool.
+            arguments: The arguments of the call.
+
+        Returns:
+            A hex digest identifying the call.
+        """
+        canonical = json.dumps(
+            [server_name, tool_name, arguments],
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def ttl_for(self, server_name: str, tool_name: str, tool: Tool | None = None) -> float | None:
+        """Get how long results of a tool may be cached.
+
+        Args:
+            server_name: The name of the server the tool belongs to.
+            tool_name: The name of the tool.
+            tool: The tool definition, used for its annotations.
+
+        Returns:
+            The TTL in seconds, or None if the tool is not cached.
+        """
+        for name in (f"{server_name}/{tool_name}", tool_name):
+            if name in self.tool_ttls:
+                ttl = self.tool_ttls[name]
+                return ttl if ttl and ttl > 0 else None
+
+        annotations = getattr(tool, "annotations", None)
+        if self.use_annotations and annotations is not None:
+            if annotations.readOnlyHint:
+                return self.default_ttl if self.default_ttl > 0 else None
+        return None
+
+    def get(self, key: str) -> Any | None:
+        """Get a fresh cached result.
+
+        Args:
+            key: The key built by make_key.
+
+        Returns:
+            The cached result, or None on a miss or an expired entry.
+        """
+        entry = self._entries.get(key, usable=lambda entry: entry[0] > time.monotonic())
+        if entry is None:
+            # Drop the entry if it expired
+            self._entries.pop(key)
+            return None
+        return entry[2]
+
+    def put(self, key: str, result: Any, ttl: float, server_name: str | None = None) -> None:
+        """Cache a result, evicting the least recently used entries if full.
+
+        Args:
+            key: The key built by make_key.
+            result: The tool result to cache.
+            ttl: Seconds the result stays fresh.
+            server_name: The server the result came from, for invalidate_server.
+        """
+        self._entries.put(key, (time.monotonic() + ttl, server_name, result))
+
+    def invalidate_server(self, server_name: str) -> int:
+        """Remove every cached result of a server.
+
+        Args:
+            server_name: The name of the server.
+
+        Returns:
+            The number of removed results.
+        """
+        keys = [key for key, (_, server, _) in self._entries.items() if server == server_name]
+        for key in keys:
+            self._entries.pop(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove every cached result."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, float]:
+        """Get the cache statistics.
+
+        Returns:
+            A dictionary with the number of entries, hits, misses, evictions and the hit rate.
+        """
+        return self._entries.stats()
@@ -5,9 +5,11 @@ This module provides a session manager for MCP connections,
 which handles authentication, initialization, and tool discovery.
 """
 
+from collections.abc import AsyncIterator
 from typing import Any
 
 from .connectors.base import BaseConnector
+from .utils import as_completed_bounded
 
 
 class MCPSession:
@@ -21,17 +23,24 @@ class MCPSession:
         self,
         connector: BaseConnector,
         auto_connect: bool = True,
+        lazy: bool = False,
     ) -> None:
         """Initialize a new MCP session.
 
         Args:
             connector: The connector to use for communicating with the MCP implementation.
             auto_connect: Whether to automatically connect to the MCP implementation.
+            lazy: Whether to defer connecting and initializing until the first tool
+                  call or tool discovery.
         """
         self.connector = connector
         self.session_info: dict[str, Any] | None = None
         self.tools: list[dict[str, Any]] = []
         self.auto_connect = auto_connect
+        self.lazy = lazy
+        self._connect_on_demand = lazy
+        if lazy:
+            connector.connect_on_demand = True
 
     async def __aenter__(self) -> "MCPSession":
         """Enter the async context manager.
@@ -58,8 +67,43 @@ class MCPSession:
 
     async def disconnect(self) -> None:
         """Disconnect from the MCP implementation."""
+        self._connect_on_demand = self.lazy
         await self.connector.disconnect()
 
+    async def suspend(self) -> None:
+        """Release the connection while keeping the session usable.
+
+        The connector keeps its tool list and reconnects and re-initializes
+        itself on the next tool call.
+        """
+        await self.connector.suspend()
+        self._connect_on_demand = True
+
+    def load_cached(self, session_info: Any, tools: list[Any]) -> None:
+        """Populate the session from cached capabilities without connecting.
+
+        The session connects and initializes on first use, or when
+        ensure_initialized is awaited.
+
+        Args:
+            session_info: The cached initialize result.
+            tools: The cached tool list.
+        """
+        self.connector.prime_tools(tools)
+        self.session_info = session_info
+        self.tools = tools
+        self._connect_on_demand = True
+
+    async def ensure_initialized(self) -> None:
+        """Connect and initialize the session if that hasn't happened yet.
+
+        Concurrent first callers share a single connect and initialize.
+        """
+        session_info = await self.connector.ensure_connected()
+        if session_info is not None:
+            self.session_info = session_info
+        self.tools = self.connector.tools
+
     async def initialize(self) -> dict[str, Any]:
         """Initialize the MCP session and discover available tools.
 
@@ -93,6 +137,8 @@ class MCPSession:
         Returns:
             The list of available tools in MCP format.
         """
+        if self._connect_on_demand and not self.is_connected:
+            await self.ensure_initialized()
         self.tools = self.connector.tools
         return self.tools
 
@@ -106,8 +152,55 @@ class MCPSession:
         Returns:
             The result of the tool call.
         """
-        # Make sure we're connected
-        if not self.is_connected and self.auto_connect:
-            await self.connect()
+        # Make sure we're connected; lazy and suspended sessions connect on first use
+        if not self.is_connected:
+            if self._connect_on_demand:
+                await self.ensure_initialized()
+            elif self.auto_connect:
+                await self.connect()
 
         return await self.connector.call_tool(name, arguments)
+
+    async def call_tools(
+        self, calls: list[tuple[str, dict[str, Any]]], max_concurrency: int = 10
+    ) -> list[Any]:
+        """Call several MCP tools concurrently.
+
+        Args:
+            calls: (tool name, arguments) pairs to call.
+            max_concurrency: Maximum number of calls in flight at the same time.
+
+        Returns:
+            The results in the same order as calls. A call that raised has its
+            exception in place of the result instead of aborting the batch.
+        """
+        results: list[Any] = [None] * len(calls)
+        async for index, result in self.iter_call_tools(calls, max_concurrency):
+            results[index] = result
+        return results
+
+    async def iter_call_tools(
+        self, calls: list[tuple[str, dict[str, Any]]], max_concurrency: int = 10
+    ) -> AsyncIterator[tuple[int, Any]]:
+        """Call several MCP tools concurrently, yielding results as they complete.
+
+        Args:
+            calls: (tool name, arguments) pairs to call.
+            max_concurrency: Maximum number of calls in flight at the same time.
+
+        Yields:
+            Tuples of (index into calls, result or exception).
+        """
+        # Connect once up front rather than racing to connect in every call
+        if not self.is_connected:
+            if self._connect_on_demand:
+                await self.ensure_initialized()
+            elif self.auto_connect:
+                await self.connect()
+
+        factories = [
+            lambda name=name, arguments=arguments: self.connector.call_tool(name, arguments)
+            for name, arguments in calls
+        ]
+        async for item in as_completed_bounded(factories, max_concurrency):
+            yield item
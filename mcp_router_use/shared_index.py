@@ -0,0 +1,222 @@
+"""
+Tool search index shared between processes.
+
+This module publishes a tool search index to memory-mapped files, so worker
+processes on one host attach to a single copy of the embedding matrix and tool
+metadata instead of each embedding every tool. Each publish writes a new
+version directory and then atomically switches a small JSON pointer to it;
+attached workers keep reading the version they mapped.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import zlib
+from typing import Any, NamedTuple
+
+import numpy as np
+
+from .logging import logger
+
+# Layout version of published indexes; attach refuses other formats
+INDEX_FORMAT = 1
+
+# Published versions kept besides the current one, for workers still mapping them
+_KEEP_OLD_VERSIONS = 1
+
+
+def text_hash(text: str) -> int:
+    """Get a stable hash of a tool text, used to detect changed tools."""
+    return zlib.crc32(text.encode())
+
+
+class StringTable:
+    """Read-only sequence of strings stored as one UTF-8 blob and an offsets array."""
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray) -> None:
+        self.blob = blob
+        self.offsets = offsets
+
+    @classmethod
+    def from_strings(cls, strings: list[str]) -> "StringTable":
+        encoded = [string.encode() for string in strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(data) for data in encoded], out=offsets[1:])
+        blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        return cls(blob, offsets)
+
+    def __getitem__(self, index: int) -> str:
+        return bytes(self.blob[self.offsets[index] : self.offsets[index + 1]]).decode()
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+
+class PublishedTool:
+    """Name and description of a tool from a shared index, until the real tool is loaded.
+
+    The description is decoded from the shared string table on access.
+    """
+
+    __slots__ = ("name", "_descriptions", "_row")
+
+    def __init__(self, name: str, descriptions: StringTable, row: int) -> None:
+        self.name = name
+        self._descriptions = descriptions
+        self._row = row
+
+    @property
+    def description(self) -> str:
+        return self._descriptions[self._row]
+
+
+class SharedIndex(NamedTuple):
+    """Arrays and metadata of a published tool search index."""
+
+    version: int
+    backend: str  # Name of the embedding backend the rows come from
+    dtype: str  # Storage dtype of the embedding rows
+    matrix: np.ndarray
+    scales: np.ndarray | None
+    server_ids: np.ndarray
+    server_names: list[str]
+    names: StringTable
+    descriptions: StringTable
+    text_hashes: np.ndarray  # text_hash of each row's tool text
+    ann_centroids: np.ndarray | None
+    ann_assignments: np.ndarray | None
+
+
+class SharedIndexStore:
+    """Directory that tool search indexes are published to and attached from."""
+
+    def __init__(self, directory: str) -> None:
+        """Initialize the store.
+
+        Args:
+            directory: Directory holding the published versions.
+        """
+        self.directory = os.path.expanduser(directory)
+
+    @property
+    def _pointer_path(self) -> str:
+        return os.path.join(self.directory, "index.json")
+
+    def current_version(self) -> int | None:
+        """Get the version of the current published index, or None if there is none."""
+        try:
+            with open(self._pointer_path) as f:
+                pointer = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if pointer.get("format") != INDEX_FORMAT:
+            return None
+        return pointer.get("version")
+
+    def publish(self, index: SharedIndex) -> int:
+        """Write an index as a new version and make it current.
+
+        The version of the given index is ignored; a new, increasing one is assigned.
+
+        Args:
+            index: The index to publish.
+
+        Returns:
+            The published version.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        version = max(time.time_ns(), (self.current_version() or 0) + 1)
+        staging = tempfile.mkdtemp(dir=self.directory, prefix=".publish-")
+        try:
+            arrays: dict[str, Any] = {
+                "matrix": index.matrix,
+                "server_ids": index.server_ids,
+                "names": index.names.blob,
+                "name_offsets": index.names.offsets,
+                "descriptions": index.descriptions.blob,
+                "description_offsets": index.descriptions.offsets,
+                "text_hashes": index.text_hashes,
+                "scales": index.scales,
+                "ann_centroids": index.ann_centroids,
+                "ann_assignments": index.ann_assignments,
+            }
+            for name, array in arrays.items():
+                if array is not None:
+                    np.save(os.path.join(staging, f"{name}.npy"), np.asarray(array))
+            header = {
+                "format": INDEX_FORMAT,
+                "version": version,
+                "backend": index.backend,
+                "dtype": index.dtype,
+                "rows": len(index.matrix),
+                "server_names": index.server_names,
+            }
+            with open(os.path.join(staging, "header.json"), "w") as f:
+                json.dump(header, f)
+            os.rename(staging, os.path.join(self.directory, f"v{version}"))
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        # Switch readers to the new version atomically
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"format": INDEX_FORMAT, "version": version}, f)
+        os.replace(tmp_path, self._pointer_path)
+        self._remove_old_versions(version)
+        return version
+
+    def _remove_old_versions(self, current: int) -> None:
+        """Delete all but the newest old versions; mapped files stay readable on POSIX."""
+        versions = sorted(
+            int(name[1:])
+            for name in os.listdir(self.directory)
+            if name.startswith("v") and name[1:].isdigit() and int(name[1:]) != current
+        )
+        for version in versions[: max(0, len(versions) - _KEEP_OLD_VERSIONS)]:
+            shutil.rmtree(os.path.join(self.directory, f"v{version}"), ignore_errors=True)
+
+    def attach(self) -> SharedIndex | None:
+        """Memory-map the current published index read-only.
+
+        Returns:
+            The index, or None if none is published or it cannot be read.
+        """
+        version = self.current_version()
+        if version is None:
+            return None
+        path = os.path.join(self.directory, f"v{version}")
+
+        def load(name: str, required: bool = True) -> np.ndarray | None:
+            file_path = os.path.join(path, f"{name}.npy")
+            if not required and not os.path.exists(file_path):
+                return None
+            return np.load(file_path, mmap_mode="r")
+
+        try:
+            with open(os.path.join(path, "header.json")) as f:
+                header = json.load(f)
+            if header.get("format") != INDEX_FORMAT:
+                raise ValueError(f"unsupported format {header.get('format')}")
+            index = SharedIndex(
+                version=version,
+                backend=header["backend"],
+                dtype=header["dtype"],
+                matrix=load("matrix"),
+                scales=load("scales", required=False),
+                server_ids=load("server_ids"),
+                server_names=header["server_names"],
+                names=StringTable(load("names"), load("name_offsets")),
+                descriptions=StringTable(load("descriptions"), load("description_offsets")),
+                text_hashes=load("text_hashes"),
+                ann_centroids=load("ann_centroids", required=False),
+                ann_assignments=load("ann_assignments", required=False),
+            )
+            if not len(index.matrix) == len(index.server_ids) == len(index.names):
+                raise ValueError("row counts do not match")
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable shared tool index in '{path}': {e}")
+            return None
+        return index
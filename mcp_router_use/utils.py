@@ -0,0 +1,140 @@
+"""
+Shared helpers for mcp_router_use.
+
+This module provides small async utilities and caches used across the package.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from typing import Any
+
+
+async def as_completed_bounded(
+    factories: list[Callable[[], Awaitable[Any]]], max_concurrency: int
+) -> AsyncIterator[tuple[int, Any]]:
+    """Run awaitables with bounded concurrency and yield them as they complete.
+
+    Exceptions raised by an awaitable are yielded in place of its result rather
+    than aborting the remaining work.
+
+    Args:
+        factories: Callables that each create one awaitable when invoked.
+        max_concurrency: Maximum number of awaitables running at the same time.
+
+    Yields:
+        Tuples of (index into factories, result or exception).
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run(index: int, factory: Callable[[], Awaitable[Any]]) -> tuple[int, Any]:
+        async with semaphore:
+            try:
+                return index, await factory()
+            except Exception as e:
+                return index, e
+
+    tasks = [asyncio.create_task(run(i, factory)) for i, factory in enumerate(factories)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Stop outstanding work if the consumer stops iterating early
+        for task in tasks:
+            task.cancel()
+
+
+class LRUCache:
+    """Size-bounded mapping that evicts least recently used entries and expires old ones.
+
+    Hits and misses of get are counted for hit-rate metrics.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries before the least recently used are evicted.
+            ttl: Seconds an entry stays fresh, or None to keep entries until evicted.
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(
+        self,
+        key: Hashable,
+        default: Any = None,
+        usable: Callable[[Any], bool] | None = None,
+    ) -> Any:
+        """Get a fresh entry and mark it as recently used.
+
+        Args:
+            key: The key to look up.
+            default: Value returned on a miss or an expired entry.
+            usable: Optional check of the cached value; entries it rejects count as misses.
+
+        Returns:
+            The cached value, or default.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            stored_at, value = entry
+            if self.ttl is not None and time.monotonic() - stored_at >= self.ttl:
+                del self._entries[key]
+            elif usable is None or usable(value):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+        self.misses += 1
+        return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store an entry, evicting the least recently used entries if full.
+
+        Args:
+            key: The key to store the value under.
+            value: The value to cache.
+        """
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        """Remove an entry if present."""
+        self._entries.pop(key, None)
+
+    def items(self) -> list[tuple[Hashable, Any]]:
+        """Get a snapshot of all entries, including expired ones, without touching recency."""
+        return [(key, value) for key, (_, value) in self._entries.items()]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def stats(self) -> dict[str, float]:
+        """Get the cache statistics.
+
+        Returns:
+            A dictionary with the number of entries, hits, misses, evictions and the hit rate.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
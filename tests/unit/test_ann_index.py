@@ -0,0 +1,90 @@
+"""
+Unit tests for the IVFIndex class.
+"""
+
+import numpy as np
+
+from mcp_router_use.ann_index import IVFIndex
+
+
+def clustered_rows(num_rows: int, seed: int = 0) -> np.ndarray:
+    """Create unit-norm rows grouped around random topics."""
+    rng = np.random.default_rng(seed)
+    topics = rng.standard_normal((num_rows // 20, 32))
+    rows = topics[rng.integers(len(topics), size=num_rows)] + 0.1 * rng.standard_normal(
+        (num_rows, 32)
+    )
+    return (rows / np.linalg.norm(rows, axis=1, keepdims=True)).astype(np.float32)
+
+
+def exact_top(matrix: np.ndarray, query: np.ndarray, top_k: int) -> list[int]:
+    return list(np.argsort(matrix @ query)[::-1][:top_k])
+
+
+class TestIVFIndex:
+    """Tests for approximate search and incremental updates."""
+
+    def test_recall_against_exact_search(self):
+        """Test that the approximate top-k mostly matches the exact top-k."""
+        matrix = clustered_rows(2000)
+        index = IVFIndex(matrix)
+
+        found = 0
+        for query in matrix[:50]:
+            rows, scores = index.search(matrix, query, top_k=10)
+            assert list(scores) == sorted(scores, reverse=True)
+            found += len(set(rows) & set(exact_top(matrix, query, 10)))
+
+        assert found / 500 >= 0.9
+
+    def test_returns_top_k_rows_even_when_probed_clusters_are_small(self):
+        """Test that more clusters are scanned when the probed ones hold too few rows."""
+        matrix = clustered_rows(400)
+        index = IVFIndex(matrix, n_lists=40, n_probe=1)
+
+        rows, _ = index.search(matrix, matrix[0], top_k=100)
+
+        assert len(rows) == 100
+        assert len(set(rows)) == 100
+
+    def test_add_and_remove_follow_the_matrix(self):
+        """Test that appended rows are found and deleted rows are never returned."""
+        matrix = clustered_rows(1000)
+        index = IVFIndex(matrix[:800])
+
+        index.add(matrix[800:])
+        rows, scores = index.search(matrix, matrix[900], top_k=1)
+        assert rows[0] == 900
+        assert np.isclose(scores[0], 1.0)
+
+        keep = np.ones(1000, dtype=bool)
+        keep[900] = False
+        index.remove(keep)
+        matrix = matrix[keep]
+        rows, _ = index.search(matrix, matrix[0], top_k=len(matrix))
+        assert len(index) == 999
+        assert sorted(rows) == list(range(999))
+
+    def test_needs_retraining_after_large_growth(self):
+        """Test that the index asks to be retrained once the catalog has doubled."""
+        matrix = clustered_rows(1000)
+        index = IVFIndex(matrix[:400])
+        index.add(matrix[400:800])
+        assert not index.needs_retraining
+
+        index.add(matrix[800:])
+        assert index.needs_retraining
+
+    def test_restore_from_arrays(self):
+        """Test that an index restored from its arrays searches like the trained one."""
+        matrix = clustered_rows(1000)
+        index = IVFIndex(matrix, n_probe=4)
+        restored = IVFIndex.from_arrays(index.centroids, index.assignments, n_probe=4)
+
+        assert len(restored) == len(index)
+        assert not restored.needs_retraining
+        for query in matrix[:10]:
+            rows, scores = restored.search(matrix, query, top_k=5)
+            expected_rows, expected_scores = index.search(matrix, query, top_k=5)
+            np.testing.assert_array_equal(rows, expected_rows)
+            np.testing.assert_array_equal(scores, expected_scores)
@@ -0,0 +1,148 @@
+"""
+Unit tests for the CapabilityCache class.
+"""
+
+import asyncio
+import tempfile
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from mcp.types import InitializeResult, Tool
+
+from mcp_router_use.capability_cache import CapabilityCache
+from mcp_router_use.client import MCPClient
+
+
+def make_initialize_result(version: str = "1.0") -> InitializeResult:
+    return InitializeResult(
+        protocolVersion="2024-11-05",
+        capabilities={},
+        serverInfo={"name": "test-server", "version": version},
+        instructions="Use the tools wisely",
+    )
+
+
+TOOLS = [
+    Tool(
+        name="read_file",
+        description="Read a file",
+        inputSchema={"type": "object", "properties": {"path": {"type": "string"}}},
+    )
+]
+
+
+class TestCapabilityCache:
+    """Tests for CapabilityCache."""
+
+    def test_store_and_load(self):
+        """Test that stored capabilities round-trip."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = CapabilityCache(cache_dir, "http://localhost:3282")
+
+            assert cache.store("server1", "id-1", make_initialize_result(), TOOLS)
+            initialize_result, tools = cache.load("server1", "id-1")
+
+            assert initialize_result == make_initialize_result()
+            assert tools == TOOLS
+
+    def test_load_ignores_other_server_id(self):
+        """Test that an entry for a different server ID is a miss."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = CapabilityCache(cache_dir)
+            cache.store("server1", "id-1", make_initialize_result(), TOOLS)
+
+            assert cache.load("server1", "id-2") is None
+            assert cache.load("server2", "id-1") is None
+
+    def test_store_reports_changes(self):
+        """Test that storing unchanged capabilities reports no change."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = CapabilityCache(cache_dir)
+            cache.store("server1", "id-1", make_initialize_result(), TOOLS)
+
+            assert not cache.store("server1", "id-1", make_initialize_result(), TOOLS)
+            assert cache.store("server1", "id-1", make_initialize_result("2.0"), TOOLS)
+
+    def test_invalidate(self):
+        """Test removing a cached entry."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = CapabilityCache(cache_dir)
+            cache.store("server1", "id-1", make_initialize_result(), TOOLS)
+
+            cache.invalidate("server1")
+
+            assert cache.load("server1", "id-1") is None
+
+
+class TestMCPClientCapabilityCache:
+    """Tests for warm starts from the capability cache."""
+
+    @pytest.mark.asyncio
+    @patch("mcp_router_use.client.create_connector_from_config")
+    async def test_warm_start_uses_cache_and_revalidates(self, mock_create_connector):
+        """Test that a cached server exposes tools at once and refreshes in the background."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            config = {
+                "mcpRouter": {
+                    "router_url": "http://localhost:3282",
+                    "capability_cache_dir": cache_dir,
+                },
+                "mcpServers": {
+                    "server1": {"command": "npx", "args": ["server"], "server_id": "id-1"}
+                },
+            }
+            CapabilityCache(cache_dir, "http://localhost:3282").store(
+                "server1", "id-1", make_initialize_result(), TOOLS
+            )
+
+            server_ready = asyncio.Event()
+
+            async def ensure_connected():
+                await server_ready.wait()
+                return make_initialize_result("2.0")
+
+            connector = MagicMock()
+            connector.ensure_connected = AsyncMock(side_effect=ensure_connected)
+            connector.tools = TOOLS
+            connector.disconnect = AsyncMock()
+            mock_create_connector.return_value = connector
+            client = MCPClient(config=config)
+
+            session = await client.create_session("server1", auto_register=False)
+
+            # Tools come from the cache before any connection is made
+            connector.prime_tools.assert_called_once_with(TOOLS)
+            assert session.tools == TOOLS
+            assert session.session_info == make_initialize_result()
+
+            server_ready.set()
+            await asyncio.gather(*client._background_tasks)
+
+            connector.ensure_connected.assert_called_once()
+            assert session.session_info == make_initialize_result("2.0")
+            initialize_result, _ = client.capability_cache.load("server1", "id-1")
+            assert initialize_result.serverInfo.version == "2.0"
+            await client.aclose()
+
+    @pytest.mark.asyncio
+    @patch("mcp_router_use.client.create_connector_from_config")
+    @patch("mcp_router_use.client.MCPSession")
+    async def test_cold_start_populates_cache(self, mock_session_class, mock_create_connector):
+        """Test that initializing a session writes its capabilities to the cache."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = MCPClient(config={
+                "mcpRouter": {
+                    "router_url": "http://localhost:3282",
+                    "capability_cache_dir": cache_dir,
+                },
+                "mcpServers": {"server1": {"command": "npx", "args": ["server"]}},
+            })
+            mock_session = MagicMock()
+            mock_session.initialize = AsyncMock()
+            mock_session.session_info = make_initialize_result()
+            mock_session.connector.tools = TOOLS
+            mock_session_class.return_value = mock_session
+
+            await client.create_session("server1", auto_register=False)
+
+            assert client.capability_cache.load("server1", None) is not None
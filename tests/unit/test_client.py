@@ -2,14 +2,17 @@
 Unit tests for the MCPClient class with MCP Router.
 """
 
+import asyncio
 import json
 import os
 import tempfile
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from mcp_router_use.client import MCPClient
+from mcp_router_use.connectors.http import HttpConnector
 from mcp_router_use.session import MCPSession
 
 
@@ -275,6 +278,27 @@ class TestMCPClientSessionManagement:
         assert client.sessions["server1"] == mock_session
         assert "server1" in client.active_sessions
 
+    @pytest.mark.asyncio
+    @patch("mcp_router_use.client.create_connector_from_config")
+    @patch("mcp_router_use.client.MCPSession")
+    async def test_create_session_lazy(self, mock_session_class, mock_create_connector):
+        """Test that lazy sessions are not initialized on creation."""
+        config = {
+            "mcpRouter": {"router_url": "http://localhost:3282", "lazy_sessions": True},
+            "mcpServers": {"server1": {"command": "npx", "args": ["@playwright/mcp"]}}
+        }
+        client = MCPClient(config=config)
+
+        mock_session = MagicMock()
+        mock_session.initialize = AsyncMock()
+        mock_session_class.return_value = mock_session
+
+        await client.create_session("server1", auto_register=False)
+
+        mock_session_class.assert_called_once_with(mock_create_connector.return_value, lazy=True)
+        mock_session.initialize.assert_not_called()
+        assert client.sessions["server1"] == mock_session
+
     @pytest.mark.asyncio
     async def test_create_session_no_servers(self):
         """Test creating a session when no servers are configured."""
@@ -481,3 +505,334 @@ class TestMCPClientSessionManagement:
         # Both sessions should be gone after close_all_sessions
         assert len(client.sessions) == 0
         assert len(client.active_sessions) == 0
+
+
+class TestMCPClientCreateAllSessions:
+    """Tests for MCPClient.create_all_sessions."""
+
+    @pytest.mark.asyncio
+    async def test_create_all_sessions_bounded_concurrency(self):
+        """Test that sessions are created concurrently up to the limit."""
+        config = {
+            "mcpRouter": {"router_url": "http://localhost:3282"},
+            "mcpServers": {
+                f"server{i}": {"command": "npx", "args": [str(i)], "server_id": f"server{i}"}
+                for i in range(6)
+            },
+        }
+        client = MCPClient(config=config)
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_create_session(server_name, auto_initialize=True):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock(spec=MCPSession)
+
+        with patch.object(client, "create_session", side_effect=fake_create_session):
+            result = await client.create_all_sessions(max_concurrency=2)
+
+        assert len(result.sessions) == 6
+        assert result.errors == {}
+        assert max_in_flight == 2
+        assert set(result.server_times) == set(result.sessions)
+        assert result.wall_time < result.total_server_time
+
+    @pytest.mark.asyncio
+    async def test_create_all_sessions_partial_failure(self):
+        """Test that failing and slow servers are reported without failing the batch."""
+        config = {
+            "mcpRouter": {"router_url": "http://localhost:3282"},
+            "mcpServers": {
+                "good": {"command": "npx", "args": ["good"], "server_id": "good"},
+                "bad": {"command": "npx", "args": ["bad"], "server_id": "bad"},
+                "slow": {"command": "npx", "args": ["slow"], "server_id": "slow"},
+            },
+        }
+        client = MCPClient(config=config)
+        good_session = MagicMock(spec=MCPSession)
+
+        async def fake_create_session(server_name, auto_initialize=True):
+            if server_name == "bad":
+                raise RuntimeError("router unavailable")
+            if server_name == "slow":
+                await asyncio.sleep(1)
+            return good_session
+
+        with patch.object(client, "create_session", side_effect=fake_create_session):
+            result = await client.create_all_sessions(timeout_per_server=0.05)
+
+        assert result.sessions == {"good": good_session}
+        assert isinstance(result.errors["bad"], RuntimeError)
+        assert isinstance(result.errors["slow"], asyncio.TimeoutError)
+
+    @pytest.mark.asyncio
+    async def test_create_all_sessions_registers_in_bulk(self):
+        """Test that unregistered servers are registered in one bulk call."""
+        config = {
+            "mcpRouter": {"router_url": "http://localhost:3282"},
+            "mcpServers": {
+                "server1": {"command": "npx", "args": ["1"]},
+                "server2": {"command": "npx", "args": ["2"], "server_id": "server2"},
+            },
+        }
+        client = MCPClient(config=config)
+
+        with patch.object(
+            client, "register_servers_with_router", AsyncMock(return_value={})
+        ) as mock_register, patch.object(
+            client, "create_session", AsyncMock(return_value=MagicMock(spec=MCPSession))
+        ):
+            await client.create_all_sessions()
+
+        mock_register.assert_called_once_with(["server1"])
+
+
+class TestMCPClientSingleFlight:
+    """Tests for de-duplication of concurrent create_session calls."""
+
+    @pytest.fixture
+    def client(self):
+        return MCPClient(config={
+            "mcpRouter": {"router_url": "http://localhost:3282"},
+            "mcpServers": {"server1": {"command": "npx", "args": ["@playwright/mcp"]}},
+        })
+
+    @pytest.mark.asyncio
+    @patch("mcp_router_use.client.create_connector_from_config")
+    @patch("mcp_router_use.client.MCPSession")
+    async def test_concurrent_create_session_shares_one_creation(
+        self, mock_session_class, mock_create_connector, client
+    ):
+        """Test that concurrent callers get the same session from one creation."""
+        async def slow_initialize():
+            await asyncio.sleep(0.01)
+
+        mock_session = MagicMock()
+        mock_session.initialize = AsyncMock(side_effect=slow_initialize)
+        mock_session_class.return_value = mock_session
+
+        sessions = await asyncio.gather(
+            *(client.create_session("server1", auto_register=False) for _ in range(5))
+        )
+
+        assert all(session is mock_session for session in sessions)
+        mock_create_connector.assert_called_once()
+        mock_session.initialize.assert_called_once()
+        assert client._pending_sessions == {}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_create_session_shares_failure(self, client):
+        """Test that a failed creation is reported to every caller and not cached."""
+        calls = 0
+
+        async def failing_create(server_name, auto_initialize, auto_register, lazy=None):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("router unavailable")
+
+        with patch.object(client, "_create_session", side_effect=failing_create):
+            results = await asyncio.gather(
+                client.create_session("server1"),
+                client.create_session("server1"),
+                return_exceptions=True,
+            )
+            assert calls == 1
+            assert all(isinstance(r, RuntimeError) for r in results)
+
+            # A later call starts a fresh creation
+            with pytest.raises(RuntimeError):
+                await client.create_session("server1")
+            assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_creation(self, client):
+        """Test that cancelling one caller leaves the creation running for others."""
+        created = MagicMock(spec=MCPSession)
+
+        async def slow_create(server_name, auto_initialize, auto_register, lazy=None):
+            await asyncio.sleep(0.05)
+            return created
+
+        with patch.object(client, "_create_session", side_effect=slow_create):
+            first = asyncio.create_task(client.create_session("server1"))
+            second = asyncio.create_task(client.create_session("server1"))
+            await asyncio.sleep(0.01)
+            first.cancel()
+
+            assert await second is created
+            assert first.cancelled()
+
+
+class TestMCPClientSessionPool:
+    """Tests for pooled sessions configured per server."""
+
+    @pytest.mark.asyncio
+    @patch("mcp_router_use.client.create_connector_from_config")
+    async def test_create_session_with_pool(self, mock_create_connector):
+        """Test that a server with a pool config gets a pooled connector."""
+        from mcp_router_use.connectors.pooled import PooledConnector
+
+        client = MCPClient(config={
+            "mcpRouter": {"router_url": "http://localhost:3282"},
+            "mcpServers": {
+                "server1": {
+                    "command": "npx",
+                    "args": ["@playwright/mcp"],
+                    "pool": {"min_sessions": 1, "max_sessions": 3, "acquire_timeout": 5},
+                }
+            },
+        })
+
+        session = await client.create_session(
+            "server1", auto_initialize=False, auto_register=False
+        )
+
+        assert isinstance(session.connector, PooledConnector)
+        assert session.connector.max_sessions == 3
+        assert session.connector.acquire_timeout == 5
+        mock_create_connector.assert_not_called()
+        assert client.get_pool_stats("server1")["size"] == 0
+        assert client.get_pool_stats("missing") is None
+
+
+class TestMCPClientSessionReaper:
+    """Tests for idle session reaping and the open-session cap."""
+
+    @staticmethod
+    def add_session(client, server_name, last_used):
+        """Register an open session whose connector was last used at the given time."""
+        connector = MagicMock()
+        connector.client = MagicMock()
+        connector.last_used = last_used
+        connector.busy = False
+
+        async def suspend():
+            connector.client = None
+
+        connector.suspend = AsyncMock(side_effect=suspend)
+        connector.disconnect = AsyncMock()
+        session = MCPSession(connector)
+        client.sessions[server_name] = session
+        client.active_sessions.append(server_name)
+        return session
+
+    @pytest.mark.asyncio
+    async def test_reap_idle_sessions(self):
+        """Test that sessions idle beyond the threshold are suspended."""
+        client = MCPClient(config={"mcpRouter": {"session_idle_timeout": 60}})
+        now = time.monotonic()
+        idle = self.add_session(client, "idle", now - 120)
+        busy = self.add_session(client, "busy", now)
+
+        evicted = await client.reap_idle_sessions()
+
+        assert evicted == ["idle"]
+        assert not idle.is_connected
+        assert busy.is_connected
+        # Suspended sessions stay available for transparent reuse
+        assert "idle" in client.sessions
+
+    @pytest.mark.asyncio
+    async def test_max_open_sessions_evicts_least_recently_used(self):
+        """Test that the open-session cap suspends the least recently used sessions."""
+        client = MCPClient(config={"mcpRouter": {"max_open_sessions": 2}})
+        now = time.monotonic()
+        oldest = self.add_session(client, "oldest", now - 30)
+        self.add_session(client, "older", now - 20)
+        self.add_session(client, "newest", now - 10)
+
+        evicted = await client.reap_idle_sessions()
+
+        assert evicted == ["oldest"]
+        assert not oldest.is_connected
+        assert sum(session.is_connected for session in client.sessions.values()) == 2
+
+    @pytest.mark.asyncio
+    async def test_sessions_with_calls_in_flight_are_not_suspended(self):
+        """Test that a long call keeps its session open and counts as use when it ends."""
+        client = MCPClient(config={
+            "mcpRouter": {"session_idle_timeout": 0.05, "max_open_sessions": 1}
+        })
+        connector = HttpConnector(base_url="http://localhost:8000")
+        connector.client = MagicMock()
+        connector._connected = True
+        connector._tools = []
+
+        async def slow_call(name, arguments):
+            await asyncio.sleep(0.2)
+            if connector.client is None:
+                raise RuntimeError("transport closed mid-call")
+            return "done"
+
+        connector.client.call_tool = slow_call
+        session = MCPSession(connector)
+        client.sessions["a"] = session
+        client.active_sessions.append("a")
+        self.add_session(client, "b", time.monotonic())
+
+        call = asyncio.create_task(session.call_tool("tool", {}))
+        await asyncio.sleep(0.1)
+        evicted = await client.reap_idle_sessions()
+
+        assert evicted == ["b"]
+        assert await call == "done"
+        assert time.monotonic() - connector.last_used < 0.05
+        assert await client.reap_idle_sessions() == []
+        await asyncio.sleep(0.06)
+        assert await client.reap_idle_sessions() == ["a"]
+
+    @pytest.mark.asyncio
+    @patch("mcp_router_use.client.create_connector_from_config")
+    async def test_create_session_enforces_cap(self, mock_create_connector):
+        """Test that creating a session over the cap evicts the least recently used one."""
+        client = MCPClient(config={
+            "mcpRouter": {"router_url": "http://localhost:3282", "max_open_sessions": 1},
+            "mcpServers": {"server1": {"command": "npx", "args": ["@playwright/mcp"]}},
+        })
+        old = self.add_session(client, "old", time.monotonic() - 10)
+        mock_create_connector.return_value.disconnect = AsyncMock()
+
+        await client.create_session("server1", auto_initialize=False, auto_register=False)
+
+        assert not old.is_connected
+        assert client._reaper_task is not None
+        await client.aclose()
+        assert client._reaper_task is None
+
+
+class TestMCPClientBatchCalls:
+    """Tests for batched tool calls across servers."""
+
+    @pytest.mark.asyncio
+    async def test_call_tools_spans_servers_and_creates_missing_sessions(self):
+        """Test that calls reuse existing sessions, create missing ones and keep order."""
+        client = MCPClient(config={"mcpServers": {"server1": {}, "server2": {}}})
+        session1 = MagicMock()
+        session1.call_tool = AsyncMock(return_value="one")
+        session2 = MagicMock()
+        session2.call_tool = AsyncMock(return_value="two")
+        client.sessions["server1"] = session1
+
+        async def create_session(server_name):
+            if server_name not in client.config["mcpServers"]:
+                raise ValueError(f"Server '{server_name}' not found in config")
+            client.sessions[server_name] = session2
+            return session2
+
+        with patch.object(client, "create_session", side_effect=create_session) as create:
+            results = await client.call_tools([
+                ("server1", "tool_a", {"x": 1}),
+                ("server2", "tool_b", {}),
+                ("missing", "tool_c", {}),
+            ])
+
+        assert results[:2] == ["one", "two"]
+        assert isinstance(results[2], ValueError)
+        session1.call_tool.assert_called_once_with("tool_a", {"x": 1})
+        assert [call.args[0] for call in create.call_args_list] == ["server2", "missing"]
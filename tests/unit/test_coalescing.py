@@ -0,0 +1,150 @@
+"""
+Unit tests for the ToolCallCoalescer class.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from mcp.types import CallToolResult, TextContent, Tool, ToolAnnotations
+
+from mcp_router_use.client import MCPClient
+from mcp_router_use.coalescing import ToolCallCoalescer
+from mcp_router_use.connectors.http import HttpConnector
+from mcp_router_use.result_cache import ToolResultCache
+
+
+def make_tool(name: str, **annotations) -> Tool:
+    return Tool(
+        name=name,
+        inputSchema={"type": "object"},
+        annotations=ToolAnnotations(**annotations) if annotations else None,
+    )
+
+
+class TestToolCallCoalescer:
+    """Tests for the coalescing policy and shared requests."""
+
+    def test_should_coalesce(self):
+        """Test that only enabled or idempotent tools are coalesced."""
+        coalescer = ToolCallCoalescer(tools={"fetch": True, "fs/read": False})
+
+        assert coalescer.should_coalesce("web", "fetch")
+        assert not coalescer.should_coalesce("fs", "read", make_tool("read", readOnlyHint=True))
+        assert coalescer.should_coalesce("fs", "list", make_tool("list", readOnlyHint=True))
+        assert coalescer.should_coalesce("fs", "mkdir", make_tool("mkdir", idempotentHint=True))
+        assert not coalescer.should_coalesce("fs", "write", make_tool("write"))
+        assert not ToolCallCoalescer(use_annotations=False).should_coalesce(
+            "fs", "list", make_tool("list", readOnlyHint=True)
+        )
+
+    @pytest.mark.asyncio
+    async def test_identical_calls_share_one_request(self):
+        """Test that concurrent callers with the same key get one request's result."""
+        coalescer = ToolCallCoalescer()
+        calls = 0
+
+        async def call():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*(coalescer.run("key", call) for _ in range(5)))
+
+        assert results == ["result"] * 5
+        assert calls == 1
+        assert coalescer.stats() == {"requests": 1, "coalesced": 4, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_failure_is_shared_and_not_kept(self):
+        """Test that a failed request is reported to every caller and then forgotten."""
+        coalescer = ToolCallCoalescer()
+
+        async def call():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("router unavailable")
+
+        results = await asyncio.gather(
+            coalescer.run("key", call), coalescer.run("key", call), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert coalescer._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_caller_keeps_request_for_others(self):
+        """Test that the request is cancelled only when its last caller is cancelled."""
+        coalescer = ToolCallCoalescer()
+        release = asyncio.Event()
+
+        async def call():
+            await release.wait()
+            return "result"
+
+        first = asyncio.create_task(coalescer.run("key", call))
+        second = asyncio.create_task(coalescer.run("key", call))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await second == "result"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+
+class TestConnectorCoalescing:
+    """Tests for coalescing in front of connector tool calls."""
+
+    @pytest.fixture
+    def connector(self):
+        async def call_tool(name, arguments):
+            await asyncio.sleep(0.01)
+            return CallToolResult(content=[TextContent(type="text", text=name)])
+
+        connector = HttpConnector(base_url="http://localhost:8000")
+        connector.client = MagicMock()
+        connector.client.call_tool = AsyncMock(side_effect=call_tool)
+        connector._tools = [make_tool("read", readOnlyHint=True), make_tool("write")]
+        connector.server_name = "fs"
+        connector.call_coalescer = ToolCallCoalescer()
+        return connector
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_coalesce(self, connector):
+        """Test that identical idempotent calls reach the server once."""
+        results = await asyncio.gather(
+            connector.call_tool("read", {"path": "/a", "limit": 1}),
+            connector.call_tool("read", {"limit": 1, "path": "/a"}),
+            connector.call_tool("read", {"path": "/b", "limit": 1}),
+        )
+
+        assert results[0] is results[1]
+        assert connector.client.call_tool.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_non_idempotent_calls_are_not_coalesced(self, connector):
+        """Test that calls to tools that are not opted in each reach the server."""
+        await asyncio.gather(connector.call_tool("write", {}), connector.call_tool("write", {}))
+
+        assert connector.client.call_tool.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_coalesced_result_fills_cache_once(self, connector):
+        """Test that coalescing and the result cache work together."""
+        connector.result_cache = ToolResultCache()
+
+        await asyncio.gather(*(connector.call_tool("read", {}) for _ in range(3)))
+        await connector.call_tool("read", {})
+
+        assert connector.client.call_tool.call_count == 1
+        assert connector.result_cache.hits == 1
+
+    def test_client_config(self):
+        """Test that the coalescer is built from mcpRouter.coalesce_tool_calls."""
+        assert MCPClient(config={}).call_coalescer is None
+        client = MCPClient(
+            config={"mcpRouter": {"coalesce_tool_calls": {"tools": {"fetch": True}}}}
+        )
+        assert client.call_coalescer.should_coalesce("web", "fetch")
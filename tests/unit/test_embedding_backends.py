@@ -0,0 +1,77 @@
+"""
+Unit tests for the embedding backends.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from mcp_router_use.embedding_backends import (
+    FastEmbedBackend,
+    HashingBackend,
+    create_embedding_backend,
+)
+from mcp_router_use.managers.tools.search_tools import ToolSearchEngine
+
+
+def cosine(a: np.ndarray, b: np.ndarray) -> float:
+    return float(a @ b / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+
+class TestHashingBackend:
+    """Tests for the hashed n-gram embedder."""
+
+    def test_embeddings_are_deterministic(self):
+        """Test that embeddings do not depend on the instance or process hash seed."""
+        first = HashingBackend().embed(["read a file", ""])
+        second = HashingBackend().embed(["read a file", ""])
+
+        assert first.shape == (2, 384) and first.dtype == np.float32
+        np.testing.assert_array_equal(first, second)
+        assert not first[1].any()
+
+    def test_shared_fragments_are_similar(self):
+        """Test that texts sharing word fragments are closer than unrelated texts."""
+        files, reading, browser = HashingBackend().embed(
+            ["read_file: read a file", "reading files", "navigate: open a web page"]
+        )
+
+        assert cosine(files, reading) > 0.3
+        assert cosine(files, reading) > cosine(files, browser) + 0.2
+
+
+class TestCreateEmbeddingBackend:
+    """Tests for selecting backends from configuration."""
+
+    def test_names_and_options(self):
+        """Test that backends are created from type names and option dicts."""
+        assert isinstance(create_embedding_backend(None), FastEmbedBackend)
+        assert create_embedding_backend("hashing").name == "hashing-384-3-5"
+        backend = create_embedding_backend(
+            {"type": "hashing", "dimensions": 64, "ngram_range": [2, 4]}
+        )
+        assert backend.name == "hashing-64-2-4"
+        assert create_embedding_backend(backend) is backend
+
+        with pytest.raises(ValueError):
+            create_embedding_backend("word2vec")
+
+    @pytest.mark.asyncio
+    async def test_engine_uses_client_config(self):
+        """Test that the engine's backend comes from the client config and needs no model."""
+        server_manager = MagicMock()
+        server_manager.client.config = {"mcpRouter": {"embedding_backend": "hashing"}}
+        engine = ToolSearchEngine(server_manager=server_manager)
+        await engine.index_tools({
+            "filesystem": [SimpleNamespace(name="read_file", description="Read a file")],
+            "browser": [SimpleNamespace(name="navigate", description="Open a web page")],
+        })
+
+        results = engine.search("files", top_k=2)
+        engine.close()
+
+        assert isinstance(engine.embedding_backend, HashingBackend)
+        assert engine.is_indexed
+        assert results[0][0].name == "read_file"
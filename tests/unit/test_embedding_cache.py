@@ -0,0 +1,126 @@
+"""
+Unit tests for the EmbeddingCache class.
+"""
+
+import os
+import tempfile
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from mcp_router_use import embedding_cache
+from mcp_router_use.embedding_cache import EmbeddingCache
+from mcp_router_use.managers.tools.search_tools import ToolSearchEngine
+
+
+class TestEmbeddingCache:
+    """Tests for storing and loading embeddings."""
+
+    @pytest.fixture
+    def cache_dir(self):
+        with tempfile.TemporaryDirectory() as directory:
+            yield directory
+
+    def test_round_trip_through_memory_map(self, cache_dir):
+        """Test that stored embeddings are read back from a fresh, memory-mapped cache."""
+        EmbeddingCache(cache_dir, "model").put_many(
+            ["a", "b", "a"], np.array([[1, 2], [3, 4], [1, 2]], dtype=np.float32)
+        )
+
+        cache = EmbeddingCache(cache_dir, "model")
+        a, b, c = cache.get_many(["a", "b", "c"])
+
+        np.testing.assert_array_equal(a, [1, 2])
+        np.testing.assert_array_equal(b, [3, 4])
+        assert c is None
+        assert all(isinstance(segment, np.memmap) for segment in cache._segments.values())
+        assert len(cache._rows) == 2
+
+    def test_append_keeps_existing_rows(self, cache_dir):
+        """Test that new embeddings are appended to the stored ones."""
+        cache = EmbeddingCache(cache_dir, "model")
+        cache.put_many(["a"], np.array([[1, 2]], dtype=np.float32))
+        cache.put_many(["b"], np.array([[3, 4]], dtype=np.float32))
+
+        a, b = EmbeddingCache(cache_dir, "model").get_many(["a", "b"])
+
+        np.testing.assert_array_equal(a, [1, 2])
+        np.testing.assert_array_equal(b, [3, 4])
+
+    def test_append_writes_only_new_rows(self, cache_dir):
+        """Test that adding embeddings writes a segment with just the new rows."""
+        cache = EmbeddingCache(cache_dir, "model")
+        cache.put_many(["a", "b"], np.array([[1, 2], [3, 4]], dtype=np.float32))
+        cache.put_many(["a", "c"], np.array([[1, 2], [5, 6]], dtype=np.float32))
+
+        assert sorted(len(segment) for segment in cache._segments.values()) == [1, 2]
+
+    def test_interleaved_writers_keep_keys_and_rows_paired(self, cache_dir):
+        """Test that processes writing at the same time never mix up embeddings."""
+        writer_a = EmbeddingCache(cache_dir, "model")
+        writer_b = EmbeddingCache(cache_dir, "model")
+        writer_a.get_many(["text-a"])
+        writer_b.get_many(["text-b"])
+        writer_b.put_many(["text-b"], np.array([[0, 1]], dtype=np.float32))
+        writer_a.put_many(["text-a"], np.array([[1, 0]], dtype=np.float32))
+
+        a, b = EmbeddingCache(cache_dir, "model").get_many(["text-a", "text-b"])
+
+        np.testing.assert_array_equal(a, [1, 0])
+        np.testing.assert_array_equal(b, [0, 1])
+        assert writer_a.get_many(["text-b"])[0] is not None
+
+    def test_small_segments_are_merged(self, cache_dir, monkeypatch):
+        """Test that segments are merged once there are too many, keeping every embedding."""
+        monkeypatch.setattr(embedding_cache, "_MAX_SEGMENTS", 3)
+        cache = EmbeddingCache(cache_dir, "model")
+        for i in range(8):
+            cache.put_many([str(i)], np.array([[i, i]], dtype=np.float32))
+
+        assert len(os.listdir(cache.directory)) <= 4
+        fresh = EmbeddingCache(cache_dir, "model")
+        for i, embedding in enumerate(fresh.get_many([str(i) for i in range(8)])):
+            np.testing.assert_array_equal(embedding, [i, i])
+
+    def test_models_do_not_share_embeddings(self, cache_dir):
+        """Test that embeddings are keyed by model name."""
+        EmbeddingCache(cache_dir, "model-a").put_many(["a"], np.array([[1, 2]], dtype=np.float32))
+
+        assert EmbeddingCache(cache_dir, "model-b").get_many(["a"]) == [None]
+
+
+class TestToolSearchEngineEmbeddingCache:
+    """Tests for reusing persisted embeddings when indexing tools."""
+
+    @pytest.mark.asyncio
+    async def test_reindex_only_embeds_changed_tools(self):
+        """Test that a new engine only embeds tool texts missing from the cache."""
+        embedded = []
+
+        def embed(texts):
+            embedded.extend(texts)
+            return [np.full(4, len(text), dtype=np.float32) for text in texts]
+
+        def make_engine(cache_dir):
+            engine = ToolSearchEngine(embedding_cache_dir=cache_dir)
+            engine.model = object()
+            engine.embedding_function = embed
+            return engine
+
+        tools = [
+            SimpleNamespace(name="read_file", description="Read a file"),
+            SimpleNamespace(name="write_file", description="Write a file"),
+        ]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            await make_engine(cache_dir).index_tools({"filesystem": tools})
+            assert len(embedded) == 2
+
+            embedded.clear()
+            tools[1] = SimpleNamespace(name="write_file", description="Write or overwrite a file")
+            engine = make_engine(cache_dir)
+            await engine.index_tools({"filesystem": tools})
+
+        assert embedded == ["write_file: write or overwrite a file"]
+        assert engine.is_indexed
+        assert engine.embedding_matrix.shape == (2, 4)
@@ -224,6 +224,34 @@ class TestHttpConnectorOperations(IsolatedAsyncioTestCase):
 
         self.assertEqual(str(context.exception), "MCP client is not connected")
 
+    async def test_suspend_keeps_tools_and_reconnects_on_call(self, _):
+        """Test that a suspended connector reconnects and re-initializes on the next call."""
+        tools = [MagicMock(spec=Tool)]
+        self.connector._tools = tools
+        client = self.connector.client
+        client.call_tool.return_value = {"result": "success"}
+        client.list_tools.return_value = MagicMock(tools=tools)
+        self.connector._cleanup_resources = AsyncMock(
+            side_effect=lambda: setattr(self.connector, "client", None)
+        )
+
+        async def reconnect():
+            self.connector.client = client
+            self.connector._connected = True
+
+        self.connector.connect = AsyncMock(side_effect=reconnect)
+
+        await self.connector.suspend()
+
+        self.assertIsNone(self.connector.client)
+        self.assertEqual(self.connector.tools, tools)
+
+        result = await self.connector.call_tool("test_tool", {})
+
+        self.connector.connect.assert_called_once()
+        client.initialize.assert_called_once()
+        self.assertEqual(result, {"result": "success"})
+
     async def test_initialize(self, _):
         """Test initializing the MCP session."""
         # Setup mock responses
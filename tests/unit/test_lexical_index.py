@@ -0,0 +1,62 @@
+"""
+Unit tests for the lexical tool index.
+"""
+
+from mcp_router_use.lexical_index import BM25Index, tokenize
+
+
+class TestTokenize:
+    """Tests for splitting text into terms."""
+
+    def test_splits_identifiers_and_keeps_compounds(self):
+        """Test that snake_case and camelCase identifiers yield their words and the whole."""
+        assert tokenize("read_file") == ["read", "file", "read_file"]
+        assert tokenize("listDirectory now") == ["list", "directory", "now"]
+
+    def test_strips_punctuation(self):
+        """Test that punctuation around words is not part of any term."""
+        assert tokenize("Open a web page.") == ["open", "a", "web", "page"]
+
+
+class TestBM25Index:
+    """Tests for ranking and updating documents."""
+
+    def make_index(self) -> BM25Index:
+        index = BM25Index()
+        index.add("read_file", tokenize("read_file read_file read a file from disk"))
+        index.add("write_file", tokenize("write_file write_file write a file to disk"))
+        index.add("navigate", tokenize("navigate navigate open a web page"))
+        return index
+
+    def test_rare_terms_rank_highest(self):
+        """Test that documents matching distinctive terms outrank common-term matches."""
+        results = self.make_index().search(tokenize("read file"), top_k=3)
+
+        assert [name for name, _ in results] == ["read_file", "write_file"]
+        assert results[0][1] > results[1][1] > 0
+
+    def test_replace_and_remove(self):
+        """Test that re-adding replaces a document and removal drops its postings."""
+        index = self.make_index()
+        index.add("navigate", tokenize("navigate browse to a url"))
+        index.remove("write_file")
+
+        assert len(index) == 2
+        assert "write_file" not in index
+        assert index.search(tokenize("web"), top_k=5) == []
+        assert index.search(tokenize("write"), top_k=5) == []
+        assert index.search(tokenize("url"), top_k=5)[0][0] == "navigate"
+
+    def test_search_scores_only_allowed_documents(self):
+        """Test that documents rejected by the filter are neither scored nor returned."""
+        index = self.make_index()
+        checked = []
+
+        def allowed(name: str) -> bool:
+            checked.append(name)
+            return name != "read_file"
+
+        results = index.search(tokenize("read file"), top_k=3, allowed=allowed)
+
+        assert [name for name, _ in results] == ["write_file"]
+        assert set(checked) == {"read_file", "write_file"}
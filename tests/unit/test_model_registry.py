@@ -0,0 +1,103 @@
+"""
+Unit tests for the ModelRegistry class.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from mcp_router_use.embedding_backends import HashingBackend
+from mcp_router_use.managers.tools.search_tools import ToolSearchEngine
+from mcp_router_use.model_registry import ModelRegistry
+
+
+class FakeModel:
+    def embed(self, texts):
+        return [np.array([float(len(text)), 1.0]) for text in texts]
+
+
+def counting_loader(loads: list[str], delay: float = 0.0):
+    def load(model_name):
+        loads.append(model_name)
+        time.sleep(delay)
+        return FakeModel()
+
+    return load
+
+
+class TestModelRegistry:
+    """Tests for sharing and reference counting models."""
+
+    def test_concurrent_acquires_load_once(self):
+        """Test that threads acquiring a model at the same time share one load."""
+        loads = []
+        registry = ModelRegistry(loader=counting_loader(loads, delay=0.05))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            models = list(executor.map(lambda _: registry.acquire("model"), range(8)))
+
+        assert loads == ["model"]
+        assert all(model is models[0] for model in models)
+        assert registry.refcount("model") == 8
+
+    def test_last_release_unloads(self):
+        """Test that a model is dropped once every user released it and reloaded afterwards."""
+        loads = []
+        registry = ModelRegistry(loader=counting_loader(loads))
+        first = registry.acquire("model")
+        registry.acquire("model")
+
+        registry.release("model")
+        assert registry.refcount("model") == 1
+        registry.release("model")
+        assert registry.refcount("model") == 0
+
+        assert registry.acquire("model") is not first
+        assert loads == ["model", "model"]
+
+    def test_failed_load_is_not_registered(self):
+        """Test that a loader error propagates and leaves no registered model."""
+
+        def fail(model_name):
+            raise RuntimeError("download failed")
+
+        registry = ModelRegistry(loader=fail)
+
+        with pytest.raises(RuntimeError):
+            registry.acquire("model")
+        assert registry.refcount("model") == 0
+        registry.release("model")  # Releasing an unknown model is a no-op
+
+
+class TestToolSearchEngineModelSharing:
+    """Tests for engines sharing the process-wide model."""
+
+    @pytest.mark.asyncio
+    async def test_engines_share_one_model(self):
+        """Test that several engines load the model once and release it on close."""
+        loads = []
+
+        class CountingBackend(HashingBackend):
+            def load(self):
+                loads.append(self.name)
+
+        registry = ModelRegistry()
+        tools = {"filesystem": [SimpleNamespace(name="read_file", description="Read a file")]}
+
+        engines = [ToolSearchEngine(embedding_backend=CountingBackend()) for _ in range(3)]
+        for engine in engines:
+            engine.model_registry = registry
+            await engine.index_tools(tools)
+
+        name = engines[0].embedding_backend.name
+        assert loads == [name]
+        assert all(engine.is_indexed for engine in engines)
+        assert registry.refcount(name) == 3
+
+        for engine in engines:
+            engine.close()
+        assert registry.refcount(name) == 0
+        assert engines[0].is_indexed
@@ -0,0 +1,116 @@
+"""
+Unit tests for the PooledConnector class.
+"""
+
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from mcp_router_use.connectors.pooled import PooledConnector
+
+
+def make_member(call_delay: float = 0.0) -> MagicMock:
+    """Create a mock connector that records concurrent tool calls."""
+    member = MagicMock()
+    member.client = MagicMock()
+    member.client.initialize = AsyncMock()
+    member.connect = AsyncMock()
+    member.disconnect = AsyncMock()
+    member.initialize = AsyncMock(return_value={"session_id": "test"})
+    member.tools = [MagicMock(name="tool")]
+
+    async def call_tool(name, arguments):
+        await asyncio.sleep(call_delay)
+        return {"member": id(member), "name": name}
+
+    member.call_tool = AsyncMock(side_effect=call_tool)
+    return member
+
+
+class TestPooledConnector(IsolatedAsyncioTestCase):
+    """Tests for PooledConnector."""
+
+    def setUp(self):
+        """Create a pool whose factory records every connector it creates."""
+        self.members = []
+
+        def factory():
+            member = make_member(call_delay=0.02)
+            self.members.append(member)
+            return member
+
+        self.factory = factory
+
+    async def test_connect_opens_min_sessions(self):
+        """Test that connecting opens the minimum number of connections."""
+        pool = PooledConnector(self.factory, min_sessions=2, max_sessions=4)
+
+        await pool.connect()
+        await pool.initialize()
+
+        self.assertEqual(len(self.members), 2)
+        self.assertIs(pool.client, self.members[0].client)
+        self.assertEqual(pool.tools, self.members[0].tools)
+        self.members[1].client.initialize.assert_called_once()
+        self.assertEqual(pool.stats()["idle"], 2)
+
+    async def test_parallel_calls_grow_pool(self):
+        """Test that parallel calls are spread across new connections up to the maximum."""
+        pool = PooledConnector(self.factory, min_sessions=1, max_sessions=3)
+        await pool.connect()
+        await pool.initialize()
+
+        results = await asyncio.gather(*(pool.call_tool("tool", {}) for _ in range(6)))
+
+        self.assertEqual(len(self.members), 3)
+        self.assertEqual(len({result["member"] for result in results}), 3)
+        for member in self.members[1:]:
+            member.client.initialize.assert_called_once()
+        stats = pool.stats()
+        self.assertEqual(stats["size"], 3)
+        self.assertEqual(stats["in_use"], 0)
+        self.assertEqual(stats["waiters"], 0)
+
+    async def test_waiters_reported_when_pool_is_full(self):
+        """Test that callers wait when every connection is busy."""
+        pool = PooledConnector(self.factory, min_sessions=1, max_sessions=1)
+        await pool.connect()
+
+        calls = [asyncio.create_task(pool.call_tool("tool", {})) for _ in range(3)]
+        await asyncio.sleep(0.005)
+
+        stats = pool.stats()
+        self.assertEqual(stats["in_use"], 1)
+        self.assertEqual(stats["waiters"], 2)
+        await asyncio.gather(*calls)
+        self.assertEqual(pool.stats()["waiters"], 0)
+
+    async def test_acquire_timeout(self):
+        """Test that waiting for a connection times out."""
+        pool = PooledConnector(
+            self.factory, min_sessions=1, max_sessions=1, acquire_timeout=0.005
+        )
+        await pool.connect()
+
+        busy = asyncio.create_task(pool.call_tool("tool", {}))
+        await asyncio.sleep(0)
+        with self.assertRaises(TimeoutError):
+            await pool.call_tool("tool", {})
+        await busy
+
+    async def test_disconnect_closes_all_connections(self):
+        """Test that disconnecting closes every pooled connection."""
+        pool = PooledConnector(self.factory, min_sessions=2, max_sessions=2)
+        await pool.connect()
+
+        await pool.disconnect()
+
+        for member in self.members:
+            member.disconnect.assert_called_once()
+        self.assertIsNone(pool.client)
+        self.assertEqual(pool.stats()["size"], 0)
+
+    def test_invalid_pool_size(self):
+        """Test that an invalid pool size is rejected."""
+        with self.assertRaises(ValueError):
+            PooledConnector(self.factory, min_sessions=3, max_sessions=2)
@@ -0,0 +1,52 @@
+"""
+Unit tests for quantized embedding storage.
+"""
+
+import numpy as np
+import pytest
+
+from mcp_router_use.quantization import quantize_rows, score_rows
+
+
+def unit_rows(num_rows: int, dimensions: int = 64) -> np.ndarray:
+    rows = np.random.default_rng(0).standard_normal((num_rows, dimensions)).astype(np.float32)
+    return rows / np.linalg.norm(rows, axis=1, keepdims=True)
+
+
+class TestQuantization:
+    """Tests for storing rows compactly and scoring them."""
+
+    @pytest.mark.parametrize(
+        ("dtype", "itemsize", "tolerance"),
+        [("float32", 4, 1e-6), ("float16", 2, 2e-3), ("int8", 1, 2e-2)],
+    )
+    def test_scores_match_float32(self, dtype, itemsize, tolerance):
+        """Test that quantized rows score close to the original rows."""
+        rows = unit_rows(200)
+        query = rows[0]
+
+        matrix, scales = quantize_rows(rows, dtype)
+
+        assert matrix.dtype.itemsize == itemsize
+        assert (scales is not None) == (dtype == "int8")
+        np.testing.assert_allclose(score_rows(matrix, scales, query), rows @ query, atol=tolerance)
+
+    def test_scoring_is_chunked(self, monkeypatch):
+        """Test that quantized matrices larger than one chunk are scored completely."""
+        monkeypatch.setattr("mcp_router_use.quantization._SCORE_CHUNK_ROWS", 7)
+        rows = unit_rows(50)
+        matrix, scales = quantize_rows(rows, "int8")
+
+        scores = score_rows(matrix, scales, rows[3])
+
+        assert scores.dtype == np.float32
+        assert int(np.argmax(scores)) == 3
+        np.testing.assert_allclose(scores, rows @ rows[3], atol=2e-2)
+
+    def test_zero_rows_and_unknown_dtype(self):
+        """Test that all-zero rows stay zero and unknown dtypes are rejected."""
+        matrix, scales = quantize_rows(np.zeros((2, 4), dtype=np.float32), "int8")
+        assert not matrix.any() and not scales.any()
+
+        with pytest.raises(ValueError):
+            quantize_rows(unit_rows(2), "int4")
@@ -0,0 +1,180 @@
+"""
+Unit tests for the ToolResultCache class.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from mcp.types import CallToolResult, TextContent, Tool, ToolAnnotations
+
+from mcp_router_use.client import MCPClient
+from mcp_router_use.connectors.http import HttpConnector
+from mcp_router_use.result_cache import ToolResultCache
+
+
+def make_tool(name: str, **annotations) -> Tool:
+    return Tool(
+        name=name,
+        inputSchema={"type": "object"},
+        annotations=ToolAnnotations(**annotations) if annotations else None,
+    )
+
+
+def make_result(text: str, is_error: bool = False) -> CallToolResult:
+    return CallToolResult(content=[TextContent(type="text", text=text)], isError=is_error)
+
+
+class TestToolResultCache:
+    """Tests for keys, opt-in, expiry and eviction."""
+
+    def test_key_ignores_argument_order(self):
+        """Test that arguments are hashed in canonical form."""
+        arguments = {"path": "/", "depth": {"a": 1, "b": 2}}
+        key = ToolResultCache.make_key("fs", "list", arguments)
+
+        reordered = {"depth": {"b": 2, "a": 1}, "path": "/"}
+        assert key == ToolResultCache.make_key("fs", "list", reordered)
+        assert key != ToolResultCache.make_key("other", "list", arguments)
+
+    def test_ttl_opt_in(self):
+        """Test that only configured or annotated tools are cached."""
+        cache = ToolResultCache(
+            default_ttl=60, tool_ttls={"fetch": 10, "fs/delete": 0, "fs/list": 5}
+        )
+
+        assert cache.ttl_for("web", "fetch") == 10
+        assert cache.ttl_for("fs", "list", make_tool("list", readOnlyHint=True)) == 5
+        assert cache.ttl_for("fs", "read", make_tool("read", readOnlyHint=True)) == 60
+        assert cache.ttl_for("fs", "touch", make_tool("touch", idempotentHint=True)) is None
+        assert cache.ttl_for("fs", "delete", make_tool("delete", readOnlyHint=True)) is None
+        assert cache.ttl_for("fs", "write", make_tool("write", readOnlyHint=False)) is None
+        assert cache.ttl_for("fs", "write") is None
+
+    def test_annotations_ignored_when_disabled(self):
+        """Test that annotations do not opt tools in when use_annotations is off."""
+        cache = ToolResultCache(use_annotations=False)
+
+        assert cache.ttl_for("fs", "read", make_tool("read", readOnlyHint=True)) is None
+
+    def test_expiry_and_counters(self):
+        """Test that expired entries miss and lookups are counted."""
+        cache = ToolResultCache()
+        with patch("mcp_router_use.result_cache.time.monotonic", return_value=100.0):
+            cache.put("key", "result", ttl=10)
+            assert cache.get("key") == "result"
+        with patch("mcp_router_use.result_cache.time.monotonic", return_value=111.0):
+            assert cache.get("key") is None
+
+        assert cache.stats() == {
+            "entries": 0,
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0,
+            "hit_rate": 0.5,
+        }
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = ToolResultCache(max_entries=2)
+        cache.put("a", 1, ttl=60)
+        cache.put("b", 2, ttl=60)
+        cache.get("a")
+        cache.put("c", 3, ttl=60)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.evictions == 1
+
+    def test_invalidate_server(self):
+        """Test that invalidating a server removes only its results."""
+        cache = ToolResultCache()
+        cache.put("a", 1, ttl=60, server_name="fs")
+        cache.put("b", 2, ttl=60, server_name="web")
+
+        assert cache.invalidate_server("fs") == 1
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+
+class TestConnectorResultCache:
+    """Tests for the result cache in front of connector tool calls."""
+
+    @pytest.fixture
+    def connector(self):
+        connector = HttpConnector(base_url="http://localhost:8000")
+        connector.client = MagicMock()
+        connector.client.call_tool = AsyncMock(side_effect=lambda name, args: make_result(name))
+        connector._tools = [make_tool("read", readOnlyHint=True), make_tool("write")]
+        connector.server_name = "fs"
+        connector.result_cache = ToolResultCache()
+        return connector
+
+    @pytest.mark.asyncio
+    async def test_repeated_read_only_call_is_cached(self, connector):
+        """Test that identical read-only calls reach the server once."""
+        first = await connector.call_tool("read", {"path": "/a", "limit": 1})
+        second = await connector.call_tool("read", {"limit": 1, "path": "/a"})
+        await connector.call_tool("read", {"path": "/b", "limit": 1})
+
+        assert first is second
+        assert connector.client.call_tool.call_count == 2
+        assert connector.result_cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_uncacheable_tool_and_errors_bypass_cache(self, connector):
+        """Test that tools not opted in and error results are not cached."""
+        await connector.call_tool("write", {})
+        await connector.call_tool("write", {})
+        connector.client.call_tool.side_effect = lambda name, args: make_result("boom", True)
+        await connector.call_tool("read", {})
+        await connector.call_tool("read", {})
+
+        assert connector.client.call_tool.call_count == 4
+        assert connector.result_cache.stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_idempotent_write_is_not_cached(self, connector):
+        """Test that repeating an idempotent write after another write reaches the server."""
+        connector._tools = [
+            make_tool("write_file", idempotentHint=True),
+            make_tool("delete_file", destructiveHint=True),
+        ]
+        await connector.call_tool("write_file", {"path": "a", "content": "x"})
+        await connector.call_tool("delete_file", {"path": "a"})
+        await connector.call_tool("write_file", {"path": "a", "content": "x"})
+
+        assert connector.client.call_tool.call_count == 3
+        assert connector.result_cache.hits == 0
+
+    @pytest.mark.asyncio
+    async def test_uncacheable_call_invalidates_server(self, connector):
+        """Test that a read after a write on the same server is not served from the cache."""
+        connector.client.call_tool.side_effect = None
+        connector.client.call_tool.return_value = make_result("old")
+        await connector.call_tool("read", {"path": "a"})
+        connector.client.call_tool.return_value = make_result("new")
+        await connector.call_tool("write", {"path": "a", "content": "new"})
+        result = await connector.call_tool("read", {"path": "a"})
+
+        assert result.content[0].text == "new"
+        assert connector.client.call_tool.call_count == 3
+        assert connector.result_cache.hits == 0
+
+
+class TestClientResultCacheConfig:
+    """Tests for configuring the result cache from MCPClient config."""
+
+    def test_cache_disabled_by_default(self):
+        """Test that no result cache is created unless configured."""
+        assert MCPClient(config={}).tool_result_cache is None
+
+    def test_cache_from_config(self):
+        """Test that the result cache is built from mcpRouter.tool_result_cache."""
+        client = MCPClient(config={
+            "mcpRouter": {"tool_result_cache": {"max_entries": 10, "tool_ttls": {"fetch": 30}}}
+        })
+
+        assert client.tool_result_cache.max_entries == 10
+        assert client.tool_result_cache.ttl_for("web", "fetch") == 30
+        assert MCPClient(config={"mcpRouter": {"tool_result_cache": True}}).tool_result_cache
@@ -2,6 +2,8 @@
 Unit tests for the MCPClient Router-specific functionality.
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -268,3 +270,237 @@ class TestMCPClientRouterFunctions:
         
         # Verify the error message
         assert "No MCP Router URL configured" in str(excinfo.value)
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.post")
+    async def test_register_servers_with_router(self, mock_post, router_client):
+        """Test registering several servers in one request."""
+        router_client.add_server("other-server", {"command": "uvx", "args": ["other"]})
+        router_client.add_server("url-server", {"url": "http://localhost:9000"})
+
+        mock_response = MagicMock()
+        mock_response.status = 201
+        mock_response.json = AsyncMock(
+            return_value={
+                "results": [
+                    {"name": "test-server", "success": True},
+                    {"name": "other-server", "success": False, "message": "failed"},
+                ]
+            }
+        )
+        mock_post.return_value.__aenter__.return_value = mock_response
+
+        server_ids = await router_client.register_servers_with_router()
+
+        # URL-based servers are skipped and both command servers share one request
+        mock_post.assert_called_once()
+        json_data = mock_post.call_args[1]["json"]
+        assert set(json_data) == {"test-server", "other-server"}
+
+        assert server_ids == {"test-server": "test-server", "other-server": None}
+        assert router_client.config["mcpServers"]["test-server"]["server_id"] == "test-server"
+        assert "server_id" not in router_client.config["mcpServers"]["other-server"]
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.post")
+    async def test_register_servers_with_router_chunked(self, mock_post, router_client):
+        """Test that bulk registration is split into chunks."""
+        router_client.registration_batch_size = 2
+        for i in range(3):
+            router_client.add_server(f"server-{i}", {"command": "npx", "args": [str(i)]})
+
+        def make_response(url, headers, json):
+            response = MagicMock()
+            response.status = 200
+            response.json = AsyncMock(
+                return_value={"results": [{"name": name, "success": True} for name in json]}
+            )
+            context = MagicMock()
+            context.__aenter__ = AsyncMock(return_value=response)
+            context.__aexit__ = AsyncMock(return_value=False)
+            return context
+
+        mock_post.side_effect = make_response
+
+        server_ids = await router_client.register_servers_with_router()
+
+        assert mock_post.call_count == 2
+        assert len(server_ids) == 4
+        assert all(server_ids[name] == name for name in server_ids)
+
+    @pytest.mark.asyncio
+    async def test_register_servers_with_router_unknown_server(self, router_client):
+        """Test bulk registration with an unknown server name."""
+        with pytest.raises(ValueError) as excinfo:
+            await router_client.register_servers_with_router(["missing"])
+
+        assert "Server 'missing' not found in config" in str(excinfo.value)
+
+
+class TestMCPClientServerStatusCache:
+    """Tests for the TTL-cached router server status snapshot."""
+
+    @staticmethod
+    def _status_response(servers):
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(return_value=servers)
+        return mock_response
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_status_lookups_share_one_fetch(self, mock_get, router_client):
+        """Test that repeated and concurrent lookups download the list once per TTL."""
+        mock_get.return_value.__aenter__.return_value = self._status_response(
+            [{"id": f"server-{i}", "status": "online"} for i in range(5)]
+        )
+
+        results = await asyncio.gather(
+            *(router_client.get_router_server_status(f"server-{i}") for i in range(5))
+        )
+        again = await router_client.get_router_server_status("server-3")
+
+        mock_get.assert_called_once()
+        assert [r["id"] for r in results] == [f"server-{i}" for i in range(5)]
+        assert again["id"] == "server-3"
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_status_refetched_after_ttl(self, mock_get, router_client):
+        """Test that an expired snapshot is refreshed."""
+        router_client.status_cache_ttl = 0
+        mock_get.return_value.__aenter__.return_value = self._status_response(
+            [{"id": "test-server", "status": "online"}]
+        )
+
+        await router_client.get_router_server_status("test-server")
+        await router_client.get_router_server_status("test-server")
+
+        assert mock_get.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    async def test_status_invalidated_on_register(self, mock_get, mock_post, router_client):
+        """Test that registering a server invalidates the snapshot."""
+        mock_get.return_value.__aenter__.return_value = self._status_response([])
+        mock_response = MagicMock()
+        mock_response.status = 201
+        mock_response.json = AsyncMock(
+            return_value={"results": [{"name": "test-server", "success": True}]}
+        )
+        mock_post.return_value.__aenter__.return_value = mock_response
+
+        await router_client.get_router_servers()
+        assert router_client._server_status_is_fresh()
+
+        await router_client.register_server_with_router("test-server")
+
+        assert not router_client._server_status_is_fresh()
+
+    @pytest.mark.asyncio
+    @patch("mcp_router_use.client.MCPClient.start_server_in_router")
+    @patch("mcp_router_use.client.create_connector_from_config")
+    @patch("mcp_router_use.client.MCPSession")
+    @patch("aiohttp.ClientSession.get")
+    async def test_create_session_uses_cached_status(
+        self, mock_get, mock_session_class, mock_create_connector, mock_start_server
+    ):
+        """Test that creating several sessions downloads the server list once."""
+        client = MCPClient(config={
+            "mcpRouter": {"router_url": "http://localhost:3282"},
+            "mcpServers": {
+                f"server-{i}": {"command": "npx", "args": [str(i)], "server_id": f"server-{i}"}
+                for i in range(3)
+            },
+        })
+        mock_get.return_value.__aenter__.return_value = self._status_response(
+            [{"id": f"server-{i}", "status": "online"} for i in range(3)]
+        )
+        mock_session = MagicMock()
+        mock_session.initialize = AsyncMock()
+        mock_session.disconnect = AsyncMock()
+        mock_session_class.return_value = mock_session
+
+        for i in range(3):
+            await client.create_session(f"server-{i}")
+
+        mock_get.assert_called_once()
+        mock_start_server.assert_not_called()
+        await client.aclose()
+
+
+class TestMCPClientHttpPool:
+    """Tests for the pooled HTTP session used for router calls."""
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_http_session_reused_across_calls(self, mock_get, router_client):
+        """Test that router calls share one pooled HTTP session."""
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(return_value=[])
+        mock_get.return_value.__aenter__.return_value = mock_response
+
+        await router_client.get_router_servers()
+        first_session = router_client._http_session
+        await router_client.get_router_servers()
+
+        assert mock_get.call_count == 2
+        assert first_session is not None
+        assert router_client._http_session is first_session
+        assert first_session.connector.limit == 100
+
+        await router_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_http_session(self, router_client):
+        """Test that aclose closes the pooled HTTP session."""
+        http_session = await router_client._get_http_session()
+
+        await router_client.aclose()
+
+        assert http_session.closed
+        assert router_client._http_session is None
+
+    @pytest.mark.asyncio
+    async def test_close_all_sessions_releases_pool_and_reaper(self, router_client):
+        """Test that close_all_sessions also closes the HTTP session and stops the reaper."""
+        router_client.session_idle_timeout = 60
+        http_session = await router_client._get_http_session()
+        router_client._ensure_reaper()
+        reaper = router_client._reaper_task
+
+        await router_client.close_all_sessions()
+
+        assert http_session.closed
+        assert router_client._http_session is None
+        assert reaper.cancelled()
+        assert router_client._reaper_task is None
+
+    def test_session_of_another_event_loop_is_closed(self, router_client):
+        """Test that replacing the HTTP session of a finished event loop closes it."""
+        first = asyncio.run(router_client._get_http_session())
+        second = asyncio.run(router_client._get_http_session())
+
+        assert first.closed
+        assert second is not first
+        asyncio.run(router_client.aclose())
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager(self):
+        """Test that the client closes its sessions when used as a context manager."""
+        config = {
+            "mcpRouter": {"router_url": "http://localhost:3282", "connection_limit": 5},
+            "mcpServers": {},
+        }
+        async with MCPClient(config=config) as client:
+            mock_session = MagicMock()
+            mock_session.disconnect = AsyncMock()
+            client.sessions["server1"] = mock_session
+            http_session = await client._get_http_session()
+            assert http_session.connector.limit == 5
+
+        mock_session.disconnect.assert_called_once()
+        assert http_session.closed
+        assert client.sessions == {}
@@ -0,0 +1,736 @@
+"""
+Unit tests for the ToolSearchEngine class.
+"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from mcp_router_use.managers.tools import search_tools
+from mcp_router_use.managers.tools.search_tools import SearchToolsTool, ToolSearchEngine
+from mcp_router_use.shared_index import SharedIndexStore
+from mcp_router_use.utils import LRUCache
+
+# Toy embeddings: each tool points along its own axis, scaled to check normalization
+EMBEDDINGS = {
+    "read_file: read a file": [3.0, 0.0, 0.0],
+    "write_file: write a file": [0.0, 2.0, 0.0],
+    "navigate: open a web page": [0.0, 0.0, 5.0],
+}
+
+
+def make_tool(name: str, description: str) -> SimpleNamespace:
+    return SimpleNamespace(name=name, description=description)
+
+
+def make_engine(query_embeddings: dict[str, list[float]] | None = None) -> ToolSearchEngine:
+    """Create an engine whose embedding function looks texts up in fixed tables."""
+    table = {**EMBEDDINGS, **(query_embeddings or {})}
+    engine = ToolSearchEngine()
+    engine.model = object()
+    engine.embedding_function = lambda texts: [np.array(table[text]) for text in texts]
+    return engine
+
+
+SERVER_TOOLS = {
+    "filesystem": [
+        make_tool("read_file", "Read a file"),
+        make_tool("write_file", "Write a file"),
+    ],
+    "browser": [make_tool("navigate", "Open a web page")],
+}
+
+
+class TestToolSearchEngine:
+    """Tests for indexing and similarity search."""
+
+    @pytest.mark.asyncio
+    async def test_index_stores_unit_norm_float32_matrix(self):
+        """Test that the index is one contiguous normalized float32 matrix."""
+        engine = make_engine()
+        await engine.index_tools(SERVER_TOOLS)
+
+        assert engine.is_indexed
+        assert engine.tool_names == ["read_file", "write_file", "navigate"]
+        assert engine.embedding_matrix.dtype == np.float32
+        assert engine.embedding_matrix.flags["C_CONTIGUOUS"]
+        np.testing.assert_allclose(np.linalg.norm(engine.embedding_matrix, axis=1), 1.0)
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_by_cosine_similarity(self):
+        """Test that results are the top_k tools in descending similarity order."""
+        engine = make_engine({"browse": [0.1, 0.5, 2.0]})
+        await engine.index_tools(SERVER_TOOLS)
+
+        # No tool mentions "browse", so the keyword index does not affect the ranking
+        results = engine.search("browse", top_k=2)
+
+        assert [(tool.name, server) for tool, server, _ in results] == [
+            ("navigate", "browser"),
+            ("write_file", "filesystem"),
+        ]
+        query = np.array([0.1, 0.5, 2.0])
+        assert results[0][2] == pytest.approx(2.0 / np.linalg.norm(query), rel=1e-6)
+        assert results[0][2] > results[1][2]
+
+    @pytest.mark.asyncio
+    async def test_top_k_larger_than_catalog(self):
+        """Test that asking for more results than tools returns every tool."""
+        engine = make_engine({"file": [1.0, 1.0, 0.0]})
+        await engine.index_tools(SERVER_TOOLS)
+
+        results = engine.search("file", top_k=10)
+
+        assert len(results) == 3
+        assert results[-1][0].name == "navigate"
+
+
+class TestToolSearchEngineIncremental:
+    """Tests for per-server index updates."""
+
+    @pytest.fixture
+    async def engine(self):
+        engine = make_engine({
+            "web": [0.0, 0.3, 1.0],
+            "file": [1.0, 0.2, 0.0],
+            "shell: run a command": [0.7, 0.7, 0.0],
+            "fetch: download a url": [0.0, 0.1, 1.0],
+        })
+        await engine.index_tools(SERVER_TOOLS)
+        return engine
+
+    @pytest.mark.asyncio
+    async def test_upsert_new_server_only_embeds_its_tools(self, engine):
+        """Test that adding a server embeds only its tools and keeps other rows."""
+        embedded = []
+        embed = engine.embedding_function
+        engine.embedding_function = lambda texts: embedded.extend(texts) or embed(texts)
+
+        await engine.upsert_server("shell", [make_tool("shell", "Run a command")])
+
+        assert embedded == ["shell: run a command"]
+        assert engine.tool_names == ["read_file", "write_file", "navigate", "shell"]
+        assert engine.embedding_matrix.shape == (4, 3)
+        assert engine.search("file", top_k=1)[0][0].name == "read_file"
+
+    @pytest.mark.asyncio
+    async def test_upsert_replaces_server_rows(self, engine):
+        """Test that upserting a server replaces its old tools."""
+        await engine.upsert_server("browser", [make_tool("fetch", "Download a URL")])
+
+        assert "navigate" not in engine.tool_names
+        assert engine.tool_names == ["read_file", "write_file", "fetch"]
+        assert [tool.name for tool, _, _ in engine.search("web", top_k=1)] == ["fetch"]
+
+    @pytest.mark.asyncio
+    async def test_remove_server(self, engine):
+        """Test that removing a server deletes only its rows."""
+        await engine.remove_server("filesystem")
+
+        assert engine.tool_names == ["navigate"]
+        assert engine.embedding_matrix.shape == (1, 3)
+        assert [engine.server_names[i] for i in engine.server_ids] == ["browser"]
+
+    @pytest.mark.asyncio
+    async def test_removing_a_server_restores_tools_it_shadowed(self):
+        """Test that tools shadowed by a removed server's tools are searchable again."""
+        engine = make_engine({"list_dir: list a directory": [0.6, 0.8, 0.0]})
+        await engine.index_tools({
+            "a": [make_tool("read_file", "Read a file"), make_tool("list_dir", "List a directory")],
+            "b": [make_tool("read_file", "Read a file")],
+        })
+        assert engine.search("read_file", top_k=1)[0][1] == "b"
+
+        await engine.sync_servers({"a": engine._indexed_tools["a"]})
+
+        assert sorted(engine.tool_names) == ["list_dir", "read_file"]
+        assert engine.search("read_file", top_k=1)[0][:2] == (engine._indexed_tools["a"][0], "a")
+        assert engine._lexical_tools["read_file"][1] == "a"
+        bounds = engine._partition_bounds()
+        assert {engine.server_names[i]: rows for i, rows in bounds.items()} == {"a": (0, 2)}
+
+    @pytest.mark.asyncio
+    async def test_only_affected_queries_are_invalidated(self, engine):
+        """Test that cached queries survive updates that cannot change their results."""
+        engine.min_cached_depth = 1
+        engine.search("file", top_k=1)
+        engine.search("web", top_k=1)
+
+        # A tool similar to "web" can enter its results but not those of "file"
+        await engine.upsert_server("fetcher", [make_tool("fetch", "Download a URL")])
+        assert [key for key, _ in engine.query_cache.items()] == [("file", None)]
+
+        # Removing a tool in the cached results invalidates them
+        await engine.remove_server("filesystem")
+        assert len(engine.query_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_sync_servers_touches_changed_servers(self, engine):
+        """Test that syncing upserts changed servers and removes missing ones."""
+        server_tools = {"filesystem": SERVER_TOOLS["filesystem"]}
+        embedded = []
+        embed = engine.embedding_function
+        engine.embedding_function = lambda texts: embedded.extend(texts) or embed(texts)
+
+        await engine.sync_servers(server_tools)
+
+        assert embedded == []
+        assert engine.tool_names == ["read_file", "write_file"]
+
+
+class TestToolSearchEngineExecutor:
+    """Tests for running model work off the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_embedding_runs_on_executor_threads(self):
+        """Test that indexing and query embedding do not run on the event loop thread."""
+        threads = set()
+        engine = make_engine({"web": [0.0, 0.0, 1.0]})
+        embed = engine.embedding_function
+
+        def recording_embed(texts):
+            threads.add(threading.current_thread().name)
+            return embed(texts)
+
+        engine.embedding_function = recording_embed
+        await engine.index_tools(SERVER_TOOLS)
+        results = await engine.asearch("web", top_k=1)
+        engine.close()
+
+        assert results[0][0].name == "navigate"
+        assert threads and all(name.startswith("tool-search-embed") for name in threads)
+
+    @pytest.mark.asyncio
+    async def test_searches_use_previous_index_while_reindexing(self):
+        """Test that the old index stays searchable until a rebuild finishes."""
+        engine = make_engine({"web": [0.0, 0.0, 1.0]})
+        await engine.index_tools(SERVER_TOOLS)
+        engine.search("web", top_k=1)
+        embed = engine.embedding_function
+        release = threading.Event()
+        engine.embedding_function = lambda texts: release.wait() and embed(texts)
+
+        reindex = asyncio.create_task(engine.index_tools(SERVER_TOOLS))
+        await asyncio.sleep(0.01)
+        assert engine.is_indexed
+        assert engine.search("web", top_k=1)[0][0].name == "navigate"
+        release.set()
+        await reindex
+        engine.close()
+
+        assert engine.tool_names == ["read_file", "write_file", "navigate"]
+
+
+class TestToolSearchEngineBackgroundIndexing:
+    """Tests for the background index build and readiness."""
+
+    def make_server_manager(self, fetch_delays: dict[str, float]):
+        """Create a server manager stand-in whose tool fetches take the given time."""
+        server_manager = MagicMock()
+        server_manager.client.config = {}
+        server_manager.client.get_server_names.return_value = list(fetch_delays)
+        server_manager._server_tools = {}
+
+        async def prefetch(server_name):
+            await asyncio.sleep(fetch_delays[server_name])
+            server_manager._server_tools[server_name] = SERVER_TOOLS[server_name]
+
+        server_manager._prefetch_tools_for_server = prefetch
+        return server_manager
+
+    def make_engine(self, server_manager) -> ToolSearchEngine:
+        engine = ToolSearchEngine(server_manager=server_manager)
+        engine.model = object()
+        table = {**EMBEDDINGS, "web": [0.0, 0.0, 1.0]}
+        engine.embedding_function = lambda texts: [np.array(table[text]) for text in texts]
+        return engine
+
+    @pytest.mark.asyncio
+    async def test_first_search_waits_for_background_build(self):
+        """Test that a search issued during the build waits for it instead of giving up."""
+        server_manager = self.make_server_manager({"filesystem": 0.01, "browser": 0.05})
+        engine = self.make_engine(server_manager)
+
+        engine.start_background_indexing()
+        assert engine.progress == (0, 2)
+        results = await engine.search_tools("web", top_k=1)
+        await engine.wait_until_ready()
+        engine.close()
+
+        assert engine.progress == (2, 2)
+        assert [(tool.name, server) for tool, server, _ in results] == [("navigate", "browser")]
+
+    @pytest.mark.asyncio
+    async def test_progress_is_reported_per_server(self):
+        """Test that servers count as indexed as soon as their tools are embedded."""
+        server_manager = self.make_server_manager({"filesystem": 0.0, "browser": 0.2})
+        engine = self.make_engine(server_manager)
+
+        engine.start_background_indexing()
+        assert not await engine.wait_until_ready(timeout=0.1)
+        assert engine.progress == (1, 2)
+        assert engine.tool_names == ["read_file", "write_file"]
+
+        assert await engine.wait_until_ready()
+        engine.close()
+        assert engine.progress == (2, 2)
+
+    @pytest.mark.asyncio
+    async def test_workers_share_the_published_index(self, tmp_path):
+        """Test that a finished build is published and later workers search it at once."""
+        config = {"mcpRouter": {"shared_index_dir": str(tmp_path)}}
+        first_manager = self.make_server_manager({"filesystem": 0.0, "browser": 0.0})
+        first_manager.client.config = config
+        first = self.make_engine(first_manager)
+        first.start_background_indexing()
+        await first.wait_until_ready()
+        first.close()
+
+        server_manager = self.make_server_manager({"filesystem": 0.0, "browser": 0.2})
+        server_manager.client.config = config
+        worker = self.make_engine(server_manager)
+        embedded = []
+        embedding_function = worker.embedding_function
+        worker.embedding_function = lambda texts: (
+            embedded.extend(texts) or embedding_function(texts)
+        )
+
+        worker.start_background_indexing()
+        results = await worker.search_tools("web", top_k=1)
+        assert not worker._ready.is_set()
+        assert [(tool.name, server) for tool, server, _ in results] == [("navigate", "browser")]
+
+        await worker.wait_until_ready()
+        worker.close()
+        assert embedded == ["web"]
+        assert worker.tools == [*SERVER_TOOLS["filesystem"], *SERVER_TOOLS["browser"]]
+        assert SharedIndexStore(str(tmp_path)).current_version() == worker.attached_version
+
+    @pytest.mark.asyncio
+    async def test_search_does_not_wait_forever_for_a_hung_server(self):
+        """Test that a search stops waiting after index_wait_timeout and searches loaded tools."""
+        server_manager = self.make_server_manager({"filesystem": 0.0, "browser": 60})
+        server_manager.client.config = {"mcpRouter": {"index_wait_timeout": 0.1}}
+        engine = self.make_engine(server_manager)
+
+        engine.start_background_indexing()
+        results = await asyncio.wait_for(engine.search_tools("read_file", top_k=1), 5)
+        engine.close()
+
+        assert [(tool.name, server) for tool, server, _ in results] == [
+            ("read_file", "filesystem")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_search_tool_reports_unavailable_index(self):
+        """Test that the search tool explains that no tools are loaded yet instead of failing."""
+        server_manager = self.make_server_manager({"browser": 60})
+        server_manager.client.config = {"mcpRouter": {"index_wait_timeout": 0.05}}
+        server_manager.active_server = None
+        engine = self.make_engine(server_manager)
+        server_manager.search_engine = engine
+
+        engine.start_background_indexing()
+        output = await asyncio.wait_for(SearchToolsTool(server_manager)._arun("web"), 5)
+        engine.close()
+
+        assert output.startswith("The tool index is not available")
+
+    @pytest.mark.asyncio
+    async def test_build_restarts_after_close(self):
+        """Test that closing during the build does not leave the engine unable to search."""
+        server_manager = self.make_server_manager({"filesystem": 0.0, "browser": 0.05})
+        engine = self.make_engine(server_manager)
+        cancelled = engine.start_background_indexing()
+        await asyncio.sleep(0)
+        engine.close()
+        assert engine._index_task is None
+
+        assert engine.start_background_indexing() is not cancelled
+        results = await engine.search_tools("web", top_k=1)
+        engine.close()
+
+        assert cancelled.cancelled()
+        assert [(tool.name, server) for tool, server, _ in results] == [("navigate", "browser")]
+
+    @pytest.mark.asyncio
+    async def test_finished_build_without_tools_is_restarted(self):
+        """Test that a build that indexed nothing is started again instead of reused."""
+        engine = self.make_engine(self.make_server_manager({}))
+        first = engine.start_background_indexing()
+        await engine.wait_until_ready()
+
+        assert engine.start_background_indexing() is not first
+        engine.close()
+
+    @pytest.mark.asyncio
+    async def test_start_is_idempotent(self):
+        """Test that starting the build twice reuses the running task."""
+        engine = self.make_engine(self.make_server_manager({"filesystem": 0.0}))
+
+        assert engine.start_background_indexing() is engine.start_background_indexing()
+        await engine.wait_until_ready()
+        engine.close()
+
+
+class TestToolSearchEngineQueryCache:
+    """Tests for the bounded query caches."""
+
+    @pytest.mark.asyncio
+    async def test_normalized_queries_share_entries(self):
+        """Test that case and whitespace variations hit the same cache entry."""
+        engine = make_engine({"web": [0.0, 0.0, 1.0]})
+        await engine.index_tools(SERVER_TOOLS)
+
+        first = engine.search("web", top_k=2)
+        second = engine.search("  WEB ", top_k=2)
+
+        assert first == second
+        assert engine.cache_stats()["results"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_any_top_k_is_sliced_from_one_ranking(self):
+        """Test that different top_k values are served from one cached ranking."""
+        engine = make_engine({"web": [0.0, 0.3, 1.0]})
+        await engine.index_tools(SERVER_TOOLS)
+        calls = []
+        embed = engine.embedding_function
+        engine.embedding_function = lambda texts: calls.append(texts) or embed(texts)
+
+        full = engine.search("web", top_k=3)
+        one = engine.search("web", top_k=1)
+
+        assert one == full[:1]
+        assert len(calls) == 1
+        assert engine.cache_stats()["results"]["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_deeper_search_reuses_query_embedding(self):
+        """Test that a top_k beyond the cached ranking re-ranks without re-embedding."""
+        engine = make_engine({"web": [0.0, 0.3, 1.0]})
+        engine.min_cached_depth = 1
+        await engine.index_tools(SERVER_TOOLS)
+        calls = []
+        embed = engine.embedding_function
+        engine.embedding_function = lambda texts: calls.append(texts) or embed(texts)
+
+        engine.search("web", top_k=1)
+        results = engine.search("web", top_k=3)
+
+        assert len(results) == 3
+        assert len(calls) == 1
+        assert engine.cache_stats()["results"]["misses"] == 2
+        assert engine.cache_stats()["embeddings"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self):
+        """Test that the query cache evicts least recently used queries."""
+        engine = make_engine({"web": [0.0, 0.0, 1.0], "file": [1.0, 0.0, 0.0]})
+        engine.query_cache = LRUCache(max_entries=1)
+        await engine.index_tools(SERVER_TOOLS)
+
+        engine.search("web")
+        engine.search("file")
+
+        assert [key for key, _ in engine.query_cache.items()] == [("file", None)]
+        assert engine.cache_stats()["results"]["evictions"] == 1
+
+
+class TestToolSearchEngineHybrid:
+    """Tests for fusing keyword and semantic rankings."""
+
+    @pytest.mark.asyncio
+    async def test_exact_tool_name_is_ranked_first(self):
+        """Test that naming a tool ranks it first even if its embedding is a weaker match."""
+        engine = make_engine({"write_file": [1.0, 0.1, 0.0]})
+        await engine.index_tools(SERVER_TOOLS)
+
+        results = engine.search("write_file", top_k=2)
+
+        assert results[0][0].name == "write_file"
+        assert 0 < results[1][2] < results[0][2] <= 1
+
+    @pytest.mark.asyncio
+    async def test_keyword_search_without_model(self):
+        """Test that search falls back to keywords when no model can be loaded."""
+        engine = ToolSearchEngine()
+        engine._load_model = lambda: False
+        await engine.index_tools(SERVER_TOOLS)
+
+        results = await engine.asearch("web page", top_k=2)
+        engine.close()
+
+        assert not engine.is_indexed
+        assert [(tool.name, server) for tool, server, _ in results] == [("navigate", "browser")]
+        assert results[0][2] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_searchable_before_embeddings_finish(self):
+        """Test that the keyword index answers while tool embeddings are still running."""
+        engine = make_engine()
+        release = threading.Event()
+        embed = engine.embedding_function
+        engine.embedding_function = lambda texts: release.wait() and embed(texts)
+
+        indexing = asyncio.create_task(engine.upsert_server("browser", SERVER_TOOLS["browser"]))
+        await asyncio.sleep(0.01)
+        results = engine.search("navigate", top_k=1)
+        release.set()
+        await indexing
+        engine.close()
+
+        assert [tool.name for tool, _, _ in results] == ["navigate"]
+
+
+class TestToolSearchEngineApproximate:
+    """Tests for switching to the approximate index on large catalogs."""
+
+    @pytest.mark.asyncio
+    async def test_index_is_built_above_threshold_and_kept_in_step(self):
+        """Test that the approximate index follows upserts and removals of servers."""
+        engine = make_engine({"web": [0.0, 0.3, 1.0], "shell: run a command": [0.7, 0.7, 0.0]})
+        engine.ann_min_tools = 3
+        await engine.upsert_server("filesystem", SERVER_TOOLS["filesystem"])
+        assert engine.ann_index is None
+
+        await engine.upsert_server("browser", SERVER_TOOLS["browser"])
+        assert len(engine.ann_index) == 3
+        assert [tool.name for tool, _, _ in engine.search("web", top_k=2)] == [
+            "navigate",
+            "write_file",
+        ]
+
+        await engine.upsert_server("shell", [make_tool("shell", "Run a command")])
+        assert len(engine.ann_index) == 4
+        await engine.remove_server("shell")
+        assert len(engine.ann_index) == 3
+        await engine.remove_server("browser")
+        assert engine.ann_index is None
+        engine.close()
+
+
+class TestToolSearchEngineQuantized:
+    """Tests for compact embedding storage."""
+
+    @pytest.mark.parametrize("dtype", ["float16", "int8"])
+    @pytest.mark.asyncio
+    async def test_quantized_ranking_matches_float32(self, dtype):
+        """Test that quantized storage ranks like float32 while using less memory."""
+        engine = make_engine({"browse": [0.1, 0.5, 2.0]})
+        await engine.index_tools(SERVER_TOOLS)
+        quantized = make_engine({"browse": [0.1, 0.5, 2.0]})
+        quantized.embedding_dtype = dtype
+        await quantized.upsert_server("filesystem", SERVER_TOOLS["filesystem"])
+        await quantized.upsert_server("browser", SERVER_TOOLS["browser"])
+
+        expected = [(tool.name, server) for tool, server, _ in engine.search("browse", top_k=3)]
+        results = quantized.search("browse", top_k=3)
+
+        assert [(tool.name, server) for tool, server, _ in results] == expected
+        assert results[0][2] == pytest.approx(engine.search("browse", top_k=1)[0][2], abs=0.02)
+        usage = quantized.memory_usage()
+        assert 0 < usage["embeddings"] < engine.memory_usage()["embeddings"]
+
+    def test_unknown_dtype_is_rejected(self):
+        """Test that an unsupported storage type fails at construction."""
+        with pytest.raises(ValueError):
+            ToolSearchEngine(embedding_dtype="int4")
+
+
+class TestToolSearchEngineScoped:
+    """Tests for server-scoped search and active server boosting."""
+
+    @pytest.mark.asyncio
+    async def test_scoped_search_scores_only_selected_partitions(self, monkeypatch):
+        """Test that a scoped search returns and scores only the selected servers' tools."""
+        engine = make_engine({"web": [0.0, 0.3, 1.0], "file": [1.0, 0.2, 0.0]})
+        await engine.index_tools(SERVER_TOOLS)
+        scored = []
+        score_rows = search_tools.score_rows
+        monkeypatch.setattr(
+            search_tools,
+            "score_rows",
+            lambda matrix, *args: scored.append(len(matrix)) or score_rows(matrix, *args),
+        )
+
+        results = engine.search("file", top_k=3, servers=["browser"])
+
+        assert [(tool.name, server) for tool, server, _ in results] == [("navigate", "browser")]
+        assert scored == [1]
+        assert engine.search("file", top_k=3, servers=["unknown"]) == []
+
+    @pytest.mark.asyncio
+    async def test_partitions_stay_contiguous(self):
+        """Test that each server's rows stay one range through upserts, shadowing and removal."""
+        engine = make_engine({"shell: run a command": [0.7, 0.7, 0.0]})
+        await engine.index_tools({
+            **SERVER_TOOLS,
+            "shadow": [make_tool("write_file", "Write a file")],
+        })
+        assert engine.tool_names == ["read_file", "navigate", "write_file"]
+
+        await engine.upsert_server("filesystem", [make_tool("shell", "Run a command")])
+        await engine.remove_server("browser")
+
+        bounds = engine._partition_bounds()
+        assert {engine.server_names[i]: rows for i, rows in bounds.items()} == {
+            "shadow": (0, 1),
+            "filesystem": (1, 2),
+        }
+
+    @pytest.mark.asyncio
+    async def test_boost_ranks_active_server_higher(self):
+        """Test that the active server's tools move up without changing other scores."""
+        engine = make_engine({"browse": [0.0, 0.8, 1.0]})
+        engine.active_server_boost = 0.5
+        await engine.index_tools(SERVER_TOOLS)
+
+        plain = engine.search("browse", top_k=2)
+        boosted = engine.search("browse", top_k=2, boost_server="filesystem")
+
+        assert [tool.name for tool, _, _ in plain] == ["navigate", "write_file"]
+        assert [tool.name for tool, _, _ in boosted] == ["write_file", "navigate"]
+        assert boosted[0][2] == pytest.approx(plain[1][2] + 0.5 * (1 - plain[1][2]))
+        assert boosted[1][2] == plain[0][2]
+
+    @pytest.mark.asyncio
+    async def test_search_tools_connected_only(self):
+        """Test that connected_only limits the search to servers with open sessions."""
+        server_manager = MagicMock()
+        server_manager.client.config = {}
+        server_manager.client.active_sessions = ["browser"]
+        server_manager._server_tools = SERVER_TOOLS
+        engine = ToolSearchEngine(server_manager=server_manager)
+        engine.model = object()
+        engine.embedding_function = make_engine({"file": [1.0, 0.0, 0.0]}).embedding_function
+
+        results = await engine.search_tools("file", top_k=3, connected_only=True)
+        assert [server for _, server, _ in results] == ["browser"]
+
+        server_manager.client.active_sessions = []
+        message = await engine.search_tools("file", connected_only=True)
+        assert message.startswith("No servers match")
+        engine.close()
+
+    @pytest.mark.asyncio
+    async def test_search_tool_returns_engine_messages(self):
+        """Test that the search tool passes on the engine's explanation instead of results."""
+        server_manager = MagicMock()
+        server_manager.client.config = {}
+        server_manager.client.active_sessions = []
+        server_manager.active_server = None
+        server_manager._server_tools = SERVER_TOOLS
+        engine = ToolSearchEngine(server_manager=server_manager)
+        engine.model = object()
+        engine.embedding_function = make_engine().embedding_function
+        server_manager.search_engine = engine
+
+        output = await SearchToolsTool(server_manager)._arun("file", connected_only=True)
+
+        assert output.startswith("No servers match")
+        engine.close()
+
+
+class TestToolSearchEngineSharedIndex:
+    """Tests for publishing the index and attaching to it from other processes."""
+
+    def make_engine(self, tmp_path, **kwargs) -> ToolSearchEngine:
+        engine = ToolSearchEngine(shared_index_dir=str(tmp_path), **kwargs)
+        engine.model = object()
+        embedding_function = make_engine({
+            "file": [1.0, 0.2, 0.0],
+            "shell: run a command": [0.7, 0.7, 0.0],
+        }).embedding_function
+        engine.embedded = []
+        engine.embedding_function = lambda texts: (
+            engine.embedded.extend(texts) or embedding_function(texts)
+        )
+        return engine
+
+    @pytest.mark.asyncio
+    async def test_attached_engine_searches_without_embedding_tools(self, tmp_path):
+        """Test that an attached engine ranks like the publisher from the read-only mapping."""
+        publisher = self.make_engine(tmp_path, embedding_dtype="int8")
+        await publisher.index_tools(SERVER_TOOLS)
+        version = await publisher.publish_index()
+
+        worker = self.make_engine(tmp_path, embedding_dtype="int8")
+        threads = []
+        load_shared_index = worker._load_shared_index
+        worker._load_shared_index = lambda: (
+            threads.append(threading.current_thread().name) or load_shared_index()
+        )
+        assert await worker.attach_index()
+        assert threads[0].startswith("tool-search-embed")
+
+        assert worker.attached_version == version
+        assert not worker.embedding_matrix.flags.writeable
+        expected = [(t.name, s, score) for t, s, score in publisher.search("file", top_k=3)]
+        results = worker.search("file", top_k=3)
+        assert [(t.name, s, score) for t, s, score in results] == expected
+        assert results[0][0].description == "Read a file"
+        assert worker.embedded == ["file"]
+        publisher.close()
+        worker.close()
+
+    @pytest.mark.asyncio
+    async def test_fetched_tools_replace_records_and_changes_stay_private(self, tmp_path):
+        """Test that unchanged tools are adopted as-is and only changed servers are embedded."""
+        publisher = self.make_engine(tmp_path)
+        await publisher.index_tools(SERVER_TOOLS)
+        await publisher.publish_index()
+        worker = self.make_engine(tmp_path)
+        await worker.attach_index()
+        shared_matrix = worker.embedding_matrix
+
+        filesystem = [
+            make_tool("read_file", "Read a file"),
+            make_tool("write_file", "Write a file"),
+        ]
+        browser = [make_tool("navigate", "Open a web page"), make_tool("shell", "Run a command")]
+        await worker.sync_servers({"filesystem": filesystem, "browser": browser})
+
+        assert worker.embedded == ["navigate: open a web page", "shell: run a command"]
+        assert worker.tools[:2] == filesystem
+        assert worker._tool_names_of("browser") == {"navigate", "shell"}
+        assert len(shared_matrix) == 3
+        assert len(SharedIndexStore(str(tmp_path)).attach().matrix) == 3
+        publisher.close()
+        worker.close()
+
+    @pytest.mark.asyncio
+    async def test_approximate_index_is_shared(self, tmp_path):
+        """Test that the approximate index is attached instead of trained again."""
+        publisher = self.make_engine(tmp_path, ann_min_tools=3)
+        await publisher.index_tools(SERVER_TOOLS)
+        await publisher.publish_index()
+
+        worker = self.make_engine(tmp_path, ann_min_tools=3)
+        await worker.attach_index()
+
+        np.testing.assert_array_equal(worker.ann_index.centroids, publisher.ann_index.centroids)
+        assert [t.name for t, _, _ in worker.search("file", top_k=2)] == [
+            t.name for t, _, _ in publisher.search("file", top_k=2)
+        ]
+        publisher.close()
+        worker.close()
+
+    @pytest.mark.asyncio
+    async def test_incompatible_index_is_not_attached(self, tmp_path, monkeypatch):
+        """Test that an index with other embeddings is ignored with a warning."""
+        publisher = self.make_engine(tmp_path)
+        await publisher.index_tools(SERVER_TOOLS)
+        await publisher.publish_index()
+        monkeypatch.setattr(search_tools, "logger", MagicMock())
+
+        for options in ({"embedding_dtype": "float16"}, {"embedding_backend": "hashing"}):
+            engine = self.make_engine(tmp_path, **options)
+            assert not await engine.attach_index()
+            engine.close()
+        assert search_tools.logger.warning.call_count == 2
+        assert not await ToolSearchEngine().attach_index()
+        publisher.close()
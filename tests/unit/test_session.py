@@ -2,6 +2,7 @@
 Unit tests for the MCPSession class.
 """
 
+import asyncio
 import unittest
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
@@ -172,3 +173,109 @@ class TestMCPSessionOperations(IsolatedAsyncioTestCase):
 
         # Verify connect was not called since auto_connect is False
         self.connector.connect.assert_not_called()
+
+
+class TestMCPSessionLazy(IsolatedAsyncioTestCase):
+    """Tests for lazy MCPSession connection."""
+
+    def setUp(self):
+        """Set up a lazy session over a connector whose connect is slow."""
+        from mcp_router_use.connectors.http import HttpConnector
+
+        self.connector = HttpConnector(base_url="http://localhost:8000")
+        self.client = MagicMock()
+        self.client.initialize = AsyncMock(return_value={"session_id": "lazy"})
+        self.client.list_tools = AsyncMock(return_value=MagicMock(tools=[{"name": "test_tool"}]))
+        self.client.call_tool = AsyncMock(return_value={"result": "success"})
+
+        async def connect():
+            await asyncio.sleep(0.01)
+            self.connector.client = self.client
+            self.connector._connected = True
+
+        self.connector.connect = AsyncMock(side_effect=connect)
+        self.session = MCPSession(self.connector, lazy=True)
+
+    async def test_lazy_session_does_not_connect_until_used(self):
+        """Test that creating a lazy session opens no connection."""
+        self.connector.connect.assert_not_called()
+        self.assertFalse(self.session.is_connected)
+
+        result = await self.session.call_tool("test_tool", {})
+
+        self.assertEqual(result, {"result": "success"})
+        self.connector.connect.assert_called_once()
+        self.client.initialize.assert_called_once()
+        self.assertEqual(self.session.session_info, {"session_id": "lazy"})
+        self.assertEqual(self.session.tools, [{"name": "test_tool"}])
+
+    async def test_concurrent_first_calls_share_one_connect(self):
+        """Test that concurrent first callers share a single connect and initialize."""
+        await asyncio.gather(
+            self.session.call_tool("test_tool", {}),
+            self.session.call_tool("test_tool", {}),
+            self.session.discover_tools(),
+            self.connector.call_tool("test_tool", {}),
+        )
+
+        self.connector.connect.assert_called_once()
+        self.client.initialize.assert_called_once()
+        self.assertEqual(self.client.call_tool.call_count, 3)
+
+    async def test_discover_tools_connects_lazy_session(self):
+        """Test that discovering tools connects a lazy session."""
+        tools = await self.session.discover_tools()
+
+        self.assertEqual(tools, [{"name": "test_tool"}])
+        self.connector.connect.assert_called_once()
+
+
+class TestMCPSessionBatchCalls(IsolatedAsyncioTestCase):
+    """Tests for batched MCPSession tool calls."""
+
+    def setUp(self):
+        """Set up a connected session whose tool calls are slow."""
+        self.connector = MagicMock()
+        self.connector.client = MagicMock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        async def call_tool(name, arguments):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(arguments.get("delay", 0.01))
+            self.in_flight -= 1
+            if name == "broken":
+                raise RuntimeError("tool failed")
+            return {"tool": name}
+
+        self.connector.call_tool = AsyncMock(side_effect=call_tool)
+        self.session = MCPSession(self.connector)
+
+    async def test_call_tools_preserves_order_and_captures_errors(self):
+        """Test that results come back in input order with exceptions in place."""
+        results = await self.session.call_tools(
+            [("slow", {"delay": 0.03}), ("broken", {}), ("fast", {"delay": 0})]
+        )
+
+        self.assertEqual(results[0], {"tool": "slow"})
+        self.assertIsInstance(results[1], RuntimeError)
+        self.assertEqual(results[2], {"tool": "fast"})
+
+    async def test_call_tools_limits_concurrency(self):
+        """Test that no more than max_concurrency calls run at once."""
+        await self.session.call_tools([("tool", {})] * 6, max_concurrency=2)
+
+        self.assertEqual(self.connector.call_tool.call_count, 6)
+        self.assertEqual(self.max_in_flight, 2)
+
+    async def test_iter_call_tools_yields_in_completion_order(self):
+        """Test that streamed results arrive as each call completes."""
+        indices = [
+            index
+            async for index, _ in self.session.iter_call_tools(
+                [("slow", {"delay": 0.03}), ("fast", {"delay": 0})]
+            )
+        ]
+
+        self.assertEqual(indices, [1, 0])
@@ -0,0 +1,96 @@
+"""
+Unit tests for the SharedIndexStore class.
+"""
+
+import json
+import os
+
+import numpy as np
+
+from mcp_router_use.shared_index import SharedIndex, SharedIndexStore, StringTable
+
+
+def make_index(rows: int = 3) -> SharedIndex:
+    names = [f"tool_{i}" for i in range(rows)]
+    return SharedIndex(
+        version=0,
+        backend="hashing-384-3-5",
+        dtype="int8",
+        matrix=np.arange(rows * 4, dtype=np.int8).reshape(rows, 4),
+        scales=np.full(rows, 0.5, dtype=np.float32),
+        server_ids=np.zeros(rows, dtype=np.int32),
+        server_names=["filesystem"],
+        names=StringTable.from_strings(names),
+        descriptions=StringTable.from_strings(["Läs en fil", "", "Write a file"][:rows]),
+        text_hashes=np.arange(rows, dtype=np.uint32),
+        ann_centroids=None,
+        ann_assignments=None,
+    )
+
+
+class TestStringTable:
+    """Tests for strings stored as one blob."""
+
+    def test_round_trip(self):
+        """Test that strings, including empty and non-ASCII ones, are read back unchanged."""
+        strings = ["read_file", "", "Läs en fil"]
+        table = StringTable.from_strings(strings)
+
+        assert len(table) == 3
+        assert [table[i] for i in range(len(table))] == strings
+
+
+class TestSharedIndexStore:
+    """Tests for publishing and attaching indexes."""
+
+    def test_attach_without_published_index(self, tmp_path):
+        """Test that attaching to an empty directory finds nothing."""
+        store = SharedIndexStore(str(tmp_path))
+        assert store.current_version() is None
+        assert store.attach() is None
+
+    def test_publish_and_attach_read_only(self, tmp_path):
+        """Test that an attached index matches the published one and is memory-mapped read-only."""
+        store = SharedIndexStore(str(tmp_path))
+        version = store.publish(make_index())
+
+        index = SharedIndexStore(str(tmp_path)).attach()
+
+        assert index.version == version == store.current_version()
+        assert (index.backend, index.dtype, index.server_names) == (
+            "hashing-384-3-5",
+            "int8",
+            ["filesystem"],
+        )
+        np.testing.assert_array_equal(index.matrix, make_index().matrix)
+        np.testing.assert_array_equal(index.scales, make_index().scales)
+        assert isinstance(index.matrix, np.memmap)
+        assert not index.matrix.flags.writeable
+        assert index.names[2] == "tool_2"
+        assert index.descriptions[0] == "Läs en fil"
+        assert index.ann_centroids is None
+
+    def test_publish_keeps_mapped_versions_readable(self, tmp_path):
+        """Test that republishing switches new attaches over and prunes old versions."""
+        store = SharedIndexStore(str(tmp_path))
+        first = store.publish(make_index())
+        attached = store.attach()
+        second = store.publish(make_index(rows=2))
+        third = store.publish(make_index(rows=1))
+
+        assert first < second < third
+        assert len(store.attach().matrix) == 1
+        assert len(attached.matrix) == 3
+        assert sorted(name for name in os.listdir(tmp_path) if name.startswith("v")) == [
+            f"v{second}",
+            f"v{third}",
+        ]
+
+    def test_unsupported_format_is_ignored(self, tmp_path):
+        """Test that an index written in another format version is not attached."""
+        store = SharedIndexStore(str(tmp_path))
+        version = store.publish(make_index())
+        with open(tmp_path / "index.json", "w") as f:
+            json.dump({"format": 99, "version": version}, f)
+
+        assert store.attach() is None
@@ -0,0 +1,33 @@
+"""
+Unit tests for the shared helpers.
+"""
+
+from unittest.mock import patch
+
+from mcp_router_use.utils import LRUCache
+
+
+class TestLRUCache:
+    """Tests for the bounded LRU cache."""
+
+    def test_entries_expire_after_ttl(self):
+        """Test that entries older than the TTL are misses and are dropped."""
+        cache = LRUCache(ttl=10)
+        with patch("mcp_router_use.utils.time.monotonic", return_value=100.0):
+            cache.put("key", "value")
+        with patch("mcp_router_use.utils.time.monotonic", return_value=105.0):
+            assert cache.get("key") == "value"
+        with patch("mcp_router_use.utils.time.monotonic", return_value=110.0):
+            assert cache.get("key") is None
+
+        assert "key" not in cache
+        assert cache.stats()["hit_rate"] == 0.5
+
+    def test_unusable_entries_count_as_misses(self):
+        """Test that entries rejected by the usable check are misses but are kept."""
+        cache = LRUCache()
+        cache.put("key", 3)
+
+        assert cache.get("key", usable=lambda value: value > 5) is None
+        assert cache.get("key", usable=lambda value: value < 5) == 3
+        assert (cache.hits, cache.misses) == (1, 1)